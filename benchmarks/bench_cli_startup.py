@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Startup time benchmark of tsp_cli_client.
+
+Runs the CLI under python -X importtime, without a server, and reports the
+time spent importing modules, beyond what the bare interpreter imports, and
+the wall-clock time of each invocation.
+Fails if the import time exceeds its threshold, or if --help loads a module
+that only the commands talking to the server need.
+
+Usage: python benchmarks/bench_cli_startup.py [--repeat N] [--max-help-ms MS] [--max-command-ms MS]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, 'tsp_cli_client')
+
+# Modules that --help must not load
+HEAVY_MODULES = ('requests', 'tsp.tsp_client', 'tree_model', 'numpy', 'sqlite3', 'argcomplete')
+
+
+def closed_port():
+    '''
+    Get a local port that nothing listens on, so that commands fail fast
+    '''
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run(arguments, skipped=frozenset()):
+    '''
+    Run python once
+    :param arguments: Python arguments, after -X importtime
+    :param skipped: Names of the modules whose import time is not counted
+    :returns: Tuple of the import time and wall-clock time, in seconds, and
+              of the names of the imported modules
+    '''
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + arguments,
+                            cwd=ROOT, capture_output=True, text=True, check=False)
+    wall = time.perf_counter() - start
+    imported = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, _, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        modules.add(name)
+        if name not in skipped:
+            imported += int(own)
+    return imported / 1e6, wall, modules
+
+
+def main():
+    '''
+    Run the benchmark
+    '''
+    parser = argparse.ArgumentParser(description='Measure the startup time of tsp_cli_client')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of measurements, the best is kept')
+    parser.add_argument('--max-help-ms', type=float, default=20,
+                        help='Maximum import time of --help, in milliseconds')
+    parser.add_argument('--max-command-ms', type=float, default=150,
+                        help='Maximum import time of a server command, in milliseconds')
+    options = parser.parse_args()
+
+    # Imported by the interpreter itself, site and .pth files included
+    runs = [run(['-c', 'pass']) for _ in range(options.repeat)]
+    baseline = min(imported for imported, _, _ in runs)
+    interpreter = frozenset(runs[0][2])
+    print(f'interpreter    imports {baseline * 1000:>7.1f} ms, not counted below')
+
+    failed = False
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scenarios = (
+            ('--help', [CLI, '--help'], options.max_help_ms),
+            ('--get-health', [CLI, '--ip', '127.0.0.1', '--port', str(closed_port()),
+                              '--cache-dir', cache_dir, '--get-health'], options.max_command_ms))
+        for name, arguments, threshold in scenarios:
+            runs = [run(arguments, interpreter) for _ in range(options.repeat)]
+            imported = min(imported for imported, _, _ in runs)
+            wall = min(wall for _, wall, _ in runs)
+            print(f'{name:<14} imports {imported * 1000:>7.1f} ms, '
+                  f'wall-clock {wall * 1000:>7.1f} ms (threshold {threshold:.0f} ms)')
+            if imported * 1000 > threshold:
+                print(f'{name}: import time above {threshold:.0f} ms', file=sys.stderr)
+                failed = True
+            if name == '--help':
+                loaded = sorted(set(HEAVY_MODULES) & (runs[0][2] - interpreter))
+                if loaded:
+                    print(f'{name}: loads {", ".join(loaded)}', file=sys.stderr)
+                    failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark of the JSON codecs on representative TSP payloads.
+
+Compares, for each installed codec, decoding a response body from bytes and
+encoding it back, as done for the responses and requests of TspClient.
+
+Usage: python benchmarks/bench_json_codecs.py [--size N] [--repeat N]
+"""
+
+import argparse
+import functools
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from bench_parsers import payload
+from tsp import json_codec
+from tsp.model_type import ModelType
+
+PAYLOADS = (ModelType.TIME_GRAPH_STATE, ModelType.TIME_GRAPH_TREE,
+            ModelType.XY, ModelType.VIRTUAL_TABLE)
+
+
+def main():
+    '''
+    Run the benchmark
+    '''
+    parser = argparse.ArgumentParser(description='Compare the JSON codecs')
+    parser.add_argument('--size', type=int, default=10000, help='Number of objects per payload')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of measurements, the best is kept')
+    options = parser.parse_args()
+
+    codecs = json_codec.available_codecs()
+    print(f'Installed codecs: {", ".join(codec.name for codec in codecs)}, '
+          f'selected: {json_codec.codec().name}')
+    for model_type in PAYLOADS:
+        content = json_codec.StdlibCodec.dumps(payload(model_type, options.size))
+        print(f'{model_type.name} ({len(content) / 1024:.0f} KiB)')
+        for codec in codecs:
+            decode = min(timeit.repeat(functools.partial(codec.loads, content),
+                                       number=1, repeat=options.repeat))
+            decoded = codec.loads(content)
+            encode = min(timeit.repeat(functools.partial(codec.dumps, decoded),
+                                       number=1, repeat=options.repeat))
+            print(f'  {codec.name:<8} loads {decode * 1000:>8.2f} ms   '
+                  f'dumps {encode * 1000:>8.2f} ms')
+
+
+if __name__ == "__main__":
+    main()
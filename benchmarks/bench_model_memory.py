@@ -0,0 +1,150 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Memory benchmark of the time graph state and virtual table line models.
+
+Reports the bytes allocated per object by the compact __slots__ models, and
+by copies of the models as they used to be, keeping a per-instance __dict__.
+
+Usage: python benchmarks/bench_model_memory.py [--count N]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+# Imported up front so that the columnar model does not measure its import
+import numpy  # pylint: disable=unused-import
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from tsp.time_graph_model import TimeGraphState, ColumnarTimeGraphModel
+from tsp.virtual_table_model import VirtualTableLine
+from tsp.virtual_table_tag import VirtualTableTag
+
+
+def state_params(count):
+    '''
+    Decoded JSON of time graph states
+    '''
+    return [{"start": index * 10, "end": index * 10 + 9, "label": "running",
+             "values": index % 5, "style": {"parentKey": "running"}}
+            for index in range(count)]
+
+
+def line_params(count):
+    '''
+    Decoded JSON of virtual table lines of 4 cells
+    '''
+    return [{"index": index, "tags": 0,
+             "cells": [{"content": "cell"}, {"content": "cell"},
+                       {"content": "cell"}, {"content": "cell"}]}
+            for index in range(count)]
+
+
+def measure(build, params):
+    '''
+    Bytes allocated per built object, excluding the decoded JSON
+    '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build(params)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / len(params)
+
+
+# pylint: disable=too-few-public-methods
+class DictTimeGraphState:
+    '''
+    Time graph state as it was before __slots__: only the attributes of the
+    keys present are set, in a per-instance __dict__
+    '''
+
+    def __init__(self, params):
+        if "start" in params:
+            self.start_time = params.get("start")
+        if "end" in params:
+            self.end_time = params.get("end")
+        if "label" in params:
+            self.label = params.get("label")
+        if "values" in params:
+            self.value = params.get("values")
+        if "tags" in params:
+            self.tags = params.get("tags")
+        if "style" in params:
+            self.style = params.get("style")
+
+
+class DictVirtualTableLineCell:
+    '''
+    Virtual table line cell as it was before __slots__
+    '''
+
+    def __init__(self, params):
+        self.content = params.get("content")
+        self.tags = VirtualTableTag.NO_TAGS
+
+
+class DictVirtualTableLine:
+    '''
+    Virtual table line as it was before __slots__, with cells of the same kind
+    '''
+
+    def __init__(self, params):
+        self.index = params.get("index", -1)
+        self.cells = [DictVirtualTableLineCell(cell) for cell in params.get("cells", [])]
+        self.tags = VirtualTableTag.NO_TAGS
+
+
+def main():
+    '''
+    Run the benchmark
+    '''
+    parser = argparse.ArgumentParser(description='Measure the memory used by the models')
+    parser.add_argument('--count', type=int, default=100000, help='Number of objects to build')
+    options = parser.parse_args()
+
+    results = [
+        ('state, __dict__', measure(lambda params: [DictTimeGraphState(p) for p in params],
+                                    state_params(options.count))),
+        ('state, __slots__', measure(lambda params: [TimeGraphState(p) for p in params],
+                                     state_params(options.count))),
+        ('state, columnar', measure(lambda params: ColumnarTimeGraphModel(
+            {"rows": [{"entryId": 0, "states": params}]}), state_params(options.count)))
+    ]
+
+    results.append(('line, __dict__', measure(
+        lambda params: [DictVirtualTableLine(p) for p in params], line_params(options.count))))
+    results.append(('line, __slots__', measure(lambda params: [VirtualTableLine(p) for p in params],
+                                               line_params(options.count))))
+
+    for name, size in results:
+        print(f'{name:<20} {size:>8.1f} bytes per object')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Parser benchmark of GenericResponse, for each ModelType.
+
+Builds the models of synthetic decoded responses repeatedly, reusing the same
+decoded JSON since the model decoders leave it untouched. The time to only
+check the status, as when polling, is reported too since models are lazy.
+
+Usage: python benchmarks/bench_parsers.py [--size N] [--repeat N]
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse
+
+
+def entries(size, time_graph):
+    '''
+    Model of a tree response
+    '''
+    model = {"headers": [{"name": "Name"}, {"name": "TID"}],
+             "entries": [{"id": index, "parentId": index // 10 - 1, "labels": ["entry", str(index)],
+                          "style": {"parentKey": "entry", "styleValues": {}}}
+                         for index in range(size)]}
+    if time_graph:
+        for entry in model["entries"]:
+            entry.update({"type": "thread", "start": 0, "end": 1000, "hasData": True})
+    return model
+
+
+def payload(model_type, size):
+    '''
+    Decoded JSON of a response of a model type, holding about size objects
+    '''
+    if model_type == ModelType.TIME_GRAPH_STATE:
+        rows = max(size // 100, 1)
+        model = {"rows": [{"entryId": row,
+                           "states": [{"start": index * 10, "end": index * 10 + 9,
+                                       "label": "running", "values": index % 5,
+                                       "style": {"parentKey": "running"}}
+                                      for index in range(size // rows)]}
+                          for row in range(rows)]}
+    elif model_type == ModelType.TIME_GRAPH_ARROW:
+        model = [{"sourceId": index, "targetId": index + 1, "start": index, "end": index + 5,
+                  "style": {"parentKey": "arrow"}} for index in range(size)]
+    elif model_type == ModelType.XY:
+        model = {"title": "xy", "series": [
+            {"seriesName": "series", "seriesId": series,
+             "xValues": list(range(size // 10)),
+             "yValues": [float(index) for index in range(size // 10)],
+             "xAxis": {"label": "t", "unit": "ns", "dataType": "TIMESTAMP"},
+             "yAxis": {"label": "v", "unit": "", "dataType": "NUMBER"}}
+            for series in range(10)]}
+    elif model_type == ModelType.VIRTUAL_TABLE_HEADER:
+        model = [{"id": index, "name": "column", "description": "", "type": "STRING"}
+                 for index in range(size)]
+    elif model_type == ModelType.VIRTUAL_TABLE:
+        model = {"size": size, "lowIndex": 0, "columnIds": [0, 1, 2, 3],
+                 "lines": [{"index": index, "tags": 0,
+                            "cells": [{"content": "cell", "tags": 0} for _ in range(4)]}
+                           for index in range(size)]}
+    else:
+        model = entries(size, model_type == ModelType.TIME_GRAPH_TREE)
+    return {"model": model, "status": "COMPLETED", "statusMessage": "Completed"}
+
+
+def check_status(params, model_type):
+    '''
+    Check the status of a response, without building its model
+    '''
+    return GenericResponse(params, model_type).status
+
+
+def build_model(params, model_type):
+    '''
+    Build the model of a response
+    '''
+    return GenericResponse(params, model_type).model
+
+
+def main():
+    '''
+    Run the benchmark
+    '''
+    parser = argparse.ArgumentParser(description='Measure the GenericResponse parsing time')
+    parser.add_argument('--size', type=int, default=10000,
+                        help='Number of objects per response')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of measurements, the best is kept')
+    options = parser.parse_args()
+
+    for model_type in ModelType:
+        params = payload(model_type, options.size)
+        before = json.dumps(params)
+        status = min(timeit.repeat(functools.partial(check_status, params, model_type),
+                                   number=1, repeat=options.repeat))
+        seconds = min(timeit.repeat(functools.partial(build_model, params, model_type),
+                                    number=1, repeat=options.repeat))
+        if json.dumps(params) != before:
+            print(f'{model_type.name}: the decoded JSON was modified', file=sys.stderr)
+            sys.exit(1)
+        print(f'{model_type.name:<22} {seconds * 1000:>8.2f} ms '
+              f'{seconds * 1e9 / options.size:>8.0f} ns per object, '
+              f'status only {status * 1e6:>6.1f} us')
+
+
+if __name__ == "__main__":
+    main()
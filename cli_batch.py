@@ -0,0 +1,156 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Batch mode of tsp_cli_client, running commands read one per line.
+
+Each line holds the options of one command: shell-like words, a JSON list of
+arguments or a JSON object of options. Each command gives one JSON result
+line, with its input line number, the command, its exit status and what it
+printed, in input order.
+"""
+
+import argparse
+import collections
+import json
+import shlex
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Exit status of a line that is not a valid command, as for invalid arguments
+INVALID_COMMAND_STATUS = 2
+
+# Options given to every command by the batch, by destination
+BATCH_OPTIONS = {
+    "ip_address": "--ip",
+    "port": "--port",
+    "cache": "--cache",
+    "cache_dir": "--cache-dir",
+    "cache_ttl": "--cache-ttl",
+    "concurrency": "--concurrency"
+}
+
+# Options of the other modes, by destination
+MODE_OPTIONS = {
+    "batch": "--batch",
+    "daemon": "--daemon",
+    "stop_daemon": "--stop-daemon",
+    "no_daemon": "--no-daemon",
+    "daemon_socket": "--daemon-socket",
+    "daemon_idle_timeout": "--daemon-idle-timeout"
+}
+
+# Value of the batch and mode options not given on a line
+_NOT_GIVEN = object()
+
+
+def split_line(line):
+    '''
+    Split a line into command line arguments
+    :param line: Shell-like words, a JSON list of arguments or a JSON object of options
+    :returns: List of arguments
+    :raises ValueError: If the line is not valid
+    '''
+    if line[0] not in "[{":
+        return shlex.split(line)
+    command = json.loads(line)
+    if isinstance(command, list):
+        return [str(argument) for argument in command]
+    arguments = []
+    for name, value in command.items():
+        option = "--" + name.lstrip("-").replace("_", "-")
+        if value is True:
+            arguments.append(option)
+        elif isinstance(value, list):
+            arguments.append(option)
+            arguments.extend(str(item) for item in value)
+        elif value is not None and value is not False:
+            arguments.extend([option, str(value)])
+    return arguments
+
+
+def parse_line(parser, line, batch_options):
+    '''
+    Parse the options of one command, taking the batch options from the batch
+    :param parser: Parser of the CLI options
+    :param line: Line of the command
+    :param batch_options: Parsed options of the batch
+    :returns: Parsed options of the command
+    :raises ValueError: If the line is not valid, or gives a batch or mode option
+    :raises SystemExit: As argparse does on invalid arguments
+    '''
+    given = argparse.Namespace(**{dest: _NOT_GIVEN for dest in {**BATCH_OPTIONS, **MODE_OPTIONS}})
+    options = parser.parse_args(split_line(line), given)
+    for dest, option in MODE_OPTIONS.items():
+        if getattr(options, dest) is not _NOT_GIVEN:
+            raise ValueError(f"{option} is not available in a batch")
+        setattr(options, dest, parser.get_default(dest))
+    for dest, option in BATCH_OPTIONS.items():
+        if getattr(options, dest) is not _NOT_GIVEN:
+            raise ValueError(f"{option} applies to the whole batch, not to one command")
+        setattr(options, dest, getattr(batch_options, dest))
+    return options
+
+
+def run(source, parse, run_command, concurrency, out):
+    '''
+    Run the commands of a batch, writing their results in input order
+    :param source: Lines of the commands; empty lines and # comments are skipped
+    :param parse: Function parsing a line, returning the parsed options of its
+        command, or None with the exit status and output of an invalid line
+    :param run_command: Function running a command, given its parsed options,
+        and returning its exit status and output
+    :param concurrency: Number of commands run at once
+    :param out: Text stream of the results
+    :returns: 0 if all the commands succeeded, 1 otherwise
+    '''
+    concurrency = max(1, concurrency)
+    pending = collections.deque()
+    failed = False
+
+    def emit():
+        number, line, future = pending.popleft()
+        status, output = future.result()
+        out.write(json.dumps({"line": number, "command": line, "status": status,
+                              "output": output}) + "\n")
+        out.flush()
+        return status != 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for number, line in enumerate(source, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            # Parsed here, as argparse reports errors on the shared stderr
+            options, status, output = parse(line)
+            if options is None:
+                future = Future()
+                future.set_result((status, output))
+            else:
+                future = executor.submit(run_command, options)
+            pending.append((number, line, future))
+
+            # Results are emitted in order, as soon as they are available
+            while pending and (len(pending) > concurrency or pending[0][2].done()):
+                failed = emit() or failed
+        while pending:
+            failed = emit() or failed
+    return 1 if failed else 0
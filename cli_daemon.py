@@ -0,0 +1,256 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Daemon mode of tsp_cli_client, serving commands over a Unix domain socket.
+
+Messages are JSON documents, one per line. A command request carries the
+parsed CLI options; the daemon answers with the text the command prints,
+as "out" and "err" messages for its standard output and error, then with
+its "exit" status.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+
+DEFAULT_IDLE_TIMEOUT = 3600
+
+# Pending output sent to the client once this long, in characters
+OUTPUT_CHUNK_SIZE = 64 * 1024
+START_TIMEOUT = 10
+
+# Exit status of a request the daemon cannot read, as for invalid arguments
+INVALID_REQUEST_STATUS = 2
+
+
+class _ClientWriter:
+    '''
+    Text stream sending what is written to the client, in chunks
+    '''
+
+    def __init__(self, connection, kind="out"):
+        self._connection = connection
+        self._kind = kind
+        self._pending = []
+        self._size = 0
+
+    def write(self, text):
+        '''
+        Write text, sent once enough is pending or on flush()
+        '''
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size >= OUTPUT_CHUNK_SIZE:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        '''
+        Send the pending text
+        '''
+        if self._pending:
+            _send(self._connection, {self._kind: "".join(self._pending)})
+            self._pending = []
+            self._size = 0
+
+
+def _send(connection, message):
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _read_request(line):
+    '''
+    Decode a request of a client
+    :returns: The request, as a dict
+    :raises ValueError: If the request is not a stop or command request
+    '''
+    request = json.loads(line)
+    if not isinstance(request, dict) or not request.get("stop") \
+            and not isinstance(request.get("options"), dict):
+        raise ValueError("expecting a stop or command request")
+    return request
+
+
+def _connect(socket_path):
+    '''
+    Connect to the daemon
+    :returns: The connected socket, or None if no daemon listens on socket_path
+    '''
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except OSError:
+        connection.close()
+        return None
+    return connection
+
+
+def forward(socket_path, options):
+    '''
+    Run a command in the daemon, printing its output
+    :param socket_path: Path of the daemon socket
+    :param options: Parsed CLI options, as a dict
+    :returns: Exit status of the command, or None if no daemon is running
+    '''
+    connection = _connect(socket_path)
+    if connection is None:
+        return None
+    with connection, connection.makefile("rb") as messages:
+        _send(connection, {"options": options})
+        for line in messages:
+            message = json.loads(line)
+            if "out" in message:
+                sys.stdout.write(message["out"])
+            elif "err" in message:
+                sys.stderr.write(message["err"])
+                sys.stderr.flush()
+            elif "exit" in message:
+                sys.stdout.flush()
+                return message["exit"]
+    print("Daemon closed the connection")
+    return 1
+
+
+def stop(socket_path):
+    '''
+    Stop the daemon
+    :param socket_path: Path of the daemon socket
+    :returns: True if a daemon was running
+    '''
+    connection = _connect(socket_path)
+    if connection is None:
+        return False
+    with connection, connection.makefile("rb") as messages:
+        _send(connection, {"stop": True})
+        messages.readline()
+    return True
+
+
+def start(socket_path, run_command, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    '''
+    Start the daemon as a background process
+    :param socket_path: Path of the daemon socket
+    :param run_command: Function running a command, given its parsed CLI
+        options as a dict and the streams of its standard output and error,
+        and returning its exit status
+    :param idle_timeout: Seconds without commands before the daemon exits,
+        or None to never exit on its own
+    :returns: True once the daemon accepts commands, False if one was already running
+    '''
+    connection = _connect(socket_path)
+    if connection is not None:
+        connection.close()
+        return False
+
+    if os.fork() == 0:
+        os.setsid()
+        with open(os.devnull, "r+b") as devnull:
+            for stream in (sys.stdin, sys.stdout, sys.stderr):
+                os.dup2(devnull.fileno(), stream.fileno())
+        try:
+            serve(socket_path, run_command, idle_timeout)
+        finally:
+            os._exit(0)  # pylint: disable=protected-access
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        connection = _connect(socket_path)
+        if connection is not None:
+            connection.close()
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _serve_request(connection, line, run_command):
+    '''
+    Answer one request of a client
+    :returns: False once a stop request is answered, True otherwise
+    '''
+    try:
+        request = _read_request(line)
+    except ValueError as e:
+        # Answered, so that a bad client does not stop the daemon
+        _send(connection, {"err": f"Invalid request: {e}\n"})
+        _send(connection, {"exit": INVALID_REQUEST_STATUS})
+        return True
+    if request.get("stop"):
+        _send(connection, {"exit": 0})
+        return False
+    out = _ClientWriter(connection)
+    err = _ClientWriter(connection, "err")
+    status = run_command(request["options"], out, err)
+    err.flush()
+    out.flush()
+    _send(connection, {"exit": status})
+    return True
+
+
+def serve(socket_path, run_command, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    '''
+    Serve commands, one at a time, until stopped or idle for too long
+    :param socket_path: Path of the daemon socket
+    :param run_command: Function running a command, given its parsed CLI
+        options as a dict and the streams of its standard output and error,
+        and returning its exit status
+    :param idle_timeout: Seconds without commands before returning, or None
+    '''
+    directory = os.path.dirname(socket_path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    if os.path.exists(socket_path):
+        # Left behind by a daemon that did not stop cleanly
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only the user may connect
+    umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(umask)
+    server.listen()
+    server.settimeout(idle_timeout)
+
+    try:
+        while True:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                return
+            connection.settimeout(None)
+            with connection, connection.makefile("rb") as messages:
+                line = messages.readline()
+                if not line:
+                    continue
+                try:
+                    if not _serve_request(connection, line, run_command):
+                        return
+                except OSError:
+                    # Client gone
+                    pass
+    finally:
+        server.close()
+        os.unlink(socket_path)
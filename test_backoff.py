@@ -0,0 +1,124 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""TestBackoff class file."""
+
+import random
+
+from types import SimpleNamespace
+
+import pytest
+
+from tsp import backoff, deadline
+from tsp.backoff import Backoff
+from tsp.deadline import poll
+from tsp.response import ResponseStatus
+from tsp.tsp_client import TspClient
+from tsp.tsp_client_response import TspClientResponse
+
+
+class FakeTime:
+    """Clock only advanced by sleeping, recording the sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        """Current time, in seconds."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Advance the clock instead of waiting."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestBackoff:
+    """Backoff delays and polling test methods, needing no server."""
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self, monkeypatch):
+        """Replace the clock of the backoff and of the polling."""
+        clock = FakeTime()
+        monkeypatch.setattr(backoff, 'time', clock)
+        monkeypatch.setattr(deadline, 'time', clock)
+        return clock
+
+    @staticmethod
+    def _take(delays, count):
+        return [next(delays) for _ in range(count)]
+
+    def test_growth_and_cap(self):
+        """Expect delays multiplied by the factor up to the maximum, without jitter."""
+        delays = Backoff(initial=0.05, maximum=0.5, factor=2, jitter=0).delays()
+        assert self._take(delays, 6) == pytest.approx([0.05, 0.1, 0.2, 0.4, 0.5, 0.5])
+
+    def test_jitter_bounds(self, monkeypatch):
+        """Expect each delay reduced by at most the jitter fraction, reproducibly."""
+        monkeypatch.setattr(backoff, 'random', random.Random(42))
+        delays = self._take(Backoff(initial=1, maximum=1, jitter=0.25).delays(), 100)
+        assert all(0.75 <= delay <= 1 for delay in delays)
+        assert len(set(delays)) > 1
+
+        monkeypatch.setattr(backoff, 'random', random.Random(42))
+        assert self._take(Backoff(initial=1, maximum=1, jitter=0.25).delays(), 100) == delays
+
+    def test_timeout_clipping(self, clock):
+        """Expect delays clipped to the time left, and none once the timeout is reached."""
+        delays = []
+        for delay in Backoff(initial=1, maximum=4, jitter=0).delays(timeout=10):
+            delays.append(delay)
+            clock.sleep(delay)
+        assert delays == [1, 2, 4, 3]
+        assert clock.now == 10
+
+    def test_poll(self, clock):
+        """Expect polling until the result is done, reporting the running results."""
+        results = iter([1, 2, 3, 0])
+        running = []
+        assert poll(lambda: next(results), bool, Backoff(jitter=0).delays(), "late",
+                    running.append) == 0
+        assert running == [1, 2, 3]
+        assert clock.sleeps == pytest.approx([0.05, 0.1, 0.2])
+
+    def test_poll_timeout(self, clock):
+        """Expect TimeoutError once the delays run out."""
+        with pytest.raises(TimeoutError, match="late"):
+            poll(lambda: 1, bool, Backoff(initial=1, jitter=0).delays(timeout=3), "late")
+        assert clock.now == 3
+
+    def test_await_completion_timeout(self, clock):
+        """Expect TimeoutError naming the endpoint still RUNNING after the timeout."""
+        def fetch_xy(exp_uuid):
+            assert exp_uuid == 'experiment'
+            return TspClientResponse(SimpleNamespace(status=ResponseStatus.RUNNING), 200, '')
+
+        progress = []
+        with TspClient('http://localhost:8080/tsp/api/') as client, \
+                pytest.raises(TimeoutError, match="fetch_xy"):
+            client.await_completion(fetch_xy, 'experiment', timeout=1,
+                                    backoff=Backoff(initial=0.25, jitter=0),
+                                    progress=progress.append)
+        assert len(progress) == 4
+        assert clock.now == 1
@@ -0,0 +1,121 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestBulkDelete class file."""
+
+import pytest
+import requests
+
+from tsp.bulk_delete import BulkDeleteResult, WALL_CLOCK_START, delete_all, matches, select
+from tsp.indexing_status import IndexingStatus
+from tsp.trace import Trace
+from tsp.trace_set import TraceSet
+from tsp.tsp_client_response import TspClientResponse
+
+# 2026-01-01, in nanoseconds since the epoch
+NOW = 1767225600 * 1000000000
+DAY = 86400 * 1000000000
+
+
+def _trace(end, name="kernel", indexing_status="COMPLETED"):
+    return Trace({"UUID": name, "name": name, "start": 0, "end": end,
+                  "indexingStatus": indexing_status})
+
+
+class TestBulkDelete:
+    """Bulk deletion filter and result test methods, needing no server."""
+
+    def test_no_filter(self):
+        """Expect None filters to match everything, still indexing traces included."""
+        assert matches(_trace(NOW))
+        assert matches(_trace(0, indexing_status="RUNNING"))
+
+    def test_name(self):
+        """Expect the name to be matched against the glob pattern, case-sensitively."""
+        assert matches(_trace(NOW, "kernel-1"), name="kernel-*")
+        assert not matches(_trace(NOW, "Kernel-1"), name="kernel-*")
+        assert not matches(_trace(NOW, "ust-1"), name="kernel-*")
+
+    @pytest.mark.parametrize("end, expected", [
+        (NOW - 30 * DAY, True),
+        (NOW - DAY, False),
+        (NOW, False),
+        (WALL_CLOCK_START, True),
+        # Still indexing, or without an end time
+        (0, False),
+        (-1, False),
+        # Monotonic clock: two days since boot
+        (2 * DAY, False)
+    ])
+    def test_ended_before(self, end, expected):
+        """Expect only wall-clock end times before the timestamp to match."""
+        assert matches(_trace(end), ended_before=NOW - 7 * DAY) == expected
+
+    def test_still_indexing(self):
+        """Expect a trace still indexing, with no end time yet, not to match a timestamp."""
+        trace = _trace(0, indexing_status="RUNNING")
+        assert not matches(trace, ended_before=NOW)
+        assert matches(trace, indexing_status=IndexingStatus.RUNNING)
+
+    def test_all_filters(self):
+        """Expect every given filter to have to match."""
+        trace = _trace(NOW - 30 * DAY, "kernel-1")
+        assert matches(trace, "kernel-*", NOW, IndexingStatus.COMPLETED)
+        assert not matches(trace, "kernel-*", NOW, IndexingStatus.RUNNING)
+        assert not matches(trace, "ust-*", NOW, IndexingStatus.COMPLETED)
+
+    def test_result(self):
+        """Expect deleted models in order, and failed deletions with their reason."""
+        result = BulkDeleteResult()
+        result.add("first", TspClientResponse(_trace(NOW, "first"), 200, ""))
+        result.add("second", TspClientResponse(None, 404, ""))
+        result.add("third", ConnectionError("refused"))
+        result.add("fourth", TspClientResponse(_trace(NOW, "fourth"), 200, ""))
+        assert [trace.name for trace in result.deleted] == ["first", "fourth"]
+        assert result.failures == {"second": "status 404", "third": "refused"}
+
+    def test_select(self):
+        """Expect given UUIDs without filters, else the listed ones matching the filters."""
+        listed = TraceSet([{"UUID": name, "name": name, "start": 0, "end": NOW,
+                            "indexingStatus": "COMPLETED"}
+                           for name in ("kernel-1", "ust-1", "kernel-2")])
+
+        def fetch():
+            return TspClientResponse(listed, 200, "")
+
+        assert select(["a", "b"], None, "traces") == ["a", "b"]
+        assert select(None, fetch, "traces", name="kernel-*") == ["kernel-1", "kernel-2"]
+        assert select(["kernel-2", "ust-1"], fetch, "traces", name="kernel-*") == ["kernel-2"]
+        assert select(None, lambda: TspClientResponse(None, 500, ""), "traces", name="*") is None
+        with pytest.raises(ValueError):
+            select(None, fetch, "traces")
+
+    def test_delete_all(self):
+        """Expect every deletion attempted, request errors recorded as failures."""
+        def delete(uuid):
+            if uuid == "second":
+                raise requests.exceptions.ConnectionError("refused")
+            return TspClientResponse(_trace(NOW, uuid), 200, "")
+
+        result = delete_all(["first", "second", "third"], delete, 2)
+        assert [trace.name for trace in result.deleted] == ["first", "third"]
+        assert result.failures == {"second": "refused"}
@@ -0,0 +1,100 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestCliDaemon class file."""
+
+import socket
+import threading
+
+import pytest
+
+import cli_daemon
+
+
+def _run_command(options, out, err):
+    """Print the options then a warning, and exit with the requested status."""
+    out.write(f"{options['name']}\n")
+    err.write("warning\n")
+    return options["status"]
+
+
+def _request(socket_path, data):
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(socket_path)
+    with connection, connection.makefile("rb") as messages:
+        connection.sendall(data)
+        connection.shutdown(socket.SHUT_WR)
+        return messages.read()
+
+
+class TestCliDaemon:
+    """Daemon serving and forwarding test methods, needing no server."""
+
+    @pytest.fixture(name="socket_path")
+    def fixture_socket_path(self, tmp_path):
+        """Serve the test command on a socket, stopping the daemon at the end."""
+        socket_path = str(tmp_path / "daemon.sock")
+        thread = threading.Thread(target=cli_daemon.serve,
+                                  args=(socket_path, _run_command, 10), daemon=True)
+        thread.start()
+        for _ in range(100):
+            if cli_daemon._connect(socket_path) is not None:  # pylint: disable=protected-access
+                break
+            thread.join(0.05)
+        yield socket_path
+        cli_daemon.stop(socket_path)
+        thread.join(5)
+        assert not thread.is_alive()
+
+    def test_forward(self, socket_path, capsys):
+        """Expect the output and error of the command, then its status."""
+        assert cli_daemon.forward(socket_path, {"name": "first", "status": 0}) == 0
+        assert cli_daemon.forward(socket_path, {"name": "second", "status": 3}) == 3
+        captured = capsys.readouterr()
+        assert captured.out == "first\nsecond\n"
+        assert captured.err == "warning\nwarning\n"
+
+    @pytest.mark.parametrize("data", [b"{not json\n", b"[1]\n", b'{"options": 1}\n', b"\xff\n"])
+    def test_invalid_request(self, socket_path, capsys, data):
+        """Expect an error reply to an invalid request, and the daemon to keep serving."""
+        assert _request(socket_path, data).endswith(b'{"exit": 2}\n')
+        assert b"Invalid request" in _request(socket_path, data)
+        assert cli_daemon.forward(socket_path, {"name": "after", "status": 0}) == 0
+        assert capsys.readouterr().out == "after\n"
+
+    def test_client_gone(self, socket_path, capsys):
+        """Expect the daemon to keep serving after a client closed without a request."""
+        _request(socket_path, b"")
+        assert cli_daemon.forward(socket_path, {"name": "after", "status": 0}) == 0
+        assert capsys.readouterr().out == "after\n"
+
+    def test_stop(self, socket_path):
+        """Expect a stopped daemon to remove its socket, and no daemon to forward to."""
+        assert cli_daemon.stop(socket_path)
+        assert not cli_daemon.stop(socket_path)
+        assert cli_daemon.forward(socket_path, {"name": "none", "status": 0}) is None
+
+    def test_idle_timeout(self, tmp_path):
+        """Expect the daemon to stop once idle for too long."""
+        socket_path = str(tmp_path / "idle.sock")
+        cli_daemon.serve(socket_path, _run_command, 0.1)
+        assert not (tmp_path / "idle.sock").exists()
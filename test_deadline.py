@@ -0,0 +1,172 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""TestDeadline class file."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tsp import deadline as deadline_module
+from tsp.deadline import DeadlineExceeded, bind_context, bound_timeout, check, clip_delay, \
+    deadline, remaining
+from tsp.timed_session import TimedSession, endpoint_timeout
+from tsp.tsp_client import TspClient
+
+BASE_URL = 'http://localhost:8080/tsp/api/'
+
+
+# pylint: disable=too-few-public-methods
+class FakeTime:
+    """Clock only advanced by the tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        """Current time, in seconds."""
+        return self.now
+
+
+class TestDeadline:
+    """Deadline and timed session test methods, needing no server."""
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self, monkeypatch):
+        """Replace the clock of the deadlines."""
+        clock = FakeTime()
+        monkeypatch.setattr(deadline_module, 'time', clock)
+        return clock
+
+    @pytest.fixture(name='requests_made')
+    def fixture_requests_made(self, monkeypatch):
+        """Record the requests of the sessions instead of sending them."""
+        made = []
+
+        def request(_session, method, url, *args, **kwargs):
+            made.append((method, url, args, kwargs))
+            return 'response'
+        monkeypatch.setattr(requests.Session, 'request', request)
+        return made
+
+    def test_no_deadline(self):
+        """Expect timeouts and delays unchanged without a deadline."""
+        assert remaining() is None
+        assert check() is None
+        assert bound_timeout((3.05, 60)) == (3.05, 60)
+        assert bound_timeout(None) is None
+        assert clip_delay(5) == 5
+
+    def test_bound_timeout(self, clock):
+        """Expect every part of a timeout clipped to the time left."""
+        with deadline(10):
+            clock.now += 2
+            assert remaining() == 8
+            assert bound_timeout(None) == 8
+            assert bound_timeout(5) == 5
+            assert bound_timeout(30) == 8
+            assert bound_timeout((3.05, 60)) == (3.05, 8)
+            assert bound_timeout((None, 60)) == (8, 8)
+        assert remaining() is None
+
+    def test_clip_delay(self, clock):
+        """Expect delays clipped to the time left, then DeadlineExceeded once past."""
+        with deadline(1):
+            assert clip_delay(0.25) == 0.25
+            assert clip_delay(2) == 1
+            clock.now += 1.5
+            with pytest.raises(DeadlineExceeded, match='deadline exceeded by 0.500 seconds'):
+                clip_delay(0.25)
+            with pytest.raises(DeadlineExceeded):
+                bound_timeout(None)
+
+    def test_nested(self, clock):
+        """Expect a nested deadline to keep the earlier one, and the outer one restored."""
+        with deadline(10):
+            with deadline(60):
+                assert remaining() == 10
+            with deadline(2):
+                assert remaining() == 2
+            clock.now += 3
+            assert remaining() == 7
+
+    def test_bind_context(self):
+        """Expect the deadline carried over to pool threads only by bind_context."""
+        with deadline(60):
+            bound = bind_context(remaining)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(remaining).result() is None
+                assert 0 < executor.submit(bound).result() <= 60
+
+        # The bound function keeps the deadline of where it was bound
+        assert remaining() is None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert 0 < executor.submit(bound).result() <= 60
+
+    @pytest.mark.parametrize('path, expected', [
+        ('health', (1, 2)),
+        ('experiments/uuid/outputs/timeGraph/output/states', (3, 300)),
+        ('experiments/uuid/outputs/timeGraph/output/states/', (3, 300)),
+        ('experiments/uuid/outputs/XY/output/tree', 30),
+        ('experiments', 30),
+    ])
+    def test_endpoint_timeout(self, path, expected):
+        """Expect the timeout of the last path segment, or the default one."""
+        timeouts = {'health': (1, 2), 'states': (3, 300)}
+        assert endpoint_timeout(BASE_URL + path + '?a=b', timeouts, 30) == expected
+
+    def test_client_timeouts(self, requests_made):
+        """Expect the client overrides to apply over the default endpoint timeouts."""
+        with TspClient(BASE_URL, timeout=20, timeouts={'health': 4}) as client:
+            for path in ('health', 'identifier', 'traces'):
+                client._session.get(BASE_URL + path)  # pylint: disable=protected-access
+        assert [kwargs['timeout'] for _, _, _, kwargs in requests_made] == [4, (1, 5), 20]
+
+    def test_session_timeout(self, clock, requests_made):
+        """Expect a given timeout, by keyword or position, to replace the endpoint one."""
+        session = TimedSession(lambda url: 30)
+        session.request('GET', BASE_URL)
+        session.request('GET', BASE_URL, timeout=5)
+        session.request('GET', BASE_URL, None, None, None, None, None, None, 5)
+        with deadline(2):
+            session.request('GET', BASE_URL, None, None, None, None, None, None, 5)
+            clock.now += 3
+            with pytest.raises(DeadlineExceeded):
+                session.request('GET', BASE_URL)
+        assert [kwargs.get('timeout') for _, _, _, kwargs in requests_made] == [30, 5, None, None]
+        assert [args[6] for _, _, args, _ in requests_made if args] == [5, 2]
+
+    def test_session_deadline_exceeded(self, clock, monkeypatch):
+        """Expect a timeout past the deadline to raise DeadlineExceeded, others as they are."""
+        def time_out(*_args, **_kwargs):
+            clock.now += 3
+            raise requests.exceptions.ReadTimeout('read timed out')
+        monkeypatch.setattr(requests.Session, 'request', time_out)
+
+        session = TimedSession(lambda url: 30)
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            session.request('GET', BASE_URL)
+        with deadline(2), \
+                pytest.raises(DeadlineExceeded, match='deadline exceeded by 1.000 seconds'):
+            session.request('GET', BASE_URL)
@@ -0,0 +1,220 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""TestDiskResponseCache class file."""
+
+import json
+
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from tsp import disk_response_cache
+from tsp.disk_response_cache import DiskResponseCache, server_namespace
+from tsp.identifier import Identifier
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse, ResponseStatus
+from tsp.response_cache import cache_key
+from tsp.tsp_client_response import TspClientResponse
+
+NAMESPACE = 'http://localhost:8080/tsp/api/|product|1.0|20260101'
+
+
+# pylint: disable=too-few-public-methods
+class FakeTime:
+    """Wall clock only advanced by the tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        """Current time, in seconds."""
+        return self.now
+
+
+def _key(exp_uuid='experiment', output_id='states', start=0):
+    return cache_key(ModelType.TIME_GRAPH_STATE, exp_uuid, output_id,
+                     {'parameters': {'requested_timerange': {'start': start}}})
+
+
+def _response(status=ResponseStatus.COMPLETED, label='RUNNING'):
+    """States TspClientResponse, with its raw body padded to 200 bytes."""
+    body = json.dumps({'model': {'rows': [{'entryId': 1, 'states': [
+        {'start': 0, 'end': 10, 'label': label}]}]},
+                       'status': status.value, 'statusMessage': ''})
+    content = body.ljust(200).encode()
+    return TspClientResponse(GenericResponse(json.loads(content), ModelType.TIME_GRAPH_STATE),
+                             200, content), content
+
+
+class TestDiskResponseCache:
+    """DiskResponseCache test methods, needing no server."""
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self, monkeypatch):
+        """Replace the wall clock of the cache."""
+        clock = FakeTime()
+        monkeypatch.setattr(disk_response_cache, 'time', clock)
+        return clock
+
+    @pytest.fixture(name='cache')
+    def fixture_cache(self, tmp_path):
+        """Cache in a fresh directory."""
+        with closing(DiskResponseCache(str(tmp_path / 'cache'), NAMESPACE)) as cache:
+            yield cache
+
+    def test_round_trip(self, cache):
+        """Expect a stored response to be read back, from the raw body, and counted."""
+        assert cache.get(_key()) is None
+        response, content = _response(label='WAITING')
+        cache.put(_key(), response, content)
+
+        cached = cache.get(_key())
+        assert cached.status_code == 200
+        assert cached.status_text == content.decode()
+        assert cached.model.status == ResponseStatus.COMPLETED
+        assert cached.model.model.rows[0].states[0].label == 'WAITING'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_not_cacheable(self, cache):
+        """Expect running responses and bodies over max_bytes not to be stored."""
+        cache.put(_key(), *_response(ResponseStatus.RUNNING))
+        assert cache.get(_key()) is None
+
+        cache.max_bytes = 199
+        cache.put(_key(), *_response())
+        assert cache.get(_key()) is None
+
+    def test_persistence(self, tmp_path):
+        """Expect entries to survive the cache, in the same directory."""
+        with closing(DiskResponseCache(str(tmp_path), NAMESPACE)) as cache:
+            cache.put(_key(), *_response())
+        with closing(DiskResponseCache(str(tmp_path), NAMESPACE)) as cache:
+            assert cache.get(_key()) is not None
+
+    def test_ttl(self, cache, clock):
+        """Expect entries to expire once their time to live has passed since stored."""
+        cache.ttl = 60
+        cache.put(_key(), *_response())
+        clock.now += 59
+        assert cache.get(_key()) is not None
+        clock.now += 1
+        assert cache.get(_key()) is None
+
+        # Expired entries are also pruned when others are stored
+        cache.put(_key(start=1), *_response())
+        clock.now += 60
+        cache.put(_key(start=2), *_response())
+        cache.ttl = None
+        assert cache.get(_key(start=1)) is None
+
+    def test_lru_pruning(self, cache, clock):
+        """Expect the least recently used entries pruned to stay within max_bytes."""
+        cache.max_bytes = 500
+        for start in range(2):
+            clock.now += 1
+            cache.put(_key(start=start), *_response())
+        clock.now += 1
+        assert cache.get(_key(start=0)) is not None
+
+        clock.now += 1
+        cache.put(_key(start=2), *_response())
+        assert cache.get(_key(start=1)) is None
+        assert cache.get(_key(start=0)) is not None
+        assert cache.get(_key(start=2)) is not None
+
+    def test_namespaces(self, tmp_path):
+        """Expect servers sharing the directory to neither see nor clear each other's entries."""
+        directory = str(tmp_path)
+        with closing(DiskResponseCache(directory, NAMESPACE)) as first, \
+                closing(DiskResponseCache(directory, NAMESPACE + '1')) as second:
+            first.put(_key(), *_response())
+            assert second.get(_key()) is None
+
+            second.put(_key(), *_response())
+            second.clear()
+            assert first.get(_key()) is not None
+            second.put(_key(), *_response())
+            second.invalidate('experiment')
+            assert first.get(_key()) is not None
+
+    def test_server_namespace(self):
+        """Expect the namespace to tell apart base URLs, products, versions and builds."""
+        def client(base_url, product='product', version='1.0', build='20260101'):
+            identifier = Identifier({'productId': product, 'version': version,
+                                     'buildTime': build})
+            return SimpleNamespace(
+                base_url=base_url,
+                fetch_identifier=lambda: TspClientResponse(identifier, 200, ''))
+
+        base_url = 'http://localhost:8080/tsp/api/'
+        namespaces = {server_namespace(client(base_url)),
+                      server_namespace(client('http://localhost:8081/tsp/api/')),
+                      server_namespace(client(base_url, product='other')),
+                      server_namespace(client(base_url, version='1.1')),
+                      server_namespace(client(base_url, build='20260102'))}
+        assert len(namespaces) == 5
+        assert server_namespace(client(base_url)) == NAMESPACE
+
+        unidentified = SimpleNamespace(base_url=base_url,
+                                       fetch_identifier=lambda: TspClientResponse(None, 500, ''))
+        assert server_namespace(unidentified) == base_url
+
+    def test_lazy_namespace(self, tmp_path):
+        """Expect a callable namespace to be resolved once, on first use."""
+        calls = []
+
+        def namespace():
+            calls.append(1)
+            return NAMESPACE
+
+        with closing(DiskResponseCache(str(tmp_path), namespace)) as cache:
+            assert not calls
+            cache.put(_key(), *_response())
+            assert cache.get(_key()) is not None
+            assert len(calls) == 1
+        with closing(DiskResponseCache(str(tmp_path), NAMESPACE)) as cache:
+            assert cache.get(_key()) is not None
+
+    def test_invalidate_and_clear(self, cache):
+        """Expect invalidate to drop one experiment, and clear every entry."""
+        cache.put(_key('first'), *_response())
+        cache.put(_key('second'), *_response())
+        cache.invalidate('first')
+        assert cache.get(_key('first')) is None
+        assert cache.get(_key('second')) is not None
+
+        cache.clear()
+        assert cache.get(_key('second')) is None
+
+    def test_threads(self, cache):
+        """Expect the cache connection to be shared by pool threads."""
+        def use(start):
+            cache.put(_key(start=start), *_response())
+            return cache.get(_key(start=start)) is not None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(use, range(32)))
+        assert cache.hits == 32
@@ -0,0 +1,105 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""TestJsonCodec class file."""
+
+import sys
+
+import pytest
+
+from tsp import json_codec
+from tsp.json_codec import CODEC_ENVIRONMENT_VARIABLE, StdlibCodec, available_codecs, \
+    select_codec
+
+DOCUMENT = {'name': 'trace/é', 'values': [1, 2.5, None, True]}
+
+
+class TestJsonCodec:
+    """JSON codec selection test methods, needing no server."""
+
+    @pytest.fixture(autouse=True)
+    def fixture_unselected(self, monkeypatch):
+        """Start every test with no codec selected nor forced, and restore the selected one."""
+        monkeypatch.setattr(json_codec, '_codec', None)
+        monkeypatch.delenv(CODEC_ENVIRONMENT_VARIABLE, raising=False)
+
+    @pytest.fixture(name='stdlib_only')
+    def fixture_stdlib_only(self, monkeypatch):
+        """Make orjson and ujson fail to import, as when not installed."""
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+        monkeypatch.setitem(sys.modules, 'ujson', None)
+
+    @pytest.mark.parametrize('codec', available_codecs(), ids=lambda codec: codec.name)
+    def test_round_trip(self, codec):
+        """Expect every installed codec to decode what it encodes, as compact UTF-8."""
+        encoded = codec.dumps(DOCUMENT)
+        assert isinstance(encoded, bytes)
+        assert b' ' not in encoded
+        assert codec.loads(encoded) == DOCUMENT
+        assert codec.loads(encoded.decode('utf-8')) == DOCUMENT
+
+    def test_explicit(self):
+        """Expect an explicitly selected codec to be used by loads() and dumps()."""
+        assert select_codec('json').name == 'json'
+        assert isinstance(json_codec.codec(), StdlibCodec)
+        assert json_codec.loads(json_codec.dumps(DOCUMENT)) == DOCUMENT
+
+    def test_explicit_unknown(self):
+        """Expect an unknown codec name to fail, keeping the selected codec."""
+        select_codec('json')
+        with pytest.raises(ValueError, match='JSON codec not available: simdjson'):
+            select_codec('simdjson')
+        assert json_codec.codec().name == 'json'
+
+    def test_fastest(self):
+        """Expect the fastest installed codec to be selected on first use."""
+        assert json_codec.loads(b'[1]') == [1]
+        assert json_codec.codec().name == available_codecs()[0].name
+
+    def test_environment(self, monkeypatch):
+        """Expect the environment variable to force the codec."""
+        monkeypatch.setenv(CODEC_ENVIRONMENT_VARIABLE, 'json')
+        assert json_codec.codec().name == 'json'
+
+    def test_environment_invalid(self, monkeypatch):
+        """Expect an invalid environment variable to fall back to json once, with a warning."""
+        monkeypatch.setenv(CODEC_ENVIRONMENT_VARIABLE, 'simdjson')
+        with pytest.warns(UserWarning, match='TSP_JSON_CODEC: JSON codec not available'):
+            assert json_codec.loads(b'{"a": 1}') == {'a': 1}
+        assert json_codec.codec().name == 'json'
+        assert json_codec.dumps([1]) == b'[1]'
+
+    @pytest.mark.usefixtures('stdlib_only')
+    def test_fallback(self):
+        """Expect json to be selected when neither orjson nor ujson is installed."""
+        assert [codec.name for codec in available_codecs()] == ['json']
+        assert json_codec.codec().name == 'json'
+        with pytest.raises(ValueError, match='orjson'):
+            select_codec('orjson')
+
+    @pytest.mark.usefixtures('stdlib_only')
+    def test_environment_not_installed(self, monkeypatch):
+        """Expect an environment variable naming a codec not installed to fall back to json."""
+        monkeypatch.setenv(CODEC_ENVIRONMENT_VARIABLE, 'ujson')
+        with pytest.warns(UserWarning, match='ujson'):
+            assert json_codec.codec().name == 'json'
@@ -0,0 +1,120 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestJsonArrayStream class file."""
+
+import json
+
+import pytest
+
+from tsp.json_stream import JsonArrayStream
+
+PATH = ('model', 'lines')
+
+DOCUMENT = {
+    'model': {
+        'size': 3,
+        'lines': [
+            {'index': 0, 'cells': ['café', '漢字', '\U0001f600'], 'ok': True},
+            {'index': 1, 'cells': ['tab\tquote"back\\slash'], 'ok': False, 'tag': None},
+            {'index': 2, 'values': [-0.5, 1e5, 2.5e-3, 12345678901234567890, -7]}
+        ],
+        'columnIds': [1, 2]
+    },
+    'statusMessage': 'Completed',
+    'status': 'COMPLETED'
+}
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _stream(chunks, path=PATH):
+    stream = JsonArrayStream(chunks, path)
+    return list(stream), stream.envelope
+
+
+class TestJsonArrayStream:
+    """JsonArrayStream test methods, needing no server."""
+
+    @pytest.mark.parametrize('ensure_ascii', [True, False])
+    def test_every_chunk_size(self, ensure_ascii):
+        """Expect the same elements and envelope whatever the chunk boundaries."""
+        data = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii).encode('utf-8')
+        expected = dict(DOCUMENT, model=dict(DOCUMENT['model'], lines=[]))
+        for size in range(1, len(data) + 1):
+            elements, envelope = _stream(_chunks(data, size))
+            assert elements == DOCUMENT['model']['lines'], size
+            assert envelope == expected, size
+
+    @pytest.mark.parametrize('text, expected', [
+        ('1e5', 1e5), ('1E+5', 1e5), ('2.5', 2.5), ('-25', -25), ('1e-5', 1e-5), ('125', 125),
+        ('"split string"', 'split string'), ('"esc\\"aped\\\\"', 'esc"aped\\'),
+        ('"\\u00e9\\ud83d\\ude00"', 'é\U0001f600'), ('true', True), ('false', False),
+        ('null', None)
+    ])
+    def test_token_split_at_every_boundary(self, text, expected):
+        """Expect a token split anywhere across two chunks to be decoded whole."""
+        data = f'{{"model":{{"lines":[{text}],"size":{text}}}}}'.encode('utf-8')
+        for split in range(1, len(data)):
+            elements, envelope = _stream([data[:split], data[split:]])
+            assert elements == [expected], split
+            assert envelope == {'model': {'lines': [], 'size': expected}}, split
+
+    def test_multibyte_character_split(self):
+        """Expect UTF-8 sequences split inside a character to be decoded."""
+        data = '{"model":{"lines":["\U0001f600é"]}}'.encode('utf-8')
+        start = data.index(b'\xf0')
+        for split in range(start + 1, start + 6):
+            assert _stream([data[:split], data[split:]])[0] == ['\U0001f600é']
+
+    def test_number_at_end_of_document(self):
+        """Expect a number ending the document to be returned at the end of input."""
+        data = b'{"model":{"lines":[]},"size":15}'
+        for size in range(1, len(data) + 1):
+            assert _stream(_chunks(data, size))[1] == {'model': {'lines': []}, 'size': 15}
+
+    def test_empty_and_missing_array(self):
+        """Expect no elements for an empty array or a document without the path."""
+        assert _stream([b'{"model":{"lines":[]}}']) == ([], {'model': {'lines': []}})
+        assert _stream([b'{"model":null}']) == ([], {'model': None})
+        assert _stream([b'{}']) == ([], {})
+
+    def test_elements_before_end_of_document(self):
+        """Expect elements to be yielded before the rest of the document is read."""
+        def chunks():
+            yield b'{"model":{"lines":[1,2,'
+            raise AssertionError('read past the needed elements')
+
+        elements = iter(JsonArrayStream(chunks(), PATH))
+        assert [next(elements), next(elements)] == [1, 2]
+
+    @pytest.mark.parametrize('data', [
+        b'{"model":{"lines":[1,2', b'{"model":{"lines":[1,2]}', b'{"model":{"lines":["abc',
+        b'{"model":{"lines":[1 2]}}', b'{"model":{"lines":[1]}} x', b'[1]', b''
+    ])
+    def test_invalid_document(self, data):
+        """Expect truncated, malformed or trailing data to raise a JSONDecodeError."""
+        for size in range(1, max(len(data), 1) + 1):
+            with pytest.raises(json.JSONDecodeError):
+                _stream(_chunks(data, size))
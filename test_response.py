@@ -0,0 +1,110 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestGenericResponse class file."""
+
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tsp import response
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse, ResponseStatus
+from tsp.time_graph_model import TimeGraphModel
+
+CALLERS = 5
+
+STATES = {
+    'model': {'rows': [{'entryId': 1, 'states': [{'start': 0, 'end': 10, 'label': 'RUNNING'}]}]},
+    'status': 'COMPLETED',
+    'statusMessage': 'Completed'
+}
+
+
+class TestGenericResponse:
+    """GenericResponse lazy model test methods, needing no server."""
+
+    @pytest.fixture(name='builds')
+    def fixture_builds(self, monkeypatch):
+        """Count the time graph state models built, slowly enough for accesses to race."""
+        builds = []
+
+        def build(model, columnar):
+            builds.append(columnar)
+            time.sleep(0.05)
+            return TimeGraphModel(model)
+
+        monkeypatch.setitem(response.MODEL_BUILDERS, ModelType.TIME_GRAPH_STATE, build)
+        return builds
+
+    def test_status_without_model(self, builds):
+        """Expect the status and message to be read without building the model."""
+        generic = GenericResponse(STATES, ModelType.TIME_GRAPH_STATE)
+        assert generic.status == ResponseStatus.COMPLETED
+        assert generic.status_text == 'Completed'
+        assert not builds
+
+    def test_model_built_once(self):
+        """Expect the model built on first access, then the same one returned."""
+        generic = GenericResponse(STATES, ModelType.TIME_GRAPH_STATE)
+        model = generic.model
+        assert isinstance(model, TimeGraphModel)
+        assert model.rows[0].states[0].label == 'RUNNING'
+        assert generic.model is model
+
+    def test_concurrent_first_access(self, builds):
+        """Expect racing first accesses to all get the same model."""
+        generic = GenericResponse(STATES, ModelType.TIME_GRAPH_STATE)
+        with ThreadPoolExecutor(CALLERS) as executor:
+            models = list(executor.map(lambda _: generic.model, range(CALLERS)))
+        assert builds
+        assert all(model is models[0] for model in models)
+        assert generic.model is models[0]
+
+    def test_model_setter(self, builds):
+        """Expect a model set to be returned instead of building one."""
+        generic = GenericResponse(STATES, ModelType.TIME_GRAPH_STATE)
+        generic.model = None
+        assert generic.model is None
+        assert not builds
+
+    @pytest.mark.parametrize('columnar', [False, True])
+    def test_columnar(self, builds, columnar):
+        """Expect the columnar flag to be passed to the model builder."""
+        generic = GenericResponse(STATES, ModelType.TIME_GRAPH_STATE, columnar)
+        assert isinstance(generic.model, TimeGraphModel)
+        assert builds == [columnar]
+
+    def test_columnar_states(self):
+        """Expect columnar time graph states when asked for."""
+        pytest.importorskip('numpy')
+        generic = GenericResponse(STATES, ModelType.TIME_GRAPH_STATE, columnar=True)
+        assert type(generic.model).__name__ == 'ColumnarTimeGraphModel'
+        assert generic.model.rows[0].states[0].label == 'RUNNING'
+
+    def test_missing_model(self):
+        """Expect no model when the response has none."""
+        generic = GenericResponse({'status': 'RUNNING'}, ModelType.XY)
+        assert generic.model is None
+        assert generic.status == ResponseStatus.RUNNING
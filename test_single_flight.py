@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestSingleFlight class file."""
+
+import asyncio
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tsp.single_flight import SingleFlight, AsyncSingleFlight
+
+CALLERS = 5
+
+
+class TestSingleFlight:
+    """SingleFlight and AsyncSingleFlight test methods, needing no server."""
+
+    @staticmethod
+    def _wait_for(condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    def _share(self, single_flight, function):
+        """Call function once per caller while the first call is held in flight."""
+        release = threading.Event()
+        calls = []
+
+        def leader():
+            calls.append(1)
+            release.wait(5)
+            return function()
+
+        with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+            futures = [executor.submit(single_flight.do, 'key', leader)]
+            self._wait_for(lambda: calls)
+            futures += [executor.submit(single_flight.do, 'key', leader)
+                        for _ in range(CALLERS - 1)]
+            self._wait_for(lambda: single_flight.coalesced == CALLERS - 1)
+            release.set()
+        return futures, calls
+
+    def test_concurrent_calls_coalesced(self):
+        """Expect one call shared by all concurrent callers of a key."""
+        single_flight = SingleFlight()
+        result = object()
+        futures, calls = self._share(single_flight, lambda: result)
+        assert len(calls) == 1
+        assert all(future.result() is result for future in futures)
+
+        # Once done, the next call of the key is made again
+        assert single_flight.do('key', lambda: 1) == 1
+        assert single_flight.coalesced == CALLERS - 1
+
+    def test_exception_shared(self):
+        """Expect the exception of the shared call raised to every caller."""
+        def fail():
+            raise ValueError('failed')
+
+        futures, calls = self._share(SingleFlight(), fail)
+        assert len(calls) == 1
+        for future in futures:
+            with pytest.raises(ValueError, match='failed'):
+                future.result()
+
+    def test_distinct_keys_not_coalesced(self):
+        """Expect calls of different keys made separately."""
+        single_flight = SingleFlight()
+        assert [single_flight.do(key, lambda key=key: key) for key in range(3)] == [0, 1, 2]
+        assert single_flight.coalesced == 0
+
+    def test_async_concurrent_calls_coalesced(self):
+        """Expect one coroutine call shared by all concurrent awaiters of a key."""
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        async def gather():
+            return await asyncio.gather(*[single_flight.do('key', call) for _ in range(CALLERS)])
+
+        assert asyncio.run(gather()) == ['result'] * CALLERS
+        assert len(calls) == 1
+        assert single_flight.coalesced == CALLERS - 1
+
+    def test_async_exception_shared(self):
+        """Expect the exception of the shared coroutine call raised to every awaiter."""
+        single_flight = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError('failed')
+
+        async def gather():
+            return await asyncio.gather(*[single_flight.do('key', fail) for _ in range(CALLERS)],
+                                        return_exceptions=True)
+
+        results = asyncio.run(gather())
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.coalesced == CALLERS - 1
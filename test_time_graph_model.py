@@ -0,0 +1,75 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestTimeGraphModel class file."""
+
+import pytest
+
+from tsp.time_graph_model import TimeGraphModel, ColumnarTimeGraphModel
+
+STATES = {
+    'rows': [
+        {'entryId': 1, 'states': [
+            {'start': 0, 'end': 10, 'label': 'RUNNING', 'values': 2, 'tags': 1,
+             'style': {'parentKey': 'running'}},
+            {'start': 10, 'end': 20, 'values': None, 'tags': None},
+            {'start': 20, 'end': 30, 'label': 'RUNNING', 'style': {'parentKey': 'running'}}]},
+        {'entryId': 2, 'states': []},
+        {'entryId': 3, 'states': [
+            {'start': 5, 'end': 15, 'label': None, 'values': 0, 'style': None}]},
+        # Without an entry id, explicitly null or not
+        {'entryId': None, 'states': [{'start': 0, 'end': 5}]},
+        {'states': []}
+    ]
+}
+
+
+def _states(rows):
+    return [[(state.start_time, state.end_time, state.label, state.value, state.tags, state.style)
+             for state in row.states] for row in rows]
+
+
+class TestTimeGraphModel:
+    """Object and columnar time graph models test methods, needing no server."""
+
+    def test_columnar_rows(self):
+        """Expect the columnar model rows to be the object model ones, null values included."""
+        pytest.importorskip('numpy')
+        model = ColumnarTimeGraphModel(STATES)
+        expected = TimeGraphModel(STATES).rows
+        assert len(model) == 5
+        assert model.row_offsets.tolist() == [0, 3, 3, 4, 5, 5]
+        # Rows without an entry id are built without one, as missing ones are
+        entry_ids = [getattr(row, 'entry_id', None) for row in model.rows]
+        assert entry_ids == [1, 2, 3, None, None]
+        assert entry_ids == [getattr(row, 'entry_id', None) for row in expected]
+        assert not hasattr(model.rows[3], 'entry_id')
+        assert _states(model.rows) == _states(expected)
+
+    def test_columnar_dictionaries(self):
+        """Expect repeated labels and styles stored once, and none coded as -1."""
+        pytest.importorskip('numpy')
+        model = ColumnarTimeGraphModel(STATES)
+        assert model.label_dictionary == ['RUNNING']
+        assert model.label_codes.tolist() == [0, -1, 0, -1, -1]
+        assert model.style_dictionary == [{'parentKey': 'running'}]
+        assert model.style_codes.tolist() == [0, -1, 0, -1, -1]
@@ -0,0 +1,158 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestTreeModel class file."""
+
+import io
+
+import tree_model
+
+from tree_model import TreeModel
+from tsp.entry import Entry, EntryHeader
+
+HEADERS = [EntryHeader({'name': 'Name'}), EntryHeader({'name': 'Count'})]
+
+
+def _entries(*links):
+    return [Entry({'id': entry_id, 'parentId': parent_id, 'labels': [f'entry {entry_id}']})
+            for entry_id, parent_id in links]
+
+
+def _table():
+    return [Entry({'id': 1, 'parentId': -1, 'labels': ['root', '10']}),
+            Entry({'id': 2, 'parentId': 1, 'labels': ['child', '2']}),
+            Entry({'id': 3, 'parentId': 2, 'labels': ['leaf']}),
+            Entry({'id': 4, 'parentId': -1, 'labels': ['other', '1']})]
+
+
+def _print(model, **limits):
+    out = io.StringIO()
+    model.print(out=out, **limits)
+    return out.getvalue().splitlines()
+
+
+def _ids(items):
+    return [item.get_entry().id for item in items]
+
+
+class TestTreeModel:
+    """TreeModel lookup, linking and rendering test methods, needing no server."""
+
+    def test_children_before_parents(self):
+        """Expect children listed before their parent to be linked to it."""
+        model = TreeModel(_entries((3, 2), (2, 1), (4, 1), (1, -1)))
+        assert _ids(model.find_by_id(1).get_children()) == [2, 4]
+        assert _ids(model.find_by_id(2).get_children()) == [3]
+        assert _ids(model.subtree(1)) == [1, 2, 3, 4]
+
+    def test_orphans_and_self_parents(self):
+        """Expect entries with an unknown parent or themselves as parent at the top level."""
+        model = TreeModel(_entries((1, -1), (2, 99), (3, 3), (4, 2)))
+        top = model.find_by_id(1).get_parent()
+        assert _ids(top.get_children()) == [1, 2, 3]
+        assert model.find_by_id(2).get_parent() is top
+        assert model.find_by_id(3).get_parent() is top
+
+    def test_repeated_id(self):
+        """Expect a repeated entry id to keep its first entry."""
+        entries = _entries((1, -1), (2, 1), (2, -1))
+        model = TreeModel(entries)
+        assert model.find_by_id(2).get_entry() is entries[1]
+        assert _ids(model.subtree(1)) == [1, 2]
+
+    def test_find_by_id(self):
+        """Expect the item of a known id, None otherwise."""
+        model = TreeModel(_entries((1, -1), (2, 1)))
+        assert model.find_by_id(2).get_entry().labels == ['entry 2']
+        assert model.find_by_id(5) is None
+
+    def test_subtree(self):
+        """Expect an item and its descendants depth first, nothing for an unknown id."""
+        model = TreeModel(_entries((1, -1), (2, 1), (3, 2), (4, 1), (5, -1)))
+        assert _ids(model.subtree(1)) == [1, 2, 3, 4]
+        assert _ids(model.subtree(2)) == [2, 3]
+        assert _ids(model.subtree(5)) == [5]
+        assert not model.subtree(6)
+
+    def test_path_to_root(self):
+        """Expect an item then its ancestors, without the root."""
+        model = TreeModel(_entries((1, -1), (2, 1), (3, 2)))
+        assert _ids(model.path_to_root(3)) == [3, 2, 1]
+        assert _ids(model.path_to_root(1)) == [1]
+        assert not model.path_to_root(6)
+
+    def test_parent_cycle(self):
+        """Expect lookups on entries that are each other's parent to end."""
+        model = TreeModel(_entries((1, 2), (2, 1), (3, -1)))
+        assert _ids(model.subtree(1)) == [1, 2]
+        assert _ids(model.subtree(2)) == [2, 1]
+        assert _ids(model.path_to_root(1)) == [1, 2]
+
+    def test_print_with_headers(self):
+        """Expect aligned columns under the headers, single-label entries included."""
+        assert _print(TreeModel(_table(), HEADERS)) == [
+            'Name           Count',
+            '-------------  -----',
+            'root           10',
+            '  |____child   2',
+            '  | |____leaf',
+            'other          1'
+        ]
+
+    def test_print_without_headers(self):
+        """Expect single-label entries with their id and parent id, and no header rows."""
+        assert _print(TreeModel(_table())) == [
+            'root                       10',
+            '  |____child               2',
+            '  | |____leaf (leaf, 3) 2',
+            'other                      1'
+        ]
+
+    def test_print_max_depth(self):
+        """Expect no row deeper than max_depth, and columns sized for the rows printed."""
+        assert _print(TreeModel(_table(), HEADERS), max_depth=0) == [
+            'Name   Count', '-----  -----', 'root   10', 'other  1'
+        ]
+        assert _print(TreeModel(_table(), HEADERS), max_depth=1)[2:] == [
+            'root          10', '  |____child  2', 'other         1'
+        ]
+
+    def test_print_max_rows(self):
+        """Expect at most max_rows rows, then a note when rows were left out."""
+        assert _print(TreeModel(_table(), HEADERS), max_rows=2)[2:] == [
+            'root          10', '  |____child  2', '... (more than 2 rows)'
+        ]
+        assert _print(TreeModel(_table(), HEADERS), max_rows=4)[-1] == 'other          1'
+
+    def test_print_in_chunks(self, monkeypatch):
+        """Expect rows written in chunks of ROW_CHUNK_SIZE, each ending with its last row."""
+        monkeypatch.setattr(tree_model, 'ROW_CHUNK_SIZE', 3)
+        entries = [Entry({'id': entry_id, 'parentId': -1, 'labels': [f'e{entry_id}', '0']})
+                   for entry_id in range(7)]
+        out = io.StringIO()
+        writes = []
+        monkeypatch.setattr(out, 'write', lambda text: writes.append(text) or len(text))
+        TreeModel(entries, HEADERS).print(out=out)
+        rows = writes[2:]
+        assert [chunk.count('\n') for chunk in rows] == [3, 3, 1]
+        assert all(chunk.endswith('\n') for chunk in rows)
+        assert ''.join(rows).splitlines() == [f'e{entry_id}    0' for entry_id in range(7)]
@@ -22,16 +22,19 @@
 
 """TestTspClient class file."""
 
+import asyncio
 import os
-import time
 import uuid
 
 import pytest
 import requests
 
+from tsp.deadline import deadline, DeadlineExceeded
 from tsp.health import HealthStatus
-from tsp.response import ResponseStatus
+from tsp.indexing_status import IndexingStatus
 from tsp.tsp_client import TspClient
+from tsp.async_tsp_client import AsyncTspClient
+from tsp.response_cache import ResponseCache
 from tsp.virtual_table_tag import VirtualTableTag
 from tsp.configuration_source import ConfigurationSource
 from tsp.configuration_source_set import ConfigurationSourceSet
@@ -145,6 +148,25 @@ class TestTspClient:
         assert response.status_code == 200
         assert not response.model.traces
 
+    def test_fetch_with_pooled_client(self):
+        """Expect a closable client with a bounded pool to respond with no traces"""
+        with TspClient('http://localhost:8080/tsp/api/', pool_connections=1,
+                       pool_maxsize=2) as tsp_client:
+            for _ in range(3):
+                response = tsp_client.fetch_traces()
+                assert response.status_code == 200
+                assert not response.model.traces
+
+    def test_fetch_with_async_client(self):
+        """Expect concurrent async requests to all respond with no traces"""
+        async def fetch_all():
+            async with AsyncTspClient('http://localhost:8080/tsp/api/') as tsp_client:
+                return await asyncio.gather(*[tsp_client.fetch_traces() for _ in range(5)])
+
+        for response in asyncio.run(fetch_all()):
+            assert response.status_code == 200
+            assert not response.model.traces
+
     def test_fetch_traces_none(self):
         """Expect no traces without opening any."""
         response = self.tsp_client.fetch_traces()
@@ -173,6 +195,21 @@ class TestTspClient:
         assert response.model.UUID == expected_uuid
         self._delete_traces()
 
+    def test_open_traces_await_indexing(self, kernel, other):
+        """Expect both traces opened concurrently, then indexed."""
+        paths = [kernel, other]
+        responses = self.tsp_client.open_traces([os.path.basename(path) for path in paths], paths)
+        assert [response.status_code for response in responses] == [200, 200]
+
+        progress = []
+        responses = self.tsp_client.await_indexing(
+            [response.model.UUID for response in responses], timeout=60,
+            progress=lambda done, total: progress.append((done, total)))
+        statuses = [response.model.indexing_status for response in responses]
+        assert statuses == [IndexingStatus.COMPLETED] * 2
+        assert progress == [(1, 2), (2, 2)]
+        self._delete_traces()
+
     def test_opened_trace_deleted(self, kernel):
         """Expect no trace after deletion."""
         response = self.tsp_client.open_trace(os.path.basename(kernel), kernel)
@@ -300,6 +337,26 @@ class TestTspClient:
         response = self.tsp_client.fetch_experiment(experiment_uuid)
         assert response.status_code == 404
 
+    def test_bulk_deleted(self, kernel, other):
+        """Expect experiments then traces deleted in bulk, and unknown ones reported."""
+        traces = [self.tsp_client.open_trace(os.path.basename(path), path).model.UUID
+                  for path in [kernel, other]]
+        response = self.tsp_client.open_experiment(os.path.basename(kernel), traces)
+        assert response.status_code == 200
+        experiment_uuid = response.model.UUID
+
+        result = self.tsp_client.delete_experiments(name=os.path.basename(kernel))
+        assert [experiment.UUID for experiment in result.deleted] == [experiment_uuid]
+        assert not result.failures
+
+        unknown = str(uuid.uuid4())
+        result = self.tsp_client.delete_traces(traces + [unknown])
+        assert [trace.UUID for trace in result.deleted] == traces
+        assert list(result.failures) == [unknown]
+
+        response = self.tsp_client.fetch_traces()
+        assert not response.model.traces
+
     def test_fetch_experiment_outputs(self, kernel):
         """Expect some experiment outputs."""
         traces = []
@@ -423,13 +480,9 @@ class TestTspClient:
 
         response = self.tsp_client.fetch_experiment_outputs(experiment_uuid)
         output_id = response.model.descriptors[0].id
-        status = ResponseStatus.RUNNING
-        while status == ResponseStatus.RUNNING:
-            time.sleep(1)
-            response = self.tsp_client.fetch_xy_tree(
-                experiment_uuid, output_id)
-            assert response.model is not None
-            status = response.model.status
+        response = self.tsp_client.await_completion(
+            self.tsp_client.fetch_xy_tree, experiment_uuid, output_id)
+        assert response.model is not None
 
         params = self.__requested_parameters(response)
         response = self.tsp_client.fetch_xy(experiment_uuid, output_id, params)
@@ -438,6 +491,55 @@ class TestTspClient:
         self._delete_experiments()
         self._delete_traces()
 
+    def test_fetch_xy_cached(self, kernel):
+        """Expect repeated completed XY queries to be served from the cache until deletion."""
+        tsp_client = TspClient('http://localhost:8080/tsp/api/', cache=ResponseCache())
+        experiment_uuid = self._open_experiment(kernel)
+        output_id, params = self.__xy_parameters(experiment_uuid, tsp_client)
+
+        response = tsp_client.fetch_xy(experiment_uuid, output_id, params)
+        assert response.status_code == 200
+        hits = tsp_client.cache.hits
+        assert tsp_client.fetch_xy(experiment_uuid, output_id, params) is response
+        assert tsp_client.cache.hits == hits + 1
+
+        tsp_client.delete_experiment(experiment_uuid)
+        assert tsp_client.fetch_xy(experiment_uuid, output_id, params) is not response
+        self._delete_experiments()
+        self._delete_traces()
+
+    def test_fetch_xy_cached_until_trace_deleted(self, kernel):
+        """Expect cached responses dropped once a trace is deleted."""
+        tsp_client = TspClient('http://localhost:8080/tsp/api/', cache=ResponseCache())
+        experiment_uuid = self._open_experiment(kernel)
+        self.__xy_parameters(experiment_uuid, tsp_client)
+        assert len(tsp_client.cache) == 1
+
+        # The experiment is deleted by another client, which this cache cannot see
+        self._delete_experiments()
+        trace_uuid = self.tsp_client.fetch_traces().model.traces[0].UUID
+        response = tsp_client.delete_trace(trace_uuid, False)
+        assert response.status_code == 200
+        assert not tsp_client.cache
+        self._delete_traces()
+
+    def test_fetch_xy_columnar(self, kernel):
+        """Expect columnar XY series to hold the same values as the list ones."""
+        experiment_uuid = self._open_experiment(kernel)
+        output_id, params = self.__xy_parameters(experiment_uuid)
+
+        tsp_client = TspClient('http://localhost:8080/tsp/api/', columnar=True)
+        columnar = tsp_client.fetch_xy(experiment_uuid, output_id, params)
+        response = self.tsp_client.fetch_xy(experiment_uuid, output_id, params)
+        assert columnar.status_code == 200
+        for series, expected in zip(columnar.model.model.series, response.model.model.series):
+            assert series.x_values.tolist() == expected.x_values
+            assert series.y_values.tolist() == expected.y_values
+            start, end = expected.x_values[0], expected.x_values[-1]
+            assert series.slice_time(start, end)[0].tolist() == expected.slice_time(start, end)[0]
+        self._delete_experiments()
+        self._delete_traces()
+
     def test_fetch_timegraph_tree_complete(self, kernel):
         """Expect completing timegraph tree."""
         traces = []
@@ -450,13 +552,9 @@ class TestTspClient:
 
         response = self.tsp_client.fetch_experiment_outputs(experiment_uuid)
         output_id = response.model.descriptors[0].id
-        status = ResponseStatus.RUNNING
-        while status == ResponseStatus.RUNNING:
-            time.sleep(1)
-            response = self.tsp_client.fetch_timegraph_tree(
-                experiment_uuid, output_id)
-            assert response.model is not None
-            status = response.model.status
+        response = self.tsp_client.await_completion(
+            self.tsp_client.fetch_timegraph_tree, experiment_uuid, output_id)
+        assert response.model is not None
 
         params = self.__requested_parameters(response)
         response = self.tsp_client.fetch_timegraph_tree(
@@ -475,13 +573,10 @@ class TestTspClient:
         assert response.status_code == 200
         experiment_uuid = response.model.UUID
 
-        status = ResponseStatus.RUNNING
-        while status == ResponseStatus.RUNNING:
-            time.sleep(1)
-            response = self.tsp_client.fetch_virtual_table_columns(
-                exp_uuid=experiment_uuid, output_id=TABLE_DP_ID)
-            assert response.model is not None
-            status = response.model.status
+        response = self.tsp_client.await_completion(
+            self.tsp_client.fetch_virtual_table_columns, exp_uuid=experiment_uuid,
+            output_id=TABLE_DP_ID)
+        assert response.model is not None
 
         output_id = TABLE_DP_ID
         response = self.tsp_client.fetch_virtual_table_columns(exp_uuid=experiment_uuid, output_id=output_id)
@@ -505,13 +600,10 @@ class TestTspClient:
         assert response.status_code == 200
         experiment_uuid = response.model.UUID
 
-        status = ResponseStatus.RUNNING
-        while status == ResponseStatus.RUNNING:
-            time.sleep(1)
-            response = self.tsp_client.fetch_virtual_table_columns(
-                exp_uuid=experiment_uuid, output_id=TABLE_DP_ID)
-            assert response.model is not None
-            status = response.model.status
+        response = self.tsp_client.await_completion(
+            self.tsp_client.fetch_virtual_table_columns, exp_uuid=experiment_uuid,
+            output_id=TABLE_DP_ID)
+        assert response.model is not None
 
         output_id = TABLE_DP_ID
         response = self.tsp_client.fetch_virtual_table_columns(exp_uuid=experiment_uuid, output_id=output_id)
@@ -546,6 +638,19 @@ class TestTspClient:
                 assert cell.content is not None
                 assert cell.tags == VirtualTableTag.NO_TAGS
 
+    def test_iter_virtual_table_lines(self, ust):
+        """Expect paging through the whole virtual table in index order."""
+        experiment_uuid = self._open_experiment(ust)
+        response = self.tsp_client.await_completion(self.tsp_client.fetch_virtual_table_columns,
+                                                    experiment_uuid, TABLE_DP_ID)
+        assert response.model is not None
+
+        lines = self.tsp_client.iter_virtual_table_lines(experiment_uuid, TABLE_DP_ID, page_size=7)
+        indexes = [line.index for line in lines]
+        assert indexes == list(range(lines.size))
+        self._delete_experiments()
+        self._delete_traces()
+
     def test_fetch_timegraph_states(self, kernel):
         """Expect having states after tree is complete"""
         traces = []
@@ -558,13 +663,9 @@ class TestTspClient:
 
         response = self.tsp_client.fetch_experiment_outputs(experiment_uuid)
         output_id = TIMEGRAPH_DP_ID
-        status = ResponseStatus.RUNNING
-        while status == ResponseStatus.RUNNING:
-            time.sleep(1)
-            response = self.tsp_client.fetch_timegraph_tree(
-                experiment_uuid, output_id)
-            assert response.model is not None
-            status = response.model.status
+        response = self.tsp_client.await_completion(
+            self.tsp_client.fetch_timegraph_tree, experiment_uuid, output_id)
+        assert response.model is not None
         entries = [entry.id for entry in response.model.model.entries if entry.has_row_model]
         params = {
             TspClient.REQUESTED_TIME_RANGE_KEY: {
@@ -585,6 +686,43 @@ class TestTspClient:
         self._delete_experiments()
         self._delete_traces()
 
+    def test_fetch_timegraph_states_columnar(self, kernel):
+        """Expect columnar states to hold the same states as the object ones."""
+        experiment_uuid = self._open_experiment(kernel)
+        params = self.__states_parameters(experiment_uuid)
+
+        tsp_client = TspClient('http://localhost:8080/tsp/api/', columnar=True)
+        columnar = tsp_client.fetch_timegraph_states(experiment_uuid, TIMEGRAPH_DP_ID, params)
+        response = self.tsp_client.fetch_timegraph_states(experiment_uuid, TIMEGRAPH_DP_ID, params)
+        assert columnar.status_code == 200
+        model = columnar.model.model
+        assert len(model) == len(response.model.model.rows)
+        assert model.row_offsets[-1] == len(model.start_times)
+        for row, expected in zip(model.rows, response.model.model.rows):
+            assert row.entry_id == expected.entry_id
+            assert [(state.start_time, state.end_time) for state in row.states] == \
+                [(state.start_time, state.end_time) for state in expected.states]
+        self._delete_experiments()
+        self._delete_traces()
+
+    def test_stream_timegraph_states(self, kernel):
+        """Expect streamed rows to be the fetched ones."""
+        experiment_uuid = self._open_experiment(kernel)
+        params = self.__states_parameters(experiment_uuid)
+
+        response = self.tsp_client.fetch_timegraph_states(experiment_uuid, TIMEGRAPH_DP_ID, params)
+        rows = []
+        streamed = self.tsp_client.stream_timegraph_states(experiment_uuid, TIMEGRAPH_DP_ID, params,
+                                                           callback=rows.append)
+        assert streamed.status_code == 200
+        assert streamed.model.status == response.model.status
+        assert [row.entry_id for row in rows] == \
+            [row.entry_id for row in response.model.model.rows]
+        assert sum(len(row.states) for row in rows) == \
+            sum(len(row.states) for row in response.model.model.rows)
+        self._delete_experiments()
+        self._delete_traces()
+
     def test_fetch_timegraph_arrows(self, kernel):
         """Expect having arrows after tree is complete"""
         traces = []
@@ -597,13 +735,9 @@ class TestTspClient:
 
         response = self.tsp_client.fetch_experiment_outputs(experiment_uuid)
         output_id = TIMEGRAPH_DP_ID
-        status = ResponseStatus.RUNNING
-        while status == ResponseStatus.RUNNING:
-            time.sleep(1)
-            response = self.tsp_client.fetch_timegraph_tree(
-                experiment_uuid, output_id)
-            assert response.model is not None
-            status = response.model.status
+        response = self.tsp_client.await_completion(
+            self.tsp_client.fetch_timegraph_tree, experiment_uuid, output_id)
+        assert response.model is not None
 
         entries = [entry.id for entry in response.model.model.entries if entry.has_row_model]
         params = {
@@ -787,6 +921,16 @@ class TestTspClient:
         assert response.model
         assert response.model.status == HealthStatus.UP
 
+    def test_fetch_health_within_deadline(self):
+        """Expect a health response within a budget, and none once it is spent"""
+        with deadline(10):
+            response = self.tsp_client.fetch_health()
+            assert response.status_code == 200
+
+        with deadline(0):
+            with pytest.raises(DeadlineExceeded):
+                self.tsp_client.fetch_health()
+
     def test_fetch_identifier(self):
         """Expect a successful identifier response"""
         response = self.tsp_client.fetch_identifier()
@@ -804,6 +948,37 @@ class TestTspClient:
         assert response.model.product_id
         assert response.model.tsp_version
 
+    def _open_experiment(self, path):
+        """Open the trace at path in an experiment of the same name, returning its UUID."""
+        response = self.tsp_client.open_trace(os.path.basename(path), path)
+        response = self.tsp_client.open_experiment(os.path.basename(path), [response.model.UUID])
+        assert response.status_code == 200
+        return response.model.UUID
+
+    def __xy_parameters(self, experiment_uuid, tsp_client=None):
+        """Complete the XY tree of the first output, returning that output and its XY query."""
+        tsp_client = tsp_client or self.tsp_client
+        response = tsp_client.fetch_experiment_outputs(experiment_uuid)
+        output_id = response.model.descriptors[0].id
+        response = tsp_client.await_completion(tsp_client.fetch_xy_tree, experiment_uuid, output_id)
+        assert response.model is not None
+        return output_id, self.__requested_parameters(response)
+
+    def __states_parameters(self, experiment_uuid):
+        """Complete the thread status tree, returning the states query of its rows."""
+        response = self.tsp_client.await_completion(self.tsp_client.fetch_timegraph_tree,
+                                                    experiment_uuid, TIMEGRAPH_DP_ID)
+        assert response.model is not None
+        entries = [entry.id for entry in response.model.model.entries if entry.has_row_model]
+        return {TspClient.PARAMETERS_KEY: {
+            TspClient.REQUESTED_TIME_RANGE_KEY: {
+                TspClient.REQUESTED_TIME_RANGE_NUM_TIMES_KEY: 100,
+                TspClient.REQUESTED_TIME_RANGE_START_KEY: REQUESTED_TIME_START,
+                TspClient.REQUESTED_TIME_RANGE_END_KEY: REQUESTED_TIME_END
+            },
+            TspClient.REQUESTED_ITEM_KEY: entries
+        }}
+
     @staticmethod
     def __requested_parameters(response):
         parameters = {}
@@ -0,0 +1,220 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestTspCliClient class file."""
+
+import importlib.machinery
+import importlib.util
+import json
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tsp.deadline import bind_context
+from tsp.output_descriptor import OutputDescriptor
+from tsp.tsp_client_response import TspClientResponse
+
+CLI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tsp_cli_client")
+LISTED_TRACE = "Successfully listed trace\n-------------------------\ntrace {0}\n"
+
+
+def _load_cli():
+    loader = importlib.machinery.SourceFileLoader("tsp_cli_client", CLI_PATH)
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+# pylint: disable=too-few-public-methods
+class DescriptorClient:
+    """Client answering output descriptors, final once computed, without a server."""
+
+    def __init__(self, final, base_url="http://localhost:8080/tsp/api/"):
+        self.final = final
+        self.base_url = base_url
+        self.fetches = 0
+
+    def fetch_experiment_output(self, exp_uuid, output_id):
+        """Return the descriptor of the output."""
+        self.fetches += 1
+        descriptor = OutputDescriptor({"id": output_id, "name": f"{exp_uuid} {self.fetches}",
+                                       "final": self.final})
+        return TspClientResponse(descriptor, 200, "")
+
+
+class PrintedModel:
+    """Model printing its name, as the trace models do."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def print(self):
+        """Print the name."""
+        print(self.name)
+
+
+class BatchClient:
+    """Client answering the batch test commands, without a server."""
+
+    @staticmethod
+    def fetch_trace(uuid):
+        """Return a trace after a delay of uuid hundredths of a second."""
+        time.sleep(int(uuid) / 100)
+        return TspClientResponse(PrintedModel(f"trace {uuid}"), 200, "")
+
+    @staticmethod
+    def fetch_health():
+        """Return the health, printing from a worker thread as await_indexing does."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(bind_context(print), "from a worker").result()
+        return TspClientResponse("UP", 200, "")
+
+
+class TestTspCliClient:
+    """CLI helper test methods, needing no server."""
+
+    @pytest.fixture(name="cli")
+    def fixture_cli(self):
+        """Load the CLI script as a module."""
+        return _load_cli()
+
+    @pytest.fixture(name="batch")
+    def fixture_batch(self, cli, tmp_path, capsys):
+        """Run the lines of a batch, returning its status and results."""
+        cli.tsp_client = BatchClient()
+        parser = getattr(cli, "__create_parser")()
+
+        def batch(lines, *arguments):
+            path = tmp_path / "batch.txt"
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            options = parser.parse_args(["--batch", str(path), "--port", "9090", *arguments])
+            status = getattr(cli, "__run_batch")(parser, options)
+            return status, [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        return batch
+
+    def test_batch_results_in_order(self, batch):
+        """Expect one result per command, in input order, whatever their durations."""
+        status, results = batch(["--list-trace 20", "", "# comment", '["--list-trace", "1"]',
+                                 '{"list-trace": 10}'], "--concurrency", "3")
+        assert status == 0
+        assert [(result["line"], result["status"], result["output"]) for result in results] == [
+            (1, 0, LISTED_TRACE.format(20)), (4, 0, LISTED_TRACE.format(1)),
+            (5, 0, LISTED_TRACE.format(10))
+        ]
+
+    def test_batch_worker_prints(self, batch):
+        """Expect what the workers of a command print in the result of that command."""
+        status, results = batch(["--get-health", "--list-trace 1"], "--concurrency", "2")
+        assert status == 0
+        assert [result["output"] for result in results] == ["from a worker\nUP\n",
+                                                           LISTED_TRACE.format(1)]
+
+    @pytest.mark.parametrize("line, error", [
+        ("--ip other --get-health", "--ip applies to the whole batch"),
+        ("--port 8080 --get-health", "--port applies to the whole batch"),
+        ('{"cache": true, "get-health": true}', "--cache applies to the whole batch"),
+        ("--cache-dir /tmp --get-health", "--cache-dir applies to the whole batch"),
+        ("--cache-ttl 0 --get-health", "--cache-ttl applies to the whole batch"),
+        ("--batch other.txt", "--batch is not available in a batch"),
+        ('["--daemon"]', "--daemon is not available in a batch"),
+        ("--stop-daemon", "--stop-daemon is not available in a batch"),
+        ("--unknown", "unrecognized arguments: --unknown"),
+        ("--list-trace 'unterminated", "No closing quotation"),
+        ("[1, ", "Expecting value")
+    ])
+    def test_batch_invalid_line(self, batch, line, error):
+        """Expect an error result for invalid lines and lines of batch or mode options."""
+        status, results = batch([line, "--list-trace 1"])
+        assert status == 1
+        assert results[0]["status"] == 2
+        assert error in results[0]["output"]
+        assert results[1]["output"] == LISTED_TRACE.format(1)
+
+    def test_batch_options_given_to_commands(self, cli):
+        """Expect the commands of a batch to run with the server options of the batch."""
+        parser = getattr(cli, "__create_parser")()
+        options = parser.parse_args(["--batch", "--port", "9090", "--cache", "--cache-ttl", "5"])
+        command = getattr(cli, "__parse_batch_line")(parser, options, "--get-health")[0]
+        assert (command.port, command.ip_address, command.cache, command.cache_ttl) == \
+            ("9090", "localhost", True, 5)
+        assert command.get_health and not command.batch and not command.daemon
+
+    def test_batch_missing_file(self, cli, tmp_path, capsys):
+        """Expect a usage error for a batch file that cannot be read."""
+        parser = getattr(cli, "__create_parser")()
+        options = parser.parse_args(["--batch", str(tmp_path / "missing.txt")])
+        with pytest.raises(SystemExit) as exit_info:
+            getattr(cli, "__run_batch")(parser, options)
+        assert exit_info.value.code == 2
+        assert "can't open" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("final, fetches", [(True, 1), (False, 2)])
+    def test_descriptors_memoized_once_final(self, cli, final, fetches):
+        """Expect only final output descriptors to be reused by the next commands."""
+        cli.tsp_client = DescriptorClient(final)
+        get_descriptor = getattr(cli, "__get_descriptor")
+        first = get_descriptor("experiment", "output")
+        second = get_descriptor("experiment", "output")
+        assert cli.tsp_client.fetches == fetches
+        assert (second is first) == final
+        assert second.name == f"experiment {fetches}"
+
+    def test_forgotten_descriptors(self, cli):
+        """Expect the descriptors of a deleted experiment to be fetched again."""
+        cli.tsp_client = DescriptorClient(True)
+        get_descriptor = getattr(cli, "__get_descriptor")
+        get_descriptor("experiment", "output")
+        get_descriptor("other", "output")
+        getattr(cli, "__forget_descriptors")("experiment")
+        get_descriptor("experiment", "output")
+        get_descriptor("other", "output")
+        assert cli.tsp_client.fetches == 3
+
+    def test_descriptors_by_server(self, cli):
+        """Expect the descriptors of an experiment on another server to be fetched."""
+        get_descriptor = getattr(cli, "__get_descriptor")
+        cli.tsp_client = first = DescriptorClient(True)
+        get_descriptor("experiment", "output")
+        cli.tsp_client = second = DescriptorClient(True, "http://localhost:8081/tsp/api/")
+        get_descriptor("experiment", "output")
+        getattr(cli, "__forget_descriptors")("experiment")
+        cli.tsp_client = first
+        get_descriptor("experiment", "output")
+        assert (first.fetches, second.fetches) == (1, 1)
+
+    def test_descriptors_expire(self, cli, monkeypatch):
+        """Expect descriptors to be fetched again once their time to live has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(cli.time, "monotonic", lambda: now[0])
+        cli.tsp_client = DescriptorClient(True)
+        get_descriptor = getattr(cli, "__get_descriptor")
+        get_descriptor("experiment", "output")
+        now[0] += cli.DESCRIPTOR_TTL - 1
+        get_descriptor("experiment", "output")
+        assert cli.tsp_client.fetches == 1
+        now[0] += 1
+        assert get_descriptor("experiment", "output").name == "experiment 2"
+        assert len(cli.DESCRIPTORS) == 1
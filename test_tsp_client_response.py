@@ -0,0 +1,103 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestTspClientResponse class file."""
+
+import pytest
+import requests
+
+from tsp.trace import Trace
+from tsp.tsp_client import TspClient
+from tsp.tsp_client_response import TspClientResponse
+
+TRACE = '{"UUID": "trace", "name": "café", "start": 1, "end": 2}'.encode('utf-8')
+
+
+class BodySession:
+    """Session answering every GET with one status and body, without a server."""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    def get(self, url, **kwargs):  # pylint: disable=unused-argument
+        """Return the response, whatever the URL."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.encoding = 'utf-8'
+        response._content = self.content  # pylint: disable=protected-access
+        return response
+
+    def close(self):
+        """Close nothing."""
+
+
+def _client(status_code, content, retain_body=True):
+    client = TspClient('http://localhost:0/tsp/api/', retain_body=retain_body)
+    client._session = BodySession(status_code, content)  # pylint: disable=protected-access
+    return client
+
+
+class TestTspClientResponse:
+    """TspClientResponse lazy status text test methods, needing no server."""
+
+    def test_bytes_decoded_on_read(self):
+        """Expect a bytes body to be decoded as UTF-8 only once read."""
+        response = TspClientResponse(None, 200, TRACE)
+        assert response._status_text is TRACE  # pylint: disable=protected-access
+        status_text = response.status_text
+        assert status_text == TRACE.decode('utf-8')
+        assert response.status_text is status_text
+
+    def test_invalid_bytes_replaced(self):
+        """Expect invalid UTF-8 to be replaced rather than raise."""
+        assert TspClientResponse(None, 200, b'ok \xff').status_text == 'ok �'
+
+    @pytest.mark.parametrize('status_text', ['café', '', None])
+    def test_str_unchanged(self, status_text):
+        """Expect a str status text to be returned as is."""
+        assert TspClientResponse(None, 200, status_text).status_text == status_text
+
+    def test_setter(self):
+        """Expect a status text set to replace the body."""
+        response = TspClientResponse(None, 200, TRACE)
+        response.status_text = 'replaced'
+        assert response.status_text == 'replaced'
+
+    def test_client_retains_body(self):
+        """Expect a successful response to keep its raw body as status text."""
+        response = _client(200, TRACE).fetch_trace('trace')
+        assert isinstance(response.model, Trace)
+        assert response.model.name == 'café'
+        assert response.status_text == TRACE.decode('utf-8')
+
+    def test_client_drops_body(self):
+        """Expect no status text for a successful response without retain_body."""
+        response = _client(200, TRACE, retain_body=False).fetch_trace('trace')
+        assert response.model.name == 'café'
+        assert response.status_text == ''
+
+    def test_client_keeps_error_body(self):
+        """Expect an error response to keep its body even without retain_body."""
+        response = _client(404, b'No such trace', retain_body=False).fetch_trace('trace')
+        assert response.model is None
+        assert response.status_text == 'No such trace'
@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestVirtualTableExporter class file."""
+
+import csv
+import io
+import json
+
+import pytest
+import requests
+
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse
+from tsp.tsp_client import TspClient
+from tsp.tsp_client_response import TspClientResponse
+from tsp.virtual_table_export import VirtualTableExporter, CsvSink, NdjsonSink, ParquetSink
+
+TABLE_SIZE = 95
+COLUMNS = ['Timestamp', 'Event type']
+
+
+class TableClient(TspClient):
+    """TspClient answering from an in-memory virtual table, without a server."""
+
+    def __init__(self, missing=()):
+        super().__init__('http://localhost:0/tsp/api/')
+        self.missing = set(missing)
+
+    def fetch_virtual_table_columns(self, exp_uuid, output_id):
+        columns = [{'id': column_id, 'name': name, 'description': '', 'type': ''}
+                   for column_id, name in enumerate(COLUMNS)]
+        return TspClientResponse(GenericResponse({'model': columns, 'status': 'COMPLETED'},
+                                                 ModelType.VIRTUAL_TABLE_HEADER), 200, '')
+
+    def fetch_virtual_table_lines(self, exp_uuid, output_id, parameters=None):
+        query = parameters[TspClient.PARAMETERS_KEY]
+        index = query[TspClient.REQUESTED_TABLE_LINE_INDEX_KEY]
+        count = query[TspClient.REQUESTED_TABLE_LINE_COUNT_KEY]
+        lines = [{'index': line, 'cells': [{'content': str(line * 10)}, {'content': f'é{line}'}],
+                  'tags': 0}
+                 for line in range(index, min(index + count, TABLE_SIZE))
+                 if line not in self.missing]
+        model = {'size': TABLE_SIZE, 'lowIndex': index, 'columnIds': [0, 1], 'lines': lines}
+        return TspClientResponse(GenericResponse({'model': model, 'status': 'COMPLETED'},
+                                                 ModelType.VIRTUAL_TABLE), 200, '')
+
+
+class ClosingSink(NdjsonSink):
+    """NDJSON sink recording whether it was closed."""
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _exporter(client=None):
+    return VirtualTableExporter(client or TableClient(), 'experiment', 'table', workers=3,
+                                range_size=20, page_size=7)
+
+
+class TestVirtualTableExporter:
+    """VirtualTableExporter and sinks test methods, needing no server."""
+
+    def test_export_csv(self):
+        """Expect a header then every line, in index order."""
+        file = io.StringIO(newline='')
+        _exporter().export(CsvSink(file))
+        file.seek(0)
+        rows = list(csv.reader(file))
+        assert rows[0] == ['index'] + COLUMNS
+        assert rows[1:] == [[str(line), str(line * 10), f'é{line}'] for line in range(TABLE_SIZE)]
+
+    def test_export_ndjson(self):
+        """Expect one JSON object per line, in index order."""
+        file = io.StringIO()
+        _exporter().export(NdjsonSink(file))
+        objects = [json.loads(row) for row in file.getvalue().splitlines()]
+        assert objects == [{'index': line, 'cells': [str(line * 10), f'é{line}'], 'tags': 0}
+                           for line in range(TABLE_SIZE)]
+
+    def test_export_parquet(self, tmp_path):
+        """Expect one string column per table column, after the line index."""
+        parquet = pytest.importorskip('pyarrow.parquet')
+        path = str(tmp_path / 'table.parquet')
+        _exporter().export(ParquetSink(path))
+        table = parquet.read_table(path)
+        assert table.column_names == ['index'] + COLUMNS
+        assert table.column('index').to_pylist() == list(range(TABLE_SIZE))
+        assert table.column('Event type').to_pylist() == [f'é{line}' for line in range(TABLE_SIZE)]
+
+    def test_export_stats(self):
+        """Expect the statistics of each export to only count its own lines."""
+        exporter = _exporter()
+        for _ in range(2):
+            stats = exporter.export(NdjsonSink(io.StringIO()))
+            assert sum(worker.lines for worker in stats) == TABLE_SIZE
+            assert sum(worker.ranges for worker in stats) == 5
+
+    def test_export_missing_lines(self):
+        """Expect an export missing lines to fail, naming them, and to close its sink."""
+        sink = ClosingSink(io.StringIO())
+        with pytest.raises(requests.HTTPError, match='missing virtual table lines: 41 to 59'):
+            _exporter(TableClient(missing=range(41, 60))).export(sink)
+        assert sink.closed
@@ -0,0 +1,145 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""TestVirtualTablePager class file."""
+
+import pytest
+import requests
+
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse
+from tsp.tsp_client import TspClient
+from tsp.tsp_client_response import TspClientResponse
+from tsp.virtual_table_pager import VirtualTablePager, PageSizer
+
+TABLE_SIZE = 95
+
+
+class PageClient(TspClient):
+    """TspClient answering pages of an in-memory virtual table, without a server."""
+
+    def __init__(self, size=TABLE_SIZE, end=TABLE_SIZE, status_code=200):
+        super().__init__('http://localhost:0/tsp/api/')
+        self.size = size
+        self.end = end
+        self.status_code = status_code
+        self.queries = []
+
+    def fetch_virtual_table_lines(self, exp_uuid, output_id, parameters=None):
+        query = parameters[TspClient.PARAMETERS_KEY]
+        self.queries.append(query)
+        if self.status_code != 200:
+            return TspClientResponse(None, self.status_code, 'failed')
+        index = query[TspClient.REQUESTED_TABLE_LINE_INDEX_KEY]
+        count = query[TspClient.REQUESTED_TABLE_LINE_COUNT_KEY]
+        lines = [{'index': line, 'cells': [{'content': str(line)}], 'tags': 0}
+                 for line in range(index, min(index + count, self.end))]
+        model = {'size': self.size, 'lowIndex': index, 'columnIds': [0], 'lines': lines}
+        return TspClientResponse(GenericResponse({'model': model, 'status': 'COMPLETED'},
+                                                 ModelType.VIRTUAL_TABLE), 200, '')
+
+
+def _pager(client, parameters=None, prefetch=True):
+    return VirtualTablePager(client, 'experiment', 'table', parameters,
+                             PageSizer(10, 10, 10, None), prefetch)
+
+
+class TestVirtualTablePager:
+    """VirtualTablePager and PageSizer test methods, needing no server."""
+
+    def test_fixed_size(self):
+        """Expect the page size unchanged without a target time."""
+        sizer = PageSizer(1000, 100, 50000, None)
+        sizer.update(1000, 0.001)
+        assert sizer.size == 1000
+
+    @pytest.mark.parametrize('lines, seconds, expected', [
+        # Twice as fast as targeted
+        (1000, 0.25, 2000),
+        # At most doubled, or halved, per page
+        (1000, 0.01, 2000),
+        (1000, 10, 500),
+        (1000, 0.6, 833),
+        # Ignored, as not measured
+        (0, 0.5, 1000),
+        (1000, 0, 1000),
+    ])
+    def test_adaptive_size(self, lines, seconds, expected):
+        """Expect the page size to follow the throughput, gradually."""
+        sizer = PageSizer(1000, 100, 50000, 0.5)
+        sizer.update(lines, seconds)
+        assert sizer.size == expected
+
+    def test_size_bounds(self):
+        """Expect the page size to stay within its bounds."""
+        sizer = PageSizer(1000, 800, 1500, 0.5)
+        sizer.update(1000, 0.01)
+        assert sizer.size == 1500
+        for _ in range(3):
+            sizer.update(1000, 10)
+        assert sizer.size == 800
+
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test_iterate(self, prefetch):
+        """Expect every line once, in order, fetched page after page."""
+        client = PageClient()
+        pager = _pager(client, prefetch=prefetch)
+        assert pager.size is None
+        assert [line.index for line in pager] == list(range(TABLE_SIZE))
+        assert pager.size == TABLE_SIZE
+        assert [query[TspClient.REQUESTED_TABLE_LINE_INDEX_KEY]
+                for query in client.queries] == list(range(0, TABLE_SIZE, 10))
+
+    def test_lazy(self):
+        """Expect only the pages consumed, and the next one, to be fetched."""
+        client = PageClient()
+        lines = iter(_pager(client))
+        for _ in range(15):
+            next(lines)
+        assert len(client.queries) <= 3
+        lines.close()
+
+    def test_start_index(self):
+        """Expect the iteration to start from the requested index, keeping the query."""
+        client = PageClient()
+        parameters = {TspClient.PARAMETERS_KEY: {TspClient.REQUESTED_TABLE_LINE_INDEX_KEY: 90,
+                                                 'requested_table_column_ids': [0]}}
+        assert [line.index for line in _pager(client, parameters)] == list(range(90, 95))
+        assert client.queries[0]['requested_table_column_ids'] == [0]
+
+    def test_empty_table(self):
+        """Expect an empty table to yield no lines."""
+        assert not list(_pager(PageClient(size=0, end=0)))
+
+    def test_missing_lines(self):
+        """Expect an empty page before the end of the table to fail, naming the lines."""
+        lines = []
+        with pytest.raises(requests.HTTPError, match='missing virtual table lines: 30 to 94'):
+            for line in _pager(PageClient(end=30)):
+                lines.append(line.index)
+        assert lines == list(range(30))
+
+    def test_failed_page(self):
+        """Expect a failed page to raise."""
+        with pytest.raises(requests.HTTPError, match='500'):
+            list(_pager(PageClient(status_code=500)))
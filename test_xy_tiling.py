@@ -0,0 +1,146 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""TestXYTiling class file."""
+
+import pytest
+
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse, ResponseStatus
+from tsp.xy_tiling import tile_count, split_time_range, split_parameters, stitch_xy_responses
+
+START = 1000
+END = 100999
+
+
+def _samples(start, end, nb_times):
+    """Times sampled by the server over a range."""
+    if nb_times <= 1:
+        return [start]
+    return [start + (end - start) * index // (nb_times - 1) for index in range(nb_times)]
+
+
+def _response(times, status=ResponseStatus.COMPLETED, series_ids=(1, 2)):
+    """XY GenericResponse of one tile, as decoded from the server."""
+    series = [{'seriesName': f'series {series_id}', 'seriesId': series_id,
+               'xValues': times, 'yValues': [float(time * series_id) for time in times]}
+              for series_id in series_ids]
+    return GenericResponse({'model': {'title': 'XY', 'series': series},
+                            'status': status.value, 'statusMessage': status.value.lower()},
+                           ModelType.XY)
+
+
+class TestXYTiling:
+    """XY tiling functions test methods, needing no server."""
+
+    @pytest.mark.parametrize('nb_times, nb_items, target_points, expected', [
+        (1000, 2, 100, 20),
+        (1000, 1, 20000, 1),
+        (10, 1, 1, 10),
+        (0, 1, 100, 1),
+        (100, 0, 10, 10),
+    ])
+    def test_tile_count(self, nb_times, nb_items, target_points, expected):
+        """Expect tiles of about target_points values, at most one per time."""
+        assert tile_count(nb_times, nb_items, target_points) == expected
+
+    @pytest.mark.parametrize('nb_times, tiles', [(1000, 4), (1000, 7), (10, 3), (3, 5), (1, 2)])
+    def test_split_time_range(self, nb_times, tiles):
+        """Expect the tile samples to be the samples of the whole range, without overlap."""
+        ranges = split_time_range(START, END, nb_times, tiles)
+        assert len(ranges) == min(nb_times, tiles)
+        assert sum(tile_times for _, _, tile_times in ranges) == nb_times
+        assert ranges[0][0] == START
+        assert ranges[-1][1] == (END if nb_times > 1 else START)
+        for (_, previous_end, _), (start, _, _) in zip(ranges, ranges[1:]):
+            assert previous_end < start
+
+        # Tiles start and end at times of the whole range, in between which the
+        # server samples them within a rounding of those times; stitching them
+        # neither repeats nor misses the boundary times
+        stitched = [time for start, end, tile_times in ranges
+                    for time in _samples(start, end, tile_times)]
+        expected = _samples(START, END, nb_times)
+        assert len(stitched) == len(expected)
+        assert all(abs(time - expected_time) <= 1
+                   for time, expected_time in zip(stitched, expected))
+        assert stitched == sorted(set(stitched))
+
+    def test_split_parameters(self):
+        """Expect one query per tile, each a copy of the query but for its time range."""
+        parameters = {'parameters': {'requested_timerange': {'start': START, 'end': END,
+                                                             'nbTimes': 100},
+                                     'requested_items': [1, 2]}}
+        tiles = split_parameters(parameters, 3, None)
+        assert [tile['parameters']['requested_timerange'] for tile in tiles] == [
+            {'start': start, 'end': end, 'nbTimes': nb_times}
+            for start, end, nb_times in split_time_range(START, END, 100, 3)]
+        assert all(tile['parameters']['requested_items'] == [1, 2] for tile in tiles)
+        assert parameters['parameters']['requested_timerange']['nbTimes'] == 100
+
+        # 100 times of 2 items, 50 values per tile
+        assert len(split_parameters(parameters, None, 50)) == 4
+
+    def test_stitch_xy_responses(self):
+        """Expect series concatenated in tile order."""
+        ranges = split_time_range(START, END, 100, 3)
+        responses = [_response(_samples(*tile)) for tile in ranges]
+        stitched = stitch_xy_responses(responses)
+        assert stitched.status == ResponseStatus.COMPLETED
+        assert stitched.model.title == 'XY'
+
+        times = [time for tile in ranges for time in _samples(*tile)]
+        assert [series.series_id for series in stitched.model.series] == [1, 2]
+        for series in stitched.model.series:
+            assert series.series_name == f'series {series.series_id}'
+            assert series.x_values == times
+            assert series.y_values == [float(time * series.series_id) for time in times]
+            assert len(set(series.x_values)) == len(series.x_values)
+
+    def test_stitch_xy_responses_series_subsets(self):
+        """Expect series missing from some tiles to hold the values of the others."""
+        stitched = stitch_xy_responses([_response([1, 2], series_ids=(1,)),
+                                        _response([3, 4], series_ids=(1, 2))])
+        assert [series.x_values for series in stitched.model.series] == [[1, 2, 3, 4], [3, 4]]
+
+    def test_stitch_xy_responses_worst_status(self):
+        """Expect the worst tile status and its message."""
+        stitched = stitch_xy_responses([_response([1]), _response([2], ResponseStatus.RUNNING),
+                                        _response([3])])
+        assert stitched.status == ResponseStatus.RUNNING
+        assert stitched.status_text == 'running'
+
+    def test_stitch_xy_responses_columnar(self):
+        """Expect columnar series concatenated as NumPy columns."""
+        numpy = pytest.importorskip('numpy')
+        responses = [GenericResponse(response_params, ModelType.XY, columnar=True)
+                     for response_params in [
+                         {'model': {'series': [{'seriesName': 's', 'seriesId': 1,
+                                                'xValues': [1, 2], 'yValues': [0.5, 1.5]}]},
+                          'status': 'COMPLETED'},
+                         {'model': {'series': [{'seriesName': 's', 'seriesId': 1,
+                                                'xValues': [3], 'yValues': [2.5]}]},
+                          'status': 'COMPLETED'}]]
+        series = stitch_xy_responses(responses).model.series[0]
+        assert isinstance(series.x_values, numpy.ndarray)
+        assert series.x_values.tolist() == [1, 2, 3]
+        assert series.y_values.tolist() == [0.5, 1.5, 2.5]
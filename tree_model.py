@@ -22,9 +22,12 @@
 
 """TreeModel and TreeItem classes file."""
 
-from tabulate import tabulate
+import sys
+from itertools import islice
 
-import pandas as pd
+# Number of rows formatted before each write to the output
+ROW_CHUNK_SIZE = 1024
+COLUMN_SEPARATOR = "  "
 
 
 # pylint: disable=too-few-public-methods
@@ -35,37 +38,121 @@ class TreeModel:
         self._headers = headers
         self._root = TreeItem(None)
         self._root.set_trace("TODO")
-        id_map = {}
-        id_map[-1] = self._root
 
+        # Items by entry id; a repeated id keeps its first entry
+        self._items = {}
         for entry in entries:
-            elem = TreeItem(entry)
-            id_map[entry.id] = elem
-
-            if entry.parent_id in id_map.keys():
-                parent = id_map[entry.parent_id]
-                if elem not in parent.get_children():
-                    parent.add_child(elem)
-                    elem.set_parent(parent)
-
-    def print(self):
-        """Render this tree model."""
-        data = []
+            if entry.id not in self._items:
+                self._items[entry.id] = TreeItem(entry)
+
+        # Link once all the items are known, so that parents may come after their
+        # children; entries whose parent is unknown are attached to the root
+        for entry_id, item in self._items.items():
+            parent_id = item.get_entry().parent_id
+            parent = self._items.get(parent_id, self._root) if parent_id != entry_id else self._root
+            parent.add_child(item)
+            item.set_parent(parent)
+
+    def find_by_id(self, entry_id):
+        """Return the tree item of the given entry id, or None."""
+        return self._items.get(entry_id)
+
+    def subtree(self, entry_id):
+        """Return the tree item of the given entry id and its descendants, depth first."""
+        item = self._items.get(entry_id)
+        if item is None:
+            return []
+        return [descendant for descendant, _ in walk(item)]
+
+    def path_to_root(self, entry_id):
+        """Return the tree item of the given entry id followed by its ancestors."""
+        path = []
+        item = self._items.get(entry_id)
+        visited = set()
+        while item is not None and item is not self._root and id(item) not in visited:
+            visited.add(id(item))
+            path.append(item)
+            item = item.get_parent()
+        return path
+
+    def print(self, max_depth=None, max_rows=None, out=None):
+        """
+        Render this tree model, one fixed-width row per entry, streaming the
+        rows in chunks.
+        :param max_depth: Deepest level rendered, 0 being the top level entries;
+            None for no limit
+        :param max_rows: Maximum number of entry rows rendered; None for no limit
+        :param out: Text stream to write to, stdout by default
+        """
+        out = sys.stdout if out is None else out
+        headers = None
         if self._headers is not None:
-            headers = []
-            for header in self._headers:
-                headers.append(header.name)
-            for child in self._root.get_children():
-                data = child.print(data, 0)
-            frame = {}
-            if len(headers) == len(data):
-                frame = pd.DataFrame(data, columns=headers)
-            else:
-                frame = pd.DataFrame(data)
-            print(tabulate(frame.values, headers, tablefmt="fancy_grid"))
-        else:
-            for child in self._root.get_children():
-                child.print(data, 0)
+            headers = [header.name for header in self._headers]
+
+        # Size the columns first, so that rows can be written as they are formatted
+        widths = [len(header) for header in headers] if headers is not None else []
+        truncated = False
+        for count, row in enumerate(self._rows(headers, max_depth)):
+            if max_rows is not None and count >= max_rows:
+                truncated = True
+                break
+            if len(row) > len(widths):
+                widths.extend([0] * (len(row) - len(widths)))
+            for column, cell in enumerate(row):
+                if len(cell) > widths[column]:
+                    widths[column] = len(cell)
+
+        if headers is not None:
+            out.write(_format_row(headers, widths) + "\n")
+            out.write(_format_row(["-" * width for width in widths], widths) + "\n")
+        rows = islice(self._rows(headers, max_depth), max_rows)
+        while True:
+            chunk = [_format_row(row, widths) for row in islice(rows, ROW_CHUNK_SIZE)]
+            if not chunk:
+                break
+            chunk.append("")
+            out.write("\n".join(chunk))
+        if truncated:
+            out.write(f"... (more than {max_rows} rows)\n")
+        out.flush()
+
+    def _rows(self, headers, max_depth):
+        """Iterate over the cells of the entry rows, depth first."""
+        for child in self._root.get_children():
+            for item, depth in walk(child, max_depth):
+                entry = item.get_entry()
+                prefix = "  " + "| " * (depth - 1) + "|____" if depth > 0 else ""
+                labels = entry.labels
+                # With headers, single-label entries are table rows like the others
+                if headers is None and len(labels) == 1:
+                    yield [f"{prefix}{labels[0]} ({labels[0]}, {entry.id}) {entry.parent_id}"]
+                elif labels:
+                    yield [prefix + labels[0]] + list(labels[1:])
+                else:
+                    yield [prefix]
+
+
+def _format_row(cells, widths):
+    """Pad the cells of a row to the column widths."""
+    return COLUMN_SEPARATOR.join(
+        cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+
+
+def walk(item, max_depth=None):
+    """
+    Iterate depth first over a tree item and its descendants, with their depth.
+    Each item is visited once, so that parent cycles do not loop forever.
+    """
+    stack = [(item, 0)]
+    visited = set()
+    while stack:
+        item, depth = stack.pop()
+        if id(item) in visited:
+            continue
+        visited.add(id(item))
+        yield item, depth
+        if max_depth is None or depth < max_depth:
+            stack.extend((child, depth + 1) for child in reversed(item.get_children()))
 
 
 class TreeItem:
@@ -76,7 +163,6 @@ class TreeItem:
         self._parent = None
         self._children = []
         self._trace = None
-        self._indent = 2
 
     def set_parent(self, parent):
         """Set the parent for this tree item."""
@@ -105,40 +191,3 @@ class TreeItem:
     def get_children(self):
         """Return the children set for this tree item."""
         return self._children
-
-    # pylint: disable=fixme
-    def print(self, data, depth=0):
-        """Render this tree item."""
-        row = []
-        if self._entry is not None:
-            labels = self._entry.labels
-            prefix = ""
-            if depth > 0:
-                prefix = "|____"
-            if len(labels) == 1:
-                if depth > 0:
-                    print("  ", end="")
-                for _ in range((int)(depth / self._indent) - 1):
-                    print("| ", end="")
-                # TODO print TimeGraphEntry specific fields below; re-enable pylint's:
-                # pylint: disable=consider-using-f-string
-                print("{0}{1} ({1}, {2}) {3}".format(
-                    prefix, self._entry.labels[0], self._entry.id, self._entry.parent_id))
-            else:
-                label_str = ""
-                if depth > 0:
-                    label_str = label_str + "  "
-                for _ in range((int)(depth / self._indent) - 1):
-                    label_str = label_str + "| "
-                i = 0
-                label_str = label_str + prefix
-                for label in labels:
-                    if i == 0:
-                        row.append(label_str + label)
-                    else:
-                        row.append(label)
-                    i = i + 1
-            data.append(row)
-        for child in self.get_children():
-            child.print(data, depth + self._indent)
-        return data
@@ -0,0 +1,449 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""AsyncTspClient class file."""
+
+import asyncio
+import functools
+import itertools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from tsp.backoff import Backoff
+from tsp.deadline import bind_context, clip_delay
+from tsp.model_type import ModelType
+from tsp.response import ResponseStatus
+from tsp.response_cache import cache_key
+from tsp.single_flight import AsyncSingleFlight
+from tsp.tsp_client import TspClient, STILL_RUNNING
+
+
+class AsyncTspClient:
+    '''
+    Asyncio Trace Server Protocol client
+
+    Every endpoint of :class:`TspClient` is exposed as a coroutine returning
+    the same :class:`TspClientResponse` models. Requests run on a bounded
+    worker pool sharing the keep-alive connections of one TspClient, so many
+    TSP requests can be in flight from a single event loop.
+
+    The stream_timegraph_states and stream_virtual_table_lines methods have no
+    counterpart, as their callbacks would run off the event loop; lines are
+    streamed by the iter_virtual_table_lines asynchronous iterator instead.
+    '''
+
+    def __init__(self, base_url, pool_connections=TspClient.DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=TspClient.DEFAULT_POOL_MAXSIZE, cache=None, coalesce=False,
+                 columnar=False, retain_body=True, timeout=TspClient.DEFAULT_TIMEOUT,
+                 timeouts=None):
+        '''
+        Constructor
+        :param base_url: Base URL of the trace server TSP API
+        :param pool_connections: Number of host connection pools to cache
+        :param pool_maxsize: Maximum number of connections, and of requests in flight, per host
+        :param cache: Optional :class:`ResponseCache` of completed data provider responses
+        :param coalesce: Share one request between concurrent identical data provider queries
+        :param columnar: Build XY series and time graph states as NumPy columns
+        :param retain_body: Keep the raw body of successful responses as their status_text
+        :param timeout: Default timeout of the requests, as for :class:`TspClient`
+        :param timeouts: Timeouts overriding the default one, by last segment of the endpoint path
+        '''
+        self._client = TspClient(base_url, pool_connections, pool_maxsize, cache,
+                                 columnar=columnar, retain_body=retain_body,
+                                 timeout=timeout, timeouts=timeouts)
+        self._executor = ThreadPoolExecutor(max_workers=pool_maxsize,
+                                            thread_name_prefix='tsp-client')
+
+        # Coalescing of identical data provider queries in flight, or None
+        self._single_flight = AsyncSingleFlight() if coalesce else None
+
+    @property
+    def base_url(self):
+        '''
+        Base URL of the trace server TSP API
+        '''
+        return self._client.base_url
+
+    @property
+    def cache(self):
+        '''
+        Cache of completed data provider responses, or None
+        '''
+        return self._client.cache
+
+    @property
+    def coalesced_calls(self):
+        '''
+        Number of data provider queries answered by an identical query in flight
+        '''
+        return 0 if self._single_flight is None else self._single_flight.coalesced
+
+    async def close(self):
+        '''
+        Wait for the requests in flight then close the pooled connections
+        '''
+        # Waiting for the workers blocks, so it must not happen on the event loop
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        self._client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        # The executor does not carry the context, with the deadline, over by itself
+        return await loop.run_in_executor(self._executor,
+                                          bind_context(functools.partial(method, *args, **kwargs)))
+
+    async def _run_generic(self, model_type, method, exp_uuid, output_id, *args):
+        if self._single_flight is None:
+            return await self._run(method, exp_uuid, output_id, *args)
+        key = cache_key(model_type, exp_uuid, output_id, args[0] if args else None,
+                        self._client.columnar)
+        return await self._single_flight.do(
+            key, functools.partial(self._run, method, exp_uuid, output_id, *args))
+
+    async def await_completion(self, fetch, *args, timeout=None, backoff=None, progress=None,
+                               **kwargs):
+        '''
+        Await an endpoint returning a GenericResponse until its status is no longer RUNNING
+        :param fetch: Coroutine method of this client, e.g. fetch_xy or fetch_timegraph_tree
+        :param timeout: Overall deadline in seconds, or None to wait forever
+        :param backoff: :class:`Backoff` policy between calls, or None for the default one
+        :param progress: Callable receiving each RUNNING TspClientResponse
+        :rtype: TspClientResponse
+        :raises TimeoutError: If the response is still RUNNING when the timeout expires
+        '''
+        delays = (backoff or Backoff()).delays(timeout)
+        while True:
+            response = await fetch(*args, **kwargs)
+            if response.model is None or response.model.status != ResponseStatus.RUNNING:
+                return response
+            if progress is not None:
+                progress(response)
+            delay = next(delays, None)
+            if delay is None:
+                raise TimeoutError(STILL_RUNNING.format(timeout, fetch.__name__))
+            await asyncio.sleep(clip_delay(delay))
+
+    async def fetch_traces(self):
+        '''
+        Fetch all available traces on the server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_traces)
+
+    async def fetch_trace(self, uuid):
+        '''
+        Fetch a specific trace information
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_trace, uuid)
+
+    async def open_trace(self, name, path):
+        '''
+        Open a trace on the server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.open_trace, name, path)
+
+    async def open_traces(self, names, paths, max_workers=None):
+        '''
+        Open traces on the server, concurrently
+        :returns: List of :class:`TspClientResponse <Trace>`, in the order of paths
+        '''
+        return await self._run(self._client.open_traces, names, paths, max_workers)
+
+    async def await_indexing(self, uuids, timeout=None, backoff=None, progress=None,
+                             max_workers=None):
+        '''
+        Poll traces, concurrently, until none of them is still indexing
+        :returns: List of the last :class:`TspClientResponse <Trace>` of each trace
+        :raises TimeoutError: If a trace is still indexing when the timeout expires
+        '''
+        return await self._run(self._client.await_indexing, uuids, timeout=timeout,
+                               backoff=backoff, progress=progress, max_workers=max_workers)
+
+    async def delete_trace(self, uuid, delete_trace, remove_cache=False):
+        '''
+        Delete a trace on the server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.delete_trace, uuid, delete_trace, remove_cache)
+
+    async def delete_traces(self, uuids=None, delete_trace=False, remove_cache=False, name=None,
+                            ended_before=None, indexing_status=None, max_workers=None):
+        '''
+        Delete traces on the server, concurrently
+        :returns: :class:`BulkDeleteResult` of the deletions, or None if the traces
+                  could not be listed
+        :raises ValueError: If neither UUIDs nor filters are given
+        '''
+        return await self._run(self._client.delete_traces, uuids, delete_trace, remove_cache,
+                               name=name, ended_before=ended_before,
+                               indexing_status=indexing_status, max_workers=max_workers)
+
+    async def fetch_experiments(self):
+        '''
+        Fetch all available experiments on the server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_experiments)
+
+    async def fetch_experiment(self, uuid):
+        '''
+        Fetch a specific experiment information
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_experiment, uuid)
+
+    async def delete_experiment(self, uuid):
+        '''
+        Delete a specific experiment
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.delete_experiment, uuid)
+
+    async def delete_experiments(self, uuids=None, name=None, ended_before=None,
+                                 indexing_status=None, max_workers=None):
+        '''
+        Delete experiments on the server, concurrently; their traces remain open
+        :returns: :class:`BulkDeleteResult` of the deletions, or None if the experiments
+                  could not be listed
+        :raises ValueError: If neither UUIDs nor filters are given
+        '''
+        return await self._run(self._client.delete_experiments, uuids, name=name,
+                               ended_before=ended_before, indexing_status=indexing_status,
+                               max_workers=max_workers)
+
+    async def open_experiment(self, name, traces):
+        '''
+        Create an experiment on the server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.open_experiment, name, traces)
+
+    async def fetch_experiment_outputs(self, exp_uuid):
+        '''
+        List all the outputs associated to this experiment
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_experiment_outputs, exp_uuid)
+
+    async def fetch_experiment_output(self, exp_uuid, output_id):
+        '''
+        Fetch given output descriptor
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_experiment_output, exp_uuid, output_id)
+
+    async def fetch_datatree(self, exp_uuid, output_id, parameters=None):
+        '''
+        Fetch Time Graph tree, Model extends TimeGraphEntry
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.DATA_TREE, self._client.fetch_datatree,
+                                       exp_uuid, output_id, parameters)
+
+    async def fetch_virtual_table_columns(self, exp_uuid, output_id):
+        '''
+        Fetch Virtual Table columns, Model extends VirtualTableModel
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.VIRTUAL_TABLE_HEADER,
+                                       self._client.fetch_virtual_table_columns,
+                                       exp_uuid, output_id)
+
+    async def fetch_virtual_table_lines(self, exp_uuid, output_id, parameters=None):
+        '''
+        Fetch Virtual Table lines, Model extends VirtualTableModel
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.VIRTUAL_TABLE,
+                                       self._client.fetch_virtual_table_lines,
+                                       exp_uuid, output_id, parameters)
+
+    async def iter_virtual_table_lines(self, exp_uuid, output_id, parameters=None, page_size=1000,
+                                       max_page_size=50000, target_page_seconds=0.5):
+        '''
+        Iterate over Virtual Table lines, fetching them page by page while the
+        next page is prefetched; lines are handed over to the event loop in
+        batches of page_size
+        :returns: Asynchronous iterator of VirtualTableLine
+        :raises requests.HTTPError: If a page cannot be fetched
+        '''
+        lines = iter(self._client.iter_virtual_table_lines(exp_uuid, output_id, parameters,
+                                                           page_size, max_page_size,
+                                                           target_page_seconds))
+        while True:
+            batch = await self._run(list, itertools.islice(lines, page_size))
+            if not batch:
+                return
+            for line in batch:
+                yield line
+
+    async def fetch_timegraph_tree(self, exp_uuid, output_id, parameters=None):
+        '''
+        Fetch Time Graph tree, Model extends TimeGraphEntry
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.TIME_GRAPH_TREE, self._client.fetch_timegraph_tree,
+                                       exp_uuid, output_id, parameters)
+
+    async def fetch_timegraph_states(self, exp_uuid, output_id, parameters=None):
+        '''
+        Fetch Time Graph States
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.TIME_GRAPH_STATE,
+                                       self._client.fetch_timegraph_states,
+                                       exp_uuid, output_id, parameters)
+
+    async def fetch_timegraph_arrows(self, exp_uuid, output_id, parameters=None):
+        '''
+        Fetch Time Graph Arrows
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.TIME_GRAPH_ARROW,
+                                       self._client.fetch_timegraph_arrows,
+                                       exp_uuid, output_id, parameters)
+
+    async def fetch_xy_tree(self, exp_uuid, output_id, parameters=None):
+        '''
+        Fetch XY tree, Model extends Entry
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.XY_TREE, self._client.fetch_xy_tree,
+                                       exp_uuid, output_id, parameters)
+
+    async def fetch_xy(self, exp_uuid, output_id, parameters):
+        '''
+        Fetch XY xy, XYModel
+        :rtype: TspClientResponse
+        '''
+        return await self._run_generic(ModelType.XY, self._client.fetch_xy,
+                                       exp_uuid, output_id, parameters)
+
+    async def fetch_xy_tiled(self, exp_uuid, output_id, parameters, tiles=None,
+                             target_points=TspClient.DEFAULT_XY_TILE_POINTS, max_workers=None):
+        '''
+        Fetch XY xy, XYModel, by tiles of the requested time range fetched concurrently
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_xy_tiled, exp_uuid, output_id, parameters,
+                               tiles, target_points, max_workers)
+
+    async def fetch_output_configuration_sources(self, exp_uuid, output_id):
+        '''
+        Fetch all configuration source types for a given experiment and output
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_output_configuration_sources, exp_uuid, output_id)
+
+    async def fetch_output_configuration_source(self, exp_uuid, output_id, type_id):
+        '''
+        Fetch a single configuration source type for a given experiment, output and type
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_output_configuration_source,
+                               exp_uuid, output_id, type_id)
+
+    async def create_derived_output(self, exp_uuid, output_id, params):
+        '''
+        Create a derived output for a given experiment, output and parameters
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.create_derived_output, exp_uuid, output_id, params)
+
+    async def delete_derived_output(self, exp_uuid, output_id, derived_output_id):
+        '''
+        Create a derived output for a given experiment, output and parameters
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.delete_derived_output,
+                               exp_uuid, output_id, derived_output_id)
+
+    async def fetch_configuration_sources(self):
+        '''
+        Fetch Extensions (loaded files)
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_configuration_sources)
+
+    async def fetch_configuration_source(self, type_id):
+        '''
+        Fetch Extensions (loaded files)
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_configuration_source, type_id)
+
+    async def fetch_configurations(self, type_id):
+        '''
+        Fetch configurations (loaded files)
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_configurations, type_id)
+
+    async def fetch_configuration(self, type_id, config_id):
+        '''
+        Fetch a configuration (loaded file)
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_configuration, type_id, config_id)
+
+    async def post_configuration(self, type_id, params):
+        '''
+        Load an extension
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.post_configuration, type_id, params)
+
+    async def put_configuration(self, type_id, config_id, params):
+        '''
+        Load an extension
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.put_configuration, type_id, config_id, params)
+
+    async def delete_configuration(self, type_id, config_id):
+        '''
+        Delete an extension
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.delete_configuration, type_id, config_id)
+
+    async def fetch_health(self):
+        '''
+        Fetch the health status of the server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_health)
+
+    async def fetch_identifier(self):
+        '''
+        Fetch the identifier service to obtain important information regarding the trace server
+        :rtype: TspClientResponse
+        '''
+        return await self._run(self._client.fetch_identifier)
@@ -0,0 +1,66 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Backoff class file."""
+
+import random
+import time
+
+
+# pylint: disable=too-few-public-methods
+class Backoff:
+    '''
+    Exponential backoff with jitter, used to poll the server until an
+    analysis or indexing is complete
+    '''
+
+    def __init__(self, initial=0.05, maximum=2.0, factor=2.0, jitter=0.5):
+        '''
+        Constructor
+        :param initial: First delay, in seconds
+        :param maximum: Upper bound of a single delay, in seconds
+        :param factor: Multiplier applied to the delay after each poll
+        :param jitter: Fraction of each delay that is randomized, from 0 to 1
+        '''
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+
+    def delays(self, timeout=None):
+        '''
+        Generate the successive delays to wait between polls
+        :param timeout: Overall deadline in seconds from now, or None to poll forever
+        :returns: Delays in seconds, each clipped to the time left; stops once
+                  the deadline is reached
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = self.initial
+        while True:
+            wait = delay * (1 - self.jitter * random.random())
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            yield wait
+            delay = min(delay * self.factor, self.maximum)
@@ -0,0 +1,135 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Bulk deletion helpers of TspClient."""
+
+import fnmatch
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tsp.deadline import bind_context
+
+BULK_DELETE_UNFILTERED = "UUIDs or filters are required to delete in bulk"
+
+# Earlier end times are not wall-clock timestamps: unknown (0 or less) while the
+# trace is indexing, or from a clock such as the monotonic one counting from boot.
+# 1990-01-01, in nanoseconds since the epoch
+WALL_CLOCK_START = 631152000 * 1000000000
+
+
+# pylint: disable=too-few-public-methods
+class BulkDeleteResult:
+    '''
+    Outcome of the deletion of several traces or experiments
+    '''
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        # Models of the deleted traces or experiments, in the requested order
+        self.deleted = []
+
+        # Reason of each failed deletion, by UUID
+        self.failures = {}
+
+    def add(self, uuid, outcome):
+        '''
+        Record the outcome of one deletion
+        :param uuid: UUID of the trace or experiment
+        :param outcome: Its TspClientResponse, or the exception raised while deleting it
+        '''
+        if isinstance(outcome, Exception):
+            self.failures[uuid] = str(outcome)
+        elif outcome.status_code == 200:
+            self.deleted.append(outcome.model)
+        else:
+            self.failures[uuid] = f'status {outcome.status_code}'
+
+    def __repr__(self):
+        return f'BulkDeleteResult(deleted={len(self.deleted)}, failures={self.failures})'
+
+
+def matches(item, name=None, ended_before=None, indexing_status=None):
+    '''
+    Check a trace or experiment against filters; None filters match everything
+    :param item: Trace or Experiment model
+    :param name: Glob pattern of the name, as for fnmatch
+    :param ended_before: Timestamp, in nanoseconds since the epoch, the end time
+        (of the last event) must be before; end times that are not wall-clock
+        timestamps never match
+    :param indexing_status: IndexingStatus the item must have
+    '''
+    if name is not None and not fnmatch.fnmatchcase(item.name, name):
+        return False
+    if ended_before is not None and not WALL_CLOCK_START <= item.end < ended_before:
+        return False
+    return indexing_status is None or item.indexing_status == indexing_status
+
+
+def select(uuids, fetch, attribute, name=None, ended_before=None, indexing_status=None):
+    '''
+    Select the traces or experiments to delete
+    :param uuids: UUIDs to select from, or None for all the listed ones
+    :param fetch: Callable listing the traces or experiments, as a TspClientResponse
+    :param attribute: Attribute of the listed model holding them, e.g. 'traces'
+    :param name: Glob pattern of the name, as for matches()
+    :param ended_before: Timestamp the end time must be before, as for matches()
+    :param indexing_status: IndexingStatus the item must have
+    :returns: Selected UUIDs, or None if they could not be listed
+    :raises ValueError: If neither UUIDs nor filters are given
+    '''
+    if name is None and ended_before is None and indexing_status is None:
+        if uuids is None:
+            raise ValueError(BULK_DELETE_UNFILTERED)
+        return list(uuids)
+    response = fetch()
+    if response.model is None:
+        return None
+    wanted = None if uuids is None else set(uuids)
+    return [item.UUID for item in getattr(response.model, attribute)
+            if (wanted is None or item.UUID in wanted)
+            and matches(item, name, ended_before, indexing_status)]
+
+
+def delete_all(uuids, delete, max_workers):
+    '''
+    Delete traces or experiments concurrently, recording every outcome
+    :param uuids: UUIDs to delete
+    :param delete: Callable deleting one UUID, returning its TspClientResponse
+    :param max_workers: Maximum number of deletions at once
+    :returns: :class:`BulkDeleteResult` of the deletions
+    '''
+    def attempt(uuid):
+        try:
+            return delete(uuid)
+        except requests.exceptions.RequestException as ex:
+            return ex
+
+    result = BulkDeleteResult()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for uuid, outcome in zip(uuids, executor.map(bind_context(attempt), uuids)):
+            result.add(uuid, outcome)
+    return result
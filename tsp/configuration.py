@@ -40,38 +40,18 @@ class Configuration:
         Constructor
         '''
 
-        if NAME_KEY in params:
-            self.name = params.get(NAME_KEY)
-            del params[NAME_KEY]
-        else:
-            self.name = ""
+        self.name = params.get(NAME_KEY, "")
 
-        if DESCRIPTION_KEY in params:
-            self.description = params.get(DESCRIPTION_KEY)
-            del params[DESCRIPTION_KEY]
-        else:
-            self.description = ""
+        self.description = params.get(DESCRIPTION_KEY, "")
 
-        if ID_KEY in params:
-            # pylint: disable=invalid-name
-            self.id = params.get(ID_KEY)
-            del params[ID_KEY]
-        else:
-            self.id = "unknown-id"
+        # pylint: disable=invalid-name
+        self.id = params.get(ID_KEY, "unknown-id")
 
-        if SOURCE_TYPE_ID in params:
-            # pylint: disable=invalid-name
-            self.source_type_id = params.get(SOURCE_TYPE_ID)
-            del params[SOURCE_TYPE_ID]
-        else:
-            self.source_type_id = "unknown_source_type_id"
+        # pylint: disable=invalid-name
+        self.source_type_id = params.get(SOURCE_TYPE_ID, "unknown_source_type_id")
 
-        if PARAMETER_KEY in params:
-            # pylint: disable=invalid-name
-            self.parameters = params.get(PARAMETER_KEY)
-            del params[PARAMETER_KEY]
-        else:
-            self.parameters = {}
+        # pylint: disable=invalid-name
+        self.parameters = params.get(PARAMETER_KEY, {})
 
     def __repr__(self):
         return 'Configuration(name={}, description={}, id={}, source_type_id={}, parameters={})'.format(
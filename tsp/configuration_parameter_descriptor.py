@@ -39,31 +39,15 @@ class ConfigurationParameterDescriptor:
         Constructor
         '''
 
-        if KEY_NAME_KEY in params:
-            self.key_name = params.get(KEY_NAME_KEY)
-            del params[KEY_NAME_KEY]
-        else:
-            self.key_name = ""
+        self.key_name = params.get(KEY_NAME_KEY, "")
 
-        if DESCTIPION_KEY in params:
-            self.description = params.get(DESCTIPION_KEY)
-            del params[DESCTIPION_KEY]
-        else:
-            self.description = ""
+        self.description = params.get(DESCTIPION_KEY, "")
 
-        if DATA_TYPE_KEY in params:
-            # pylint: disable=invalid-name
-            self.data_type = params.get(DATA_TYPE_KEY)
-            del params[DATA_TYPE_KEY]
-        else:
-            self.data_type = "STRING"
+        # pylint: disable=invalid-name
+        self.data_type = params.get(DATA_TYPE_KEY, "STRING")
 
-        if REQUIRED_KEY in params:
-            # pylint: disable=invalid-name
-            self.is_required = params.get(REQUIRED_KEY)
-            del params[REQUIRED_KEY]
-        else:
-            self.is_required = "false"
+        # pylint: disable=invalid-name
+        self.is_required = params.get(REQUIRED_KEY, "false")
 
     def __repr__(self):
         return 'ConfigurationParameterDescriptor[key_name={}, description={}, data_type={}, is_required={}])'.format(
@@ -42,24 +42,12 @@ class ConfigurationSource:
         '''
         Constructor
         '''
-        if NAME_KEY in params:
-            self.name = params.get(NAME_KEY)
-            del params[NAME_KEY]
-        else:
-            self.name = ""
+        self.name = params.get(NAME_KEY, "")
 
-        if DESCTIPION_KEY in params:
-            self.description = params.get(DESCTIPION_KEY)
-            del params[DESCTIPION_KEY]
-        else:
-            self.description = ""
+        self.description = params.get(DESCTIPION_KEY, "")
 
-        if ID_KEY in params:
-            # pylint: disable=invalid-name
-            self.id = params.get(ID_KEY)
-            del params[ID_KEY]
-        else:
-            self.id = "unknown-id"
+        # pylint: disable=invalid-name
+        self.id = params.get(ID_KEY, "unknown-id")
 
         self.parameter_descriptors = None
         if PARAM_DESC_KEY in params:
@@ -67,10 +55,7 @@ class ConfigurationSource:
             self.parameter_descriptors = ConfigurationParameterDescriptorSet(params.get(PARAM_DESC_KEY))
             params[PARAM_DESC_KEY]
 
-        self.schema = None
-        if SCHEMA_KEY in params:
-            self.schema = params.get(SCHEMA_KEY)
-            del params[SCHEMA_KEY]
+        self.schema = params.get(SCHEMA_KEY)
 
     def __repr__(self):
         return 'ConfigurationSource(id={}, name={}, description={}, parameter_descriptors={}, schema={})'.format(
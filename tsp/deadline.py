@@ -0,0 +1,148 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Deadline shared by the TSP calls of a composite operation.
+
+A deadline is held in a context variable, so it follows the calling thread
+or asyncio task; bind_context() carries it over to worker pool threads.
+"""
+
+import contextlib
+import contextvars
+import time
+
+DEADLINE_EXCEEDED = "deadline exceeded by {0:.3f} seconds"
+
+# Monotonic time of the current deadline, or None
+_deadline = contextvars.ContextVar('tsp_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    '''
+    Raised instead of starting a TSP call, or of waiting, once the deadline is past
+    '''
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    '''
+    Bound the TSP calls made within to an overall latency budget; a nested
+    deadline cannot extend the one it is nested in
+    :param seconds: Budget in seconds from now
+    '''
+    end = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        end = min(end, current)
+    token = _deadline.set(end)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining():
+    '''
+    Get the time left before the current deadline
+    :returns: Seconds left, negative once past, or None without deadline
+    '''
+    end = _deadline.get()
+    return None if end is None else end - time.monotonic()
+
+
+def check():
+    '''
+    Raise DeadlineExceeded if the current deadline is past
+    :returns: Seconds left, or None without deadline
+    '''
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(DEADLINE_EXCEEDED.format(-left))
+    return left
+
+
+def bound_timeout(timeout):
+    '''
+    Clip a requests timeout to the current deadline
+    :param timeout: Seconds, (connect, read) tuple of seconds, or None for no timeout
+    :returns: The timeout, none of its parts exceeding the time left
+    :raises DeadlineExceeded: If the deadline is past
+    '''
+    left = check()
+    if left is None:
+        return timeout
+    if timeout is None:
+        return left
+    if isinstance(timeout, tuple):
+        return tuple(left if part is None else min(part, left) for part in timeout)
+    return min(timeout, left)
+
+
+def clip_delay(delay):
+    '''
+    Clip a delay between polls to the current deadline
+    :param delay: Seconds to wait
+    :returns: The delay, not exceeding the time left
+    :raises DeadlineExceeded: If the deadline is past
+    '''
+    left = check()
+    return delay if left is None else min(delay, left)
+
+
+def bind_context(function):
+    '''
+    Bind a function to the current context, deadline included, so that it
+    runs with it on worker pool threads
+    :param function: Callable to bind
+    :returns: Callable running function in a copy of the current context
+    '''
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        # A context may only be entered by one thread at once
+        return context.copy().run(function, *args, **kwargs)
+    return run
+
+
+def poll(call, running, delays, message, progress=None):
+    '''
+    Call until the result is no longer running, waiting between the calls
+    :param call: Callable returning a result
+    :param running: Predicate telling whether a result is still running
+    :param delays: Iterator of the delays between the calls, in seconds, as
+                   from Backoff.delays(); the polling times out once exhausted
+    :param message: Message of the TimeoutError raised on timeout
+    :param progress: Callable receiving each running result
+    :returns: First result not running
+    :raises TimeoutError: If the result is still running once the delays run out
+    '''
+    while True:
+        result = call()
+        if not running(result):
+            return result
+        if progress is not None:
+            progress(result)
+        delay = next(delays, None)
+        if delay is None:
+            raise TimeoutError(message)
+        time.sleep(clip_delay(delay))
@@ -0,0 +1,204 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""DiskResponseCache class file."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from tsp import json_codec
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse
+from tsp.response_cache import is_cacheable
+from tsp.tsp_client_response import TspClientResponse
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Renamed whenever the table layout changes, leaving older databases alone
+DATABASE_NAME = "responses-2.sqlite3"
+
+
+def server_namespace(tsp_client):
+    '''
+    Identify the trace server behind a client, so that cached responses of
+    different servers, or server versions, never mix
+    :param tsp_client: TspClient connected to the server
+    :returns: Namespace string for DiskResponseCache
+    '''
+    identifier = tsp_client.fetch_identifier().model
+    if identifier is None:
+        return tsp_client.base_url
+    return (f'{tsp_client.base_url}|{identifier.product_id}|'
+            f'{identifier.server_version}|{identifier.build_time}')
+
+
+class DiskResponseCache:
+    '''
+    Persistent cache of completed data provider responses, stored in an SQLite
+    database so that it is shared across processes. The raw response bodies are
+    kept, bounded in total size and pruned least recently used first. It has the
+    same interface as ResponseCache.
+
+    Entries are only keyed by experiment UUID, which the server derives from the
+    experiment name, and deletions made by other clients are not seen. Set a TTL
+    so that a re-created or deleted experiment is not served from the cache forever.
+    '''
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, directory, namespace, max_bytes=DEFAULT_MAX_BYTES, ttl=None):
+        '''
+        Constructor
+        :param directory: Directory holding the cache database, created if needed
+        :param namespace: Server identity string, or callable returning it on first use
+        :param max_bytes: Maximum total size of the cached response bodies
+        :param ttl: Time to live of an entry in seconds, or None for no expiry
+        '''
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # Number of lookups answered, or not, from the cache
+        self.hits = 0
+        self.misses = 0
+
+        self._namespace = namespace
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _database(self):
+        if self._connection is None:
+            if callable(self._namespace):
+                self._namespace = self._namespace()
+            os.makedirs(self.directory, exist_ok=True)
+            self._connection = sqlite3.connect(os.path.join(self.directory, DATABASE_NAME),
+                                               timeout=30, check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, namespace TEXT, '
+                'exp_uuid TEXT, content BLOB, size INTEGER, last_access REAL, created REAL)')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)')
+            self._connection.commit()
+        return self._connection
+
+    def _key(self, key):
+        return json.dumps([self._namespace, *key])
+
+    def get(self, key):
+        '''
+        Look up a response
+        :param key: Key built by cache_key()
+        :returns: The cached TspClientResponse, or None
+        '''
+        with self._lock:
+            database = self._database()
+            db_key = self._key(key)
+            row = database.execute('SELECT content, created FROM responses WHERE key = ?',
+                                   (db_key,)).fetchone()
+            now = time.time()
+            if row is not None and self.ttl is not None and row[1] + self.ttl <= now:
+                database.execute('DELETE FROM responses WHERE key = ?', (db_key,))
+                database.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            database.execute('UPDATE responses SET last_access = ? WHERE key = ?',
+                             (now, db_key))
+            database.commit()
+            self.hits += 1
+        content = row[0]
+        # The key tells whether the client builds columnar models
+        return TspClientResponse(GenericResponse(json_codec.loads(content), ModelType(key[0]),
+                                                 key[4]),
+                                 200, content)
+
+    def put(self, key, response, content):
+        '''
+        Store a response if it holds a COMPLETED GenericResponse
+        :param key: Key built by cache_key()
+        :param response: TspClientResponse to store
+        :param content: Raw response body, stored as is
+        '''
+        if not is_cacheable(response) or len(content) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            database = self._database()
+            database.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             (self._key(key), self._namespace, key[1], content, len(content),
+                              now, now))
+            self._prune(database, now)
+            database.commit()
+
+    def _prune(self, database, now):
+        if self.ttl is not None:
+            database.execute('DELETE FROM responses WHERE created <= ?', (now - self.ttl,))
+        excess = database.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0] \
+            - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for db_key, size in database.execute(
+                'SELECT key, size FROM responses ORDER BY last_access'):
+            victims.append((db_key,))
+            excess -= size
+            if excess <= 0:
+                break
+        database.executemany('DELETE FROM responses WHERE key = ?', victims)
+
+    def invalidate(self, exp_uuid):
+        '''
+        Drop every cached response of an experiment, for this server
+        :param exp_uuid: Experiment UUID
+        '''
+        with self._lock:
+            database = self._database()
+            database.execute('DELETE FROM responses WHERE namespace = ? AND exp_uuid = ?',
+                             (self._namespace, exp_uuid))
+            database.commit()
+
+    def clear(self):
+        '''
+        Drop every cached response of this server
+        '''
+        with self._lock:
+            database = self._database()
+            database.execute('DELETE FROM responses WHERE namespace = ?', (self._namespace,))
+            database.commit()
+
+    def close(self):
+        '''
+        Close the cache database
+        '''
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __repr__(self):
+        return (f'DiskResponseCache(directory={self.directory}, hits={self.hits}, '
+                f'misses={self.misses})')
@@ -61,23 +61,14 @@ class EntryHeader:
         '''
 
         # Name for this header.
-        if HEADER_NAME_KEY in params:
-            self.name = params.get(HEADER_NAME_KEY)
-            del params[HEADER_NAME_KEY]
-        else:
-            self.name = None
+        self.name = params.get(HEADER_NAME_KEY)
 
         # Tooltip for this header.
-        if HEADER_TOOLTIP_KEY in params:
-            self.tooltip = params.get(HEADER_TOOLTIP_KEY)
-            del params[HEADER_TOOLTIP_KEY]
-        else:
-            self.tooltip = None
+        self.tooltip = params.get(HEADER_TOOLTIP_KEY)
 
         # Data type for this header.
         if HEADER_DATA_TYPE_KEY in params:
             self.data_type = EntryHeaderDataType(params.get(HEADER_DATA_TYPE_KEY))
-            del params[HEADER_DATA_TYPE_KEY]
         else:
             self.data_type = None
 
@@ -86,36 +77,25 @@ class Entry:
     '''
     Basic entry
     '''
+    __slots__ = ('id', 'parent_id', 'labels', 'style')
 
     def __init__(self, params):
         '''
         Unique Id for the entry
         '''
         # pylint: disable=invalid-name
-        self.id = UNKNOWN_ID
-        if ID_KEY in params:
-            self.id = params.get(ID_KEY)
-            del params[ID_KEY]
+        self.id = params.get(ID_KEY, UNKNOWN_ID)
 
         # Parent entry Id, or -1 if the entry does not have a parent
-        self.parent_id = UNKNOWN_ID
-        if PARENT_ID_KEY in params:
-            self.parent_id = params.get(PARENT_ID_KEY)
-            del params[PARENT_ID_KEY]
+        self.parent_id = params.get(PARENT_ID_KEY, UNKNOWN_ID)
 
         # Array of string that represent the content of each column
-        self.labels = []
-        if LABELS_KEY in params:
-            self.labels = params.get(LABELS_KEY)
-            del params[LABELS_KEY]
+        self.labels = params.get(LABELS_KEY, [])
 
         # Style key used to search for a style.
         # The style map can be obtained by using the style endpoint.
-        self.style = None
-        if STYLE_KEY in params:
-            if params.get(STYLE_KEY) is not None:
-                self.style = OutputElementStyle(params.get(STYLE_KEY))
-            del params[STYLE_KEY]
+        style = params.get(STYLE_KEY)
+        self.style = OutputElementStyle(style) if style is not None else None
 
 class EntryHeaderEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -41,22 +41,11 @@ class EntryModel:
         '''
         Array of entry column
         '''
-        self.headers = []
-        if HEADER_KEY in params:
-            if params.get(HEADER_KEY) is not None:
-                for column in params.get(HEADER_KEY):
-                    self.headers.append(EntryHeader(column))
-            del params[HEADER_KEY]
+        self.headers = [EntryHeader(column) for column in params.get(HEADER_KEY) or []]
 
         # Array of entry
-        self.entries = []
-        if ENTRIES_KEY in params:
-            for entry in params.get(ENTRIES_KEY):
-                if model_type == ModelType.TIME_GRAPH_TREE:
-                    self.entries.append(TimeGraphEntry(entry))
-                else:
-                    self.entries.append(Entry(entry))
-            del params[ENTRIES_KEY]
+        entry_class = TimeGraphEntry if model_type == ModelType.TIME_GRAPH_TREE else Entry
+        self.entries = [entry_class(entry) for entry in params.get(ENTRIES_KEY, [])]
 
     def __repr__(self) -> str:
         return 'EntryModel({})'.format(', '.join(str(entry) for entry in self.entries))
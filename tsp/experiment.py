@@ -50,46 +50,25 @@ class Experiment:
         '''
 
         # Experiment's unique identifier
-        if UUID_KEY in params:
-            # pylint: disable=invalid-name
-            self.UUID = params.get(UUID_KEY)
-            del params[UUID_KEY]
-        else:  # pragma: no cover
-            self.UUID = NA
+        # pylint: disable=invalid-name
+        self.UUID = params.get(UUID_KEY, NA)
 
         # User defined name for the experiment
-        if NAME_KEY in params:
-            self.name = params.get(NAME_KEY)
-            del params[NAME_KEY]
-        else:  # pragma: no cover
-            self.name = NA
+        self.name = params.get(NAME_KEY, NA)
 
         # Experiment's start time
-        if START_TIME_KEY in params:
-            self.start = params.get(START_TIME_KEY)
-            del params[START_TIME_KEY]
-        else:  # pragma: no cover
-            self.start = -1
+        self.start = params.get(START_TIME_KEY, -1)
 
         # Experiment's end time
-        if END_TIME_KEY in params:
-            self.end = params.get(END_TIME_KEY)
-            del params[END_TIME_KEY]
-        else:  # pragma: no cover
-            self.end = -1
+        self.end = params.get(END_TIME_KEY, -1)
 
         # Current number of events
-        if NB_EVENT_KEY in params:
-            self.number_of_events = params.get(NB_EVENT_KEY)
-            del params[NB_EVENT_KEY]
-        else:  # pragma: no cover
-            self.number_of_events = 0
+        self.number_of_events = params.get(NB_EVENT_KEY, 0)
 
         # Indicate if the indexing of the experiment is completed or still running.
         # If it still running, the end time and number of events are not final
         if INDEXING_STATUS_KEY in params:
             self.indexing_status = IndexingStatus[params.get(INDEXING_STATUS_KEY)]
-            del params[INDEXING_STATUS_KEY]
         else:  # pragma: no cover
             self.indexing_status = 0
 
@@ -51,7 +51,6 @@ class Health:
         # Health status
         if STATUS_KEY in params:
             self.status = HealthStatus(params.get(STATUS_KEY))
-            del params[STATUS_KEY]
         else:
             self.status = None
 
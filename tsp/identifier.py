@@ -47,67 +47,31 @@ class Identifier:
         '''
 
         # Server Version
-        if SERVER_VERSION in params:
-            self.server_version = params.get(SERVER_VERSION)
-            del params[SERVER_VERSION]
-        else:
-            self.server_version = None
+        self.server_version = params.get(SERVER_VERSION)
 
         # Build Time
-        if BUILD_TIME in params:
-            self.build_time = params.get(BUILD_TIME)
-            del params[BUILD_TIME]
-        else:
-            self.build_time = None
+        self.build_time = params.get(BUILD_TIME)
 
         # OS Name
-        if OS_NAME in params:
-            self.os_name = params.get(OS_NAME)
-            del params[OS_NAME]
-        else:
-            self.os_name = None
+        self.os_name = params.get(OS_NAME)
 
         # OS Arch
-        if OS_ARCH in params:
-            self.os_arch = params.get(OS_ARCH)
-            del params[OS_ARCH]
-        else:
-            self.os_arch = None
+        self.os_arch = params.get(OS_ARCH)
 
         # OS Version
-        if OS_VERSION in params:
-            self.os_version = params.get(OS_VERSION)
-            del params[OS_VERSION]
-        else:
-            self.os_version = None
+        self.os_version = params.get(OS_VERSION)
 
         # CPU Count
-        if CPU_COUNT in params:
-            self.cpu_count = params.get(CPU_COUNT)
-            del params[CPU_COUNT]
-        else:
-            self.cpu_count = None
+        self.cpu_count = params.get(CPU_COUNT)
 
         # Max Memory
-        if MAX_MEMORY in params:
-            self.max_memory = params.get(MAX_MEMORY)
-            del params[MAX_MEMORY]
-        else:
-            self.max_memory = None
+        self.max_memory = params.get(MAX_MEMORY)
 
         # Product ID
-        if PRODUCT_ID in params:
-            self.product_id = params.get(PRODUCT_ID)
-            del params[PRODUCT_ID]
-        else:
-            self.product_id = None
+        self.product_id = params.get(PRODUCT_ID)
 
         # Launcher Name
-        if LAUNCHER_NAME in params:
-            self.launcher_name = params.get(LAUNCHER_NAME)
-            del params[LAUNCHER_NAME]
-        else:
-            self.launcher_name = None
+        self.launcher_name = params.get(LAUNCHER_NAME)
 
         # TSP Version
         if TSP_VERSION in params:
@@ -0,0 +1,205 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""JSON codec file."""
+
+import json
+import os
+import warnings
+
+# Environment variable forcing the codec, by name
+CODEC_ENVIRONMENT_VARIABLE = "TSP_JSON_CODEC"
+
+# Selected on first use, to not import the codec modules before they are needed
+_codec = None  # pylint: disable=invalid-name
+
+
+class StdlibCodec:
+    '''
+    Codec using the json module of the standard library
+    '''
+    name = 'json'
+
+    @staticmethod
+    def loads(data):
+        '''
+        Decode a JSON document
+        :param data: Document as bytes, UTF-8 encoded, or as str
+        :returns: The decoded object
+        '''
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj, encoder=None):
+        '''
+        Encode an object as a compact JSON document
+        :param obj: Object to encode
+        :param encoder: Optional json.JSONEncoder class whose default() encodes the model objects
+        :returns: The UTF-8 encoded document, as bytes
+        '''
+        return json.dumps(obj, cls=encoder, separators=(',', ':')).encode('utf-8')
+
+
+class UjsonCodec:
+    '''
+    Codec using the ujson module
+    '''
+    name = 'ujson'
+
+    # pylint: disable=c-extension-no-member
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        '''
+        Decode a JSON document
+        :param data: Document as bytes, UTF-8 encoded, or as str
+        :returns: The decoded object
+        '''
+        return self._ujson.loads(data)
+
+    def dumps(self, obj, encoder=None):
+        '''
+        Encode an object as a compact JSON document
+        :param obj: Object to encode
+        :param encoder: Optional json.JSONEncoder class whose default() encodes the model objects
+        :returns: The UTF-8 encoded document, as bytes
+        '''
+        default = encoder().default if encoder is not None else None
+        return self._ujson.dumps(obj, default=default, ensure_ascii=False,
+                                 escape_forward_slashes=False).encode('utf-8')
+
+
+class OrjsonCodec:
+    '''
+    Codec using the orjson module
+    '''
+    name = 'orjson'
+
+    # The members of the orjson extension module are not visible to pylint
+    # pylint: disable=no-member
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        import orjson
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(self, data):
+        '''
+        Decode a JSON document
+        :param data: Document as bytes, UTF-8 encoded, or as str
+        :returns: The decoded object
+        '''
+        return self._orjson.loads(data)
+
+    def dumps(self, obj, encoder=None):
+        '''
+        Encode an object as a compact JSON document
+        :param obj: Object to encode
+        :param encoder: Optional json.JSONEncoder class whose default() encodes the model objects
+        :returns: The UTF-8 encoded document, as bytes
+        '''
+        default = encoder().default if encoder is not None else None
+        return self._orjson.dumps(obj, default=default, option=self._options)
+
+
+CODECS = (OrjsonCodec, UjsonCodec, StdlibCodec)
+
+
+def available_codecs():
+    '''
+    Get the codecs whose module is installed
+    :returns: List of codecs, fastest first
+    '''
+    codecs = []
+    for codec_type in CODECS:
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            pass
+    return codecs
+
+
+def select_codec(name=None):
+    '''
+    Select the codec used by loads() and dumps()
+    :param name: Name of the codec, or None for the fastest installed one
+                 unless the TSP_JSON_CODEC environment variable names one; a
+                 variable naming a codec not installed falls back to json, with
+                 a warning
+    :returns: The selected codec
+    :raises ValueError: If name is not the name of an installed codec
+    '''
+    global _codec  # pylint: disable=global-statement
+    if name is not None:
+        _codec = _create_codec(name)
+        return _codec
+    name = os.environ.get(CODEC_ENVIRONMENT_VARIABLE)
+    try:
+        _codec = _create_codec(name)
+    except ValueError as ex:
+        warnings.warn(f"{CODEC_ENVIRONMENT_VARIABLE}: {ex}, using json")
+        _codec = StdlibCodec()
+    return _codec
+
+
+def _create_codec(name):
+    # Stop at the first codec that imports, so that the slower ones are not loaded
+    for codec_type in CODECS:
+        if name and codec_type.name != name:
+            continue
+        try:
+            return codec_type()
+        except ImportError:
+            continue
+    raise ValueError(f"JSON codec not available: {name}")
+
+
+def codec():
+    '''
+    Get the codec used by loads() and dumps(), selecting it on first use
+    '''
+    return _codec or select_codec()
+
+
+def loads(data):
+    '''
+    Decode a JSON document with the selected codec
+    :param data: Document as bytes, UTF-8 encoded, or as str
+    :returns: The decoded object
+    '''
+    return (_codec or select_codec()).loads(data)
+
+
+def dumps(obj, encoder=None):
+    '''
+    Encode an object as a compact JSON document with the selected codec
+    :param obj: Object to encode
+    :param encoder: Optional json.JSONEncoder class whose default() encodes the model objects
+    :returns: The UTF-8 encoded document, as bytes
+    '''
+    return (_codec or select_codec()).dumps(obj, encoder)
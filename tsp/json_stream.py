@@ -0,0 +1,185 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""JsonArrayStream class file."""
+
+import codecs
+import json
+
+WHITESPACE = ' \t\n\r'
+
+# Characters that may continue a number at the end of the buffer
+NUMBER_CHARACTERS = frozenset('0123456789+-.eE')
+
+# Consumed text kept in the buffer before it is dropped
+COMPACT_THRESHOLD = 64 * 1024
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+
+class JsonArrayStream:
+    '''
+    Incremental parser of a JSON document read in chunks, yielding the
+    elements of one array of the document as soon as each is complete. The
+    buffered text is bounded by the size of one element, not of the document.
+    After the iteration, envelope holds the rest of the document, with an
+    empty list in place of the streamed array.
+    '''
+
+    def __init__(self, chunks, path):
+        '''
+        Constructor
+        :param chunks: Iterable of the UTF-8 encoded document, as bytes
+        :param path: Keys of the objects leading to the array, e.g. ("model", "lines")
+        '''
+        self.path = tuple(path)
+        self.envelope = None
+
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._scanner = json.JSONDecoder()
+        self._text = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        self.envelope = yield from self._object(0)
+        self._skip_whitespace()
+        if self._pos < len(self._text):
+            raise self._error("Extra data")
+
+    def _object(self, depth):
+        self._expect('{')
+        values = {}
+        self._skip_whitespace()
+        if self._peek() == '}':
+            self._pos += 1
+            return values
+        while True:
+            self._skip_whitespace()
+            key = self._value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self._skip_whitespace()
+            self._expect(':')
+            self._skip_whitespace()
+            last = depth + 1 == len(self.path)
+            if depth < len(self.path) and key == self.path[depth] \
+                    and self._peek() == ('[' if last else '{'):
+                if last:
+                    values[key] = []
+                    yield from self._array()
+                else:
+                    values[key] = yield from self._object(depth + 1)
+            else:
+                values[key] = self._value()
+            self._skip_whitespace()
+            separator = self._next()
+            if separator == '}':
+                return values
+            if separator != ',':
+                raise self._error("Expecting ',' delimiter")
+
+    def _array(self):
+        self._expect('[')
+        self._skip_whitespace()
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            self._skip_whitespace()
+            yield self._value()
+            self._skip_whitespace()
+            separator = self._next()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise self._error("Expecting ',' delimiter")
+
+    def _value(self):
+        # Decode the value at the position, reading more text while it is
+        # incomplete. Retries wait for the buffer to double to stay linear.
+        needed = 0
+        while True:
+            if len(self._text) - self._pos >= needed or self._eof:
+                try:
+                    value, end = self._scanner.raw_decode(self._text, self._pos)
+                    if self._eof or not self._may_continue(value, end):
+                        self._pos = end
+                        self._compact()
+                        return value
+                except json.JSONDecodeError:
+                    if self._eof:
+                        raise
+                needed = 2 * (len(self._text) - self._pos) + 1
+            self._read()
+
+    def _may_continue(self, value, end):
+        # A number followed only by number characters, e.g. "1" of "1e", may
+        # continue in the next chunk
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return False
+        return all(character in NUMBER_CHARACTERS for character in self._text[end:])
+
+    def _skip_whitespace(self):
+        while True:
+            while self._pos < len(self._text) and self._text[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._text) or self._eof:
+                return
+            self._read()
+
+    def _peek(self):
+        while self._pos >= len(self._text):
+            if self._eof:
+                raise self._error("Unexpected end of document")
+            self._read()
+        return self._text[self._pos]
+
+    def _next(self):
+        character = self._peek()
+        self._pos += 1
+        return character
+
+    def _expect(self, character):
+        if self._next() != character:
+            self._pos -= 1
+            raise self._error(f"Expecting '{character}'")
+
+    def _read(self):
+        if self._eof:
+            return
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            self._text += self._decoder.decode(b'', final=True)
+        else:
+            self._text += self._decoder.decode(chunk)
+
+    def _compact(self):
+        if self._pos > COMPACT_THRESHOLD and 2 * self._pos > len(self._text):
+            self._text = self._text[self._pos:]
+            self._pos = 0
+
+    def _error(self, message):
+        return json.JSONDecodeError(message, self._text, self._pos)
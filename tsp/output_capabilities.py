@@ -40,19 +40,11 @@ class OutputCapabilities:
         '''
 
         # Capability canCreate
-        if CAN_CREATE_KEY in params:
-            # pylint: disable=invalid-name
-            self.can_create = params.get(CAN_CREATE_KEY)
-            del params[CAN_CREATE_KEY]
-        else:  # pragma: no cover
-            self.can_create = None
+        # pylint: disable=invalid-name
+        self.can_create = params.get(CAN_CREATE_KEY)
 
-        if CAN_DELETE_KEY in params:
-            # pylint: disable=invalid-name
-            self.can_delete = params.get(CAN_DELETE_KEY)
-            del params[CAN_DELETE_KEY]
-        else:  # pragma: no cover
-            self.can_delete = None
+        # pylint: disable=invalid-name
+        self.can_delete = params.get(CAN_DELETE_KEY)
 
     def __repr__(self):
         return 'OutputCapabilities(canCreate={}, canDelete={})'.format(self.can_create, self.can_delete)
@@ -55,91 +55,49 @@ class OutputDescriptor:
         '''
 
         # Output provider's parent ID
-        if PARENT_ID_KEY in params:
-            # pylint: disable=invalid-name
-            self.parent_id = params.get(PARENT_ID_KEY)
-            del params[PARENT_ID_KEY]
-        else:  # pragma: no cover
-            self.parent_id = None
+        # pylint: disable=invalid-name
+        self.parent_id = params.get(PARENT_ID_KEY)
 
         # Output provider's ID
-        if ID_KEY in params:
-            # pylint: disable=invalid-name
-            self.id = params.get(ID_KEY)
-            del params[ID_KEY]
-        else:  # pragma: no cover
-            self.id = None
+        # pylint: disable=invalid-name
+        self.id = params.get(ID_KEY)
 
         # Human readable name
-        if NAME_KEY in params:
-            self.name = params.get(NAME_KEY)
-            del params[NAME_KEY]
-        else:  # pragma: no cover
-            self.name = UNKOWN
+        self.name = params.get(NAME_KEY, UNKOWN)
 
         # Description of the output provider
-        if DESCRIPTION_KEY in params:
-            self.description = params.get(DESCRIPTION_KEY)
-            del params[DESCRIPTION_KEY]
-        else:  # pragma: no cover
-            self.description = UNKOWN
+        self.description = params.get(DESCRIPTION_KEY, UNKOWN)
 
         # Type of data returned by this output.
         # Serve as a hint to determine what kind of view should be use for this output
         # (ex. XY, Time Graph, Table, etc..)
-        if TYPE_KEY in params:
-            self.type = params.get(TYPE_KEY)
-            del params[TYPE_KEY]
-        else:  # pragma: no cover
-            self.type = UNKOWN
+        self.type = params.get(TYPE_KEY, UNKOWN)
 
         # Map of query parameters that the provider accept
-        if QUERY_PARAMETERS_KEY in params:
-            self.query_parameters = params.get(QUERY_PARAMETERS_KEY)
-            del params[QUERY_PARAMETERS_KEY]
-        else:
-            self.query_parameters = {}
+        self.query_parameters = params.get(QUERY_PARAMETERS_KEY, {})
 
         # Start time
-        if START_TIME_KEY in params:
-            self.start = params.get(START_TIME_KEY)
-            del params[START_TIME_KEY]
-        else:
-            self.start = 0
+        self.start = params.get(START_TIME_KEY, 0)
 
         # End time
-        if END_TIME_KEY in params:
-            self.end = params.get(END_TIME_KEY)
-            del params[END_TIME_KEY]
-        else:
-            self.end = 0
+        self.end = params.get(END_TIME_KEY, 0)
 
         # Indicate if the start, end times and current model are final,
         # or if they will need to be refreshed later to represent a more up to date version
-        if IS_FINAL_KEY in params:
-            self.final = params.get(IS_FINAL_KEY)
-            del params[IS_FINAL_KEY]
-        else:
-            self.final = 0
+        self.final = params.get(IS_FINAL_KEY, 0)
 
         # List of compatible outputs that can be used in the same view (ex. as overlay)
-        if COMPATIBLE_PROVIDERS_KEY in params:
-            self.compatible_providers = params.get(COMPATIBLE_PROVIDERS_KEY)
-            del params[COMPATIBLE_PROVIDERS_KEY]
-        else:
-            self.compatible_providers = []
+        self.compatible_providers = params.get(COMPATIBLE_PROVIDERS_KEY, [])
 
         # Configuration used to create this data provider.
         if CONFIGURATION_KEY in params:
             self.configuration = Configuration(params.get(CONFIGURATION_KEY))
-            del params[CONFIGURATION_KEY]
         else:
             self.configuration = []
         
         # Capabilites of this data provider.
         if CAPABILITES_KEY in params:
             self.capabilities = OutputCapabilities(params.get(CAPABILITES_KEY))
-            del params[CAPABILITES_KEY]
         else:
             self.capabilities = None
 
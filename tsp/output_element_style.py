@@ -36,6 +36,7 @@ class OutputElementStyle:
     style and will have all the same style properties values as the parent and
     can add or override style properties.
     '''
+    __slots__ = ('parent_key', 'style_values')
 
     def __init__(self, params):
         '''
@@ -43,18 +44,16 @@ class OutputElementStyle:
         '''
 
         # Parent style key
-        if PARENTKEY_KEY in params:
-            self.parent_key = params.get(PARENTKEY_KEY)
-            del params[PARENTKEY_KEY]
-        else:
-            self.parent_key = None
+        self.parent_key = params.get(PARENTKEY_KEY)
 
         # Style values to override or define properties
-        if SYTLE_VALUES_KEY in params:
-            self.style_values = params.get(SYTLE_VALUES_KEY)
-            del params[SYTLE_VALUES_KEY]
-        else:
-            self.style_values = {}
+        self.style_values = params.get(SYTLE_VALUES_KEY, {})
+
+    def to_dict(self):
+        '''
+        Dictionary of the style, used by the encoders
+        '''
+        return {'parent_key': self.parent_key, 'style_values': self.style_values}
 
 
 class OutputStyleModel:
@@ -70,6 +69,5 @@ class OutputStyleModel:
         # Parent style key
         if STYLES_KEY in params:
             self.style = OutputElementStyle(params.get(STYLES_KEY))
-            del params[STYLES_KEY]
         else:
             self.style = None
@@ -23,6 +23,7 @@
 """Response classes file."""
 
 import json
+import threading
 
 from enum import Enum
 
@@ -30,8 +31,8 @@ from tsp.model_type import ModelType
 from tsp.output_descriptor import OutputDescriptor
 from tsp.virtual_table_header_model import VirtualTableHeaderModel
 from tsp.virtual_table_model import VirtualTableModel
-from tsp.time_graph_model import TimeGraphModel, TimeGraphArrow, TimeGraphModelEncoder, TimeGraphArrowEncoder
-from tsp.xy_model import XYModel
+from tsp.time_graph_model import TimeGraphModel, ColumnarTimeGraphModel, TimeGraphArrow, \
+    TimeGraphModelEncoder, TimeGraphArrowEncoder
 from tsp.entry_model import EntryModel, EntryModelEncoder
 from tsp.xy_model import XYModel, XYModelEncoder
 
@@ -40,6 +41,11 @@ OUTPUT_DESCRIPTOR_KEY = "output"
 RESPONSE_STATUS_KEY = "status"
 STATUS_MESSAGE_KEY = "statusMessage"
 
+# Model of a GenericResponse not built yet
+_UNBUILT = object()
+
+_BUILD_LOCK = threading.Lock()
+
 
 class ResponseStatus(Enum):
     '''
@@ -65,6 +71,20 @@ class ResponseStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
+# Build the model of each model type from its decoded JSON, in columnar form or not
+MODEL_BUILDERS = {
+    ModelType.TIME_GRAPH_TREE: lambda model, columnar: EntryModel(model, ModelType.TIME_GRAPH_TREE),
+    ModelType.TIME_GRAPH_STATE: lambda model, columnar:
+        ColumnarTimeGraphModel(model) if columnar else TimeGraphModel(model),
+    ModelType.TIME_GRAPH_ARROW: lambda model, columnar: [TimeGraphArrow(arrow) for arrow in model],
+    ModelType.XY_TREE: lambda model, columnar: EntryModel(model),
+    ModelType.XY: XYModel,
+    ModelType.DATA_TREE: lambda model, columnar: EntryModel(model, ModelType.DATA_TREE),
+    ModelType.VIRTUAL_TABLE_HEADER: lambda model, columnar: VirtualTableHeaderModel(model),
+    ModelType.VIRTUAL_TABLE: lambda model, columnar: VirtualTableModel(model)
+}
+
+
 # pylint: disable=too-few-public-methods
 class GenericResponse:
     '''
@@ -74,34 +94,19 @@ class GenericResponse:
     can add or override style properties.
     '''
 
-    def __init__(self, params, model_type):
+    def __init__(self, params, model_type, columnar=False):
         '''
         Constructor
+        :param params: Decoded JSON of the response
+        :param model_type: ModelType of the model in the response
+        :param columnar: Build XY series and time graph states as NumPy columns
         '''
         self.model_type = model_type
 
-        # Model returned in the response
-        self.model = params.get(MODEL_KEY)
-        if MODEL_KEY in params and params.get(MODEL_KEY) is not None:
-            if self.model_type == ModelType.TIME_GRAPH_TREE:
-                self.model = EntryModel(params.get(MODEL_KEY), self.model_type)
-            elif self.model_type == ModelType.TIME_GRAPH_STATE:
-                self.model = TimeGraphModel(params.get(MODEL_KEY))
-            elif self.model_type == ModelType.TIME_GRAPH_ARROW:
-                arrows = []
-                for arrow in params.get(MODEL_KEY):
-                    arrows.append(TimeGraphArrow(arrow))
-                self.model = arrows
-            elif self.model_type == ModelType.XY_TREE:
-                self.model = EntryModel(params.get(MODEL_KEY))
-            elif self.model_type == ModelType.XY:
-                self.model = XYModel(params.get(MODEL_KEY))
-            elif self.model_type == ModelType.DATA_TREE:
-                self.model = EntryModel(params.get(MODEL_KEY), self.model_type)
-            elif self.model_type == ModelType.VIRTUAL_TABLE_HEADER:
-                self.model = VirtualTableHeaderModel(params.get(MODEL_KEY))
-            elif self.model_type == ModelType.VIRTUAL_TABLE: 
-                self.model = VirtualTableModel(params.get(MODEL_KEY))
+        # Decoded model returned in the response, built on first access to model
+        self._model = _UNBUILT
+        self._decoded_model = params.get(MODEL_KEY)
+        self._columnar = columnar
 
         # Output descriptor
         if OUTPUT_DESCRIPTOR_KEY in params:
@@ -121,6 +126,29 @@ class GenericResponse:
         else:  # pragma: no cover
             self.status_text = ""
 
+    @property
+    def model(self):
+        '''
+        Model returned in the response, built from the decoded JSON on first access
+        '''
+        if self._model is _UNBUILT:
+            decoded = self._decoded_model
+            model = decoded
+            builder = MODEL_BUILDERS.get(self.model_type)
+            if decoded is not None and builder is not None:
+                model = builder(decoded, self._columnar)
+            with _BUILD_LOCK:
+                # Keep the first model built if concurrent accesses raced
+                if self._model is _UNBUILT:
+                    self._model = model
+                    self._decoded_model = None
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self._decoded_model = None
+
     def __repr__(self) -> str:
         return 'GenericResponse(model_type={}, model={}, output_descriptor={}, status={}, status_text={})'.format(
             self.model_type, self.model, self.output, self.status, self.status_text
@@ -0,0 +1,149 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""ResponseCache class file."""
+
+import json
+import threading
+import time
+
+from collections import OrderedDict
+
+from tsp.response import GenericResponse, ResponseStatus
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def cache_key(model_type, exp_uuid, output_id, parameters, columnar=False):
+    '''
+    Build the cache key of a data provider query
+    :param model_type: ModelType identifying the queried endpoint
+    :param exp_uuid: Experiment UUID
+    :param output_id: Output ID
+    :param parameters: Query object, canonicalized so that key order does not matter
+    :param columnar: Whether the client builds columnar models, which a cache
+                     shared with a non-columnar client must not mix up
+    '''
+    return (model_type.value, exp_uuid, output_id,
+            json.dumps(parameters, sort_keys=True, separators=(',', ':')), columnar)
+
+
+def is_cacheable(response):
+    '''
+    Check that a TspClientResponse holds a COMPLETED GenericResponse
+    '''
+    return isinstance(response.model, GenericResponse) \
+        and response.model.status == ResponseStatus.COMPLETED
+
+
+class ResponseCache:
+    '''
+    In-memory LRU cache of completed data provider responses, bounded by the
+    size of the response bodies and optionally expiring entries after a TTL
+    '''
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, ttl=None):
+        '''
+        Constructor
+        :param max_bytes: Maximum total size of the cached response bodies
+        :param ttl: Time to live of an entry in seconds, or None for no expiry
+        '''
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # Number of lookups answered, or not, from the cache
+        self.hits = 0
+        self.misses = 0
+
+        # Total size of the cached response bodies
+        self.size = 0
+
+        # key -> (TspClientResponse, size, expiry), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        '''
+        Look up a response
+        :param key: Key built by cache_key()
+        :returns: The cached TspClientResponse, or None
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, response, content):
+        '''
+        Store a response if it holds a COMPLETED GenericResponse
+        :param key: Key built by cache_key()
+        :param response: TspClientResponse to store
+        :param content: Raw response body, used to account for the entry size
+        '''
+        if not is_cacheable(response):
+            return
+        size = len(content)
+        if size > self.max_bytes:
+            return
+        expiry = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (response, size, expiry)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, exp_uuid):
+        '''
+        Drop every cached response of an experiment
+        :param exp_uuid: Experiment UUID
+        '''
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == exp_uuid]:
+                self._remove(key)
+
+    def clear(self):
+        '''
+        Drop every cached response
+        '''
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        self.size -= self._entries.pop(key)[1]
+
+    def __repr__(self):
+        return (f'ResponseCache(entries={len(self._entries)}, size={self.size}, '
+                f'hits={self.hits}, misses={self.misses})')
@@ -0,0 +1,103 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""ResponseStream class file."""
+
+from tsp.json_stream import JsonArrayStream
+from tsp.model_type import ModelType
+from tsp.output_descriptor import OutputDescriptor
+from tsp.response import ResponseStatus, MODEL_KEY, OUTPUT_DESCRIPTOR_KEY, RESPONSE_STATUS_KEY, \
+    STATUS_MESSAGE_KEY
+from tsp.time_graph_model import TimeGraphRow, ROWS_KEY
+from tsp.virtual_table_model import VirtualTableLine, LINES_KEY
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Path to the streamed array of each model type, and class of its elements
+STREAMED_ARRAYS = {
+    ModelType.TIME_GRAPH_STATE: ((MODEL_KEY, ROWS_KEY), TimeGraphRow),
+    ModelType.VIRTUAL_TABLE: ((MODEL_KEY, LINES_KEY), VirtualTableLine)
+}
+
+
+class ResponseStream:
+    '''
+    Generic response whose model elements, TimeGraphRow or VirtualTableLine,
+    are built one at a time while the HTTP response body is read. It can be
+    iterated once. The status, status text, output descriptor and the rest of
+    the model (e.g. the table size) are set once the iteration is done.
+    '''
+
+    def __init__(self, response, model_type, chunk_size=DEFAULT_CHUNK_SIZE):
+        '''
+        Constructor
+        :param response: requests.Response opened with stream=True
+        :param model_type: ModelType.TIME_GRAPH_STATE or ModelType.VIRTUAL_TABLE
+        :param chunk_size: Number of bytes read from the body at once
+        '''
+        self.model_type = model_type
+
+        # Decoded model without the streamed elements, then status, once iterated
+        self.model = None
+        self.output = None
+        self.status = None
+        self.status_text = None
+
+        self._response = response
+        self._chunk_size = chunk_size
+        self._iterated = False
+
+    def __iter__(self):
+        if self._iterated:
+            raise RuntimeError("A response stream can only be iterated once")
+        self._iterated = True
+
+        path, element_class = STREAMED_ARRAYS[self.model_type]
+        stream = JsonArrayStream(self._response.iter_content(self._chunk_size), path)
+        try:
+            for element in stream:
+                yield element_class(element)
+        finally:
+            self.close()
+
+        envelope = stream.envelope
+        self.model = envelope.get(MODEL_KEY)
+        if envelope.get(OUTPUT_DESCRIPTOR_KEY) is not None:
+            self.output = OutputDescriptor(envelope.get(OUTPUT_DESCRIPTOR_KEY))
+        self.status = ResponseStatus(envelope.get(RESPONSE_STATUS_KEY, ResponseStatus.FAILED.value))
+        self.status_text = envelope.get(STATUS_MESSAGE_KEY, "")
+
+    def close(self):
+        '''
+        Release the connection, dropping the elements not read yet
+        '''
+        self._response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'ResponseStream(model_type={self.model_type}, status={self.status})'
@@ -0,0 +1,110 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""SingleFlight classes file."""
+
+import threading
+
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    '''
+    Coalesce identical concurrent calls: while a call for a key is in flight,
+    other threads asking for the same key wait for it and share its result
+    '''
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        # Number of calls answered by another call in flight
+        self.coalesced = 0
+
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        '''
+        Call function, unless a call for the same key is already in flight
+        :param key: Hashable identity of the call
+        :param function: Callable without arguments doing the actual call
+        :returns: The result of the call, shared by all coalesced callers
+        '''
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    '''
+    Coalesce identical concurrent coroutine calls within one event loop
+    '''
+
+    def __init__(self):
+        '''
+        Constructor
+        '''
+        # Number of calls answered by another call in flight
+        self.coalesced = 0
+
+        self._calls = {}
+
+    async def do(self, key, function):
+        '''
+        Await function(), unless a call for the same key is already in flight
+        :param key: Hashable identity of the call
+        :param function: Coroutine function without arguments doing the actual call
+        :returns: The result of the call, shared by all coalesced callers
+        '''
+        # Only loaded with the event loop, not by the synchronous clients
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        # A cancelled caller must not cancel the call shared with the others
+        return await asyncio.shield(task)
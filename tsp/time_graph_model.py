@@ -39,6 +39,10 @@ STYLE_KEY = "style"
 SOURCE_ID_TAG = "sourceId"
 TARGET_ID_TAG = "targetId"
 
+# Value of the columnar entry ids of the rows, and values and tags of the
+# states, without any
+NO_VALUE = -2**63
+
 # pylint: disable=too-few-public-methods
 
 
@@ -46,29 +50,22 @@ class TimeGraphEntry(Entry):
     '''
     Entry in a time graph
     '''
+    __slots__ = ('type', 'start_time', 'end_time', 'has_row_model')
 
     def __init__(self, params):
         super().__init__(params)
 
         # Type of the entry
-        if TYPE_KEY in params:
-            self.type = params.get(TYPE_KEY)
-            del params[TYPE_KEY]
+        self.type = params.get(TYPE_KEY)
 
         # Start time of the entry
-        if START_TIME_KEY in params:
-            self.start_time = params.get(START_TIME_KEY)
-            del params[START_TIME_KEY]
+        self.start_time = params.get(START_TIME_KEY)
 
         # End time of the entry
-        if END_TIME_KEY in params:
-            self.end_time = params.get(END_TIME_KEY)
-            del params[END_TIME_KEY]
+        self.end_time = params.get(END_TIME_KEY)
 
         # Indicate if the entry will have row data
-        if HAS_ROW_MODEL_KEY in params:
-            self.has_row_model = params.get(HAS_ROW_MODEL_KEY)
-            del params[HAS_ROW_MODEL_KEY]
+        self.has_row_model = params.get(HAS_ROW_MODEL_KEY)
 
     def __repr__(self) -> str:
         return 'TimeGraphEntry(start={}, end={})'.format(self.start_time, self.end_time)
@@ -79,15 +76,118 @@ class TimeGraphModel:
     '''
 
     def __init__(self, params):
-        self.rows = []
-        if ROWS_KEY in params:
-            for row in params.get(ROWS_KEY):
-                self.rows.append(TimeGraphRow(row))
-            del params[ROWS_KEY]
+        self.rows = [TimeGraphRow(row) for row in params.get(ROWS_KEY, [])]
 
     def __repr__(self) -> str:
         return 'TimeGraphModel({})'.format(', '.join(str(row) for row in self.rows))
 
+class ColumnarTimeGraphModel:
+    '''
+    Time Graph model stored as columns: the states of all the rows are
+    flattened into NumPy arrays, the states of the row at index i being at
+    indexes row_offsets[i] to row_offsets[i + 1]. Labels and styles are
+    dictionary encoded, a code of -1 meaning none.
+    '''
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, params):
+        # pylint: disable=import-outside-toplevel,too-many-locals
+        import numpy as np
+
+        entry_ids = []
+        row_offsets = [0]
+        start_times = []
+        end_times = []
+        values = []
+        tags = []
+        label_codes = []
+        style_codes = []
+        labels = {}
+        styles = {}
+        self.label_dictionary = []
+        self.style_dictionary = []
+
+        for row in params.get(ROWS_KEY, []):
+            entry_id = row.get(ENTRY_ID_KEY)
+            entry_ids.append(NO_VALUE if entry_id is None else entry_id)
+            for state in row.get(STATES_KEY, []):
+                start_times.append(state.get(START_TIME_KEY))
+                end_times.append(state.get(END_TIME_KEY))
+                # An explicit null is no value, as a missing key is
+                value = state.get(VALUE_KEY)
+                values.append(NO_VALUE if value is None else value)
+                state_tags = state.get(TAGS_KEY)
+                tags.append(NO_VALUE if state_tags is None else state_tags)
+
+                label = state.get(LABEL_KEY)
+                code = -1
+                if label is not None:
+                    code = labels.get(label)
+                    if code is None:
+                        code = labels[label] = len(self.label_dictionary)
+                        self.label_dictionary.append(label)
+                label_codes.append(code)
+
+                style = state.get(STYLE_KEY)
+                code = -1
+                if style is not None:
+                    style_key = json.dumps(style, sort_keys=True)
+                    code = styles.get(style_key)
+                    if code is None:
+                        code = styles[style_key] = len(self.style_dictionary)
+                        self.style_dictionary.append(style)
+                style_codes.append(code)
+            row_offsets.append(len(start_times))
+
+        # Entry Id of each row, and offset of its first state
+        self.entry_ids = np.array(entry_ids, dtype=np.int64)
+        self.row_offsets = np.array(row_offsets, dtype=np.int64)
+
+        # Columns of the states of all the rows
+        self.start_times = np.array(start_times, dtype=np.int64)
+        self.end_times = np.array(end_times, dtype=np.int64)
+        self.values = np.array(values, dtype=np.int64)
+        self.tags = np.array(tags, dtype=np.int64)
+        self.label_codes = np.array(label_codes, dtype=np.int32)
+        self.style_codes = np.array(style_codes, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.entry_ids)
+
+    def row(self, index):
+        '''
+        Build the object view of one row
+        :param index: Index of the row
+        :returns: TimeGraphRow with the states of the row
+        '''
+        states = []
+        for position in range(self.row_offsets[index], self.row_offsets[index + 1]):
+            state = {START_TIME_KEY: int(self.start_times[position]),
+                     END_TIME_KEY: int(self.end_times[position])}
+            if self.values[position] != NO_VALUE:
+                state[VALUE_KEY] = int(self.values[position])
+            if self.tags[position] != NO_VALUE:
+                state[TAGS_KEY] = int(self.tags[position])
+            if self.label_codes[position] >= 0:
+                state[LABEL_KEY] = self.label_dictionary[self.label_codes[position]]
+            if self.style_codes[position] >= 0:
+                state[STYLE_KEY] = self.style_dictionary[self.style_codes[position]]
+            states.append(state)
+        row = {STATES_KEY: states}
+        if self.entry_ids[index] != NO_VALUE:
+            row[ENTRY_ID_KEY] = int(self.entry_ids[index])
+        return TimeGraphRow(row)
+
+    @property
+    def rows(self):
+        '''
+        Object view of the rows, built on each access
+        '''
+        return [self.row(index) for index in range(len(self))]
+
+    def __repr__(self) -> str:
+        return 'ColumnarTimeGraphModel(rows={}, states={})'.format(len(self), len(self.start_times))
+
 class TimeGraphRow:
     '''
     Time graph row described by an array of states for a specific entry
@@ -99,14 +199,9 @@ class TimeGraphRow:
         '''
         if ENTRY_ID_KEY in params:
             self.entry_id = params.get(ENTRY_ID_KEY)
-            del params[ENTRY_ID_KEY]
 
         # Array of states
-        self.states = []
-        if STATES_KEY in params:
-            for state in params.get(STATES_KEY):
-                self.states.append(TimeGraphState(state))
-            del params[STATES_KEY]
+        self.states = [TimeGraphState(state) for state in params.get(STATES_KEY, [])]
 
     def __repr__(self) -> str:
         return 'TimeGraphRow({})'.format(', '.join([str(state) for state in self.states]))
@@ -116,39 +211,28 @@ class TimeGraphState:
     '''
     Time graph state
     '''
+    __slots__ = ('start_time', 'end_time', 'label', 'value', 'tags', 'style')
 
     def __init__(self, params):
         '''
         Start time of the state
         '''
-        if START_TIME_KEY in params:
-            self.start_time = params.get(START_TIME_KEY)
-            del params[START_TIME_KEY]
+        self.start_time = params.get(START_TIME_KEY)
 
         # Duration of the state
-        if END_TIME_KEY in params:
-            self.end_time = params.get(END_TIME_KEY)
-            del params[END_TIME_KEY]
+        self.end_time = params.get(END_TIME_KEY)
 
         # Label to apply to the state
-        if LABEL_KEY in params:
-            self.label = params.get(LABEL_KEY)
-            del params[LABEL_KEY]
+        self.label = params.get(LABEL_KEY)
 
         # Values associated to the state
-        if VALUE_KEY in params:
-            self.value = params.get(VALUE_KEY)
-            del params[VALUE_KEY]
+        self.value = params.get(VALUE_KEY)
 
         # Tags for the state, used when the state pass a filter
-        if TAGS_KEY in params:
-            self.tags = params.get(TAGS_KEY)
-            del params[TAGS_KEY]
+        self.tags = params.get(TAGS_KEY)
 
         # Optional information on the style to format this state
-        if STYLE_KEY in params:
-            self.style = params.get(STYLE_KEY)
-            del params[STYLE_KEY]
+        self.style = params.get(STYLE_KEY)
 
     def __repr__(self) -> str:
         return 'TimeGraphState({}start={}, end={})'.format(f'label={self.label}, ',self.start_time, self.end_time)
@@ -158,44 +242,31 @@ class TimeGraphArrow:
     '''
     Arrow for time graph
     '''
+    __slots__ = ('source_id', 'target_id', 'start', 'end', 'duration', 'value', 'style')
 
     def __init__(self, params):
         '''
         Source entry Id for the arrow
         '''
-        if SOURCE_ID_TAG in params:
-            self.source_id = params.get(SOURCE_ID_TAG)
-            del params[SOURCE_ID_TAG]
+        self.source_id = params.get(SOURCE_ID_TAG)
 
         # Destination entry Id for the arrow
-        if TARGET_ID_TAG in params:
-            self.target_id = params.get(TARGET_ID_TAG)
-            del params[TARGET_ID_TAG]
+        self.target_id = params.get(TARGET_ID_TAG)
 
         # Start time of the arrow
-        if START_TIME_KEY in params:
-            self.start = params.get(START_TIME_KEY)
-            del params[START_TIME_KEY]
+        self.start = params.get(START_TIME_KEY)
 
         # Duration of the state
-        if END_TIME_KEY in params:
-            self.end = params.get(END_TIME_KEY)
-            del params[END_TIME_KEY]
+        self.end = params.get(END_TIME_KEY)
 
         # Duration of the arrow
-        if DURATION_KEY in params:
-            self.duration = params.get(DURATION_KEY)
-            del params[DURATION_KEY]
+        self.duration = params.get(DURATION_KEY)
 
         # Value associated to the arrow
-        if VALUE_KEY in params:
-            self.value = params.get(VALUE_KEY)
-            del params[VALUE_KEY]
+        self.value = params.get(VALUE_KEY)
 
         # Optional information on the style to format this arrow
-        if STYLE_KEY in params:
-            self.style = params.get(STYLE_KEY)
-            del params[STYLE_KEY]
+        self.style = params.get(STYLE_KEY)
 
 class TimeGraphEntryEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -213,7 +284,7 @@ class TimeGraphEntryEncoder(json.JSONEncoder):
 
 class TimeGraphModelEncoder(json.JSONEncoder):
     def default(self, obj):
-        if isinstance(obj, TimeGraphModel):
+        if isinstance(obj, (TimeGraphModel, ColumnarTimeGraphModel)):
             return {
                 'rows': [TimeGraphRowEncoder().default(row) for row in obj.rows]
             }
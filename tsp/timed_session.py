@@ -0,0 +1,92 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""TimedSession class file."""
+
+from urllib.parse import urlsplit
+
+import requests
+
+from tsp.deadline import DeadlineExceeded, DEADLINE_EXCEEDED, bound_timeout, remaining
+
+# Connect and read timeouts, in seconds
+DEFAULT_TIMEOUT = (3.05, 60)
+
+# Timeouts overriding the default one, by last segment of the endpoint path
+DEFAULT_ENDPOINT_TIMEOUTS = {
+    'health': (1, 2),
+    'identifier': (1, 5),
+    'states': (3.05, 300),
+    'arrows': (3.05, 300),
+    'xy': (3.05, 300),
+    'lines': (3.05, 300),
+}
+
+# Index of timeout in the positional arguments of requests.Session.request, after url
+TIMEOUT_ARGUMENT = 6
+
+
+def endpoint_timeout(url, timeouts, default):
+    '''
+    Get the timeout of an endpoint
+    :param url: URL of the endpoint
+    :param timeouts: Timeouts by last segment of the endpoint path, e.g. 'health'
+    :param default: Timeout of the endpoints missing from timeouts
+    :returns: Timeout, as for requests
+    '''
+    endpoint = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+    return timeouts.get(endpoint, default)
+
+
+class TimedSession(requests.Session):
+    '''
+    Keep-alive session giving every request its endpoint timeout, bounded by
+    the current deadline
+    '''
+
+    def __init__(self, timeout_for):
+        '''
+        Constructor
+        :param timeout_for: Callable returning the timeout of a URL, used by the
+                            requests not given one
+        '''
+        super().__init__()
+        self._timeout_for = timeout_for
+
+    def request(self, method, url, *args, **kwargs):  # pylint: disable=arguments-differ
+        # The timeout may be given by keyword or by position, as for requests
+        args = list(args)
+        if len(args) > TIMEOUT_ARGUMENT:
+            args[TIMEOUT_ARGUMENT] = self._bound_timeout(url, args[TIMEOUT_ARGUMENT])
+        else:
+            kwargs['timeout'] = self._bound_timeout(url, kwargs.get('timeout'))
+        try:
+            return super().request(method, url, *args, **kwargs)
+        except requests.exceptions.Timeout as ex:
+            left = remaining()
+            if left is not None and left <= 0:
+                raise DeadlineExceeded(DEADLINE_EXCEEDED.format(-left)) from ex
+            raise
+
+    def _bound_timeout(self, url, timeout):
+        return bound_timeout(self._timeout_for(url) if timeout is None else timeout)
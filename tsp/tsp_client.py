@@ -22,14 +22,19 @@
 
 """TspClient class file."""
 
-import json
-import requests
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+from tsp.indexing_status import IndexingStatus
 from tsp.trace import Trace
 from tsp.trace_set import TraceSet
 from tsp.tsp_client_response import TspClientResponse
 from tsp.output_descriptor_set import OutputDescriptorSet
-from tsp.response import GenericResponse, ModelType
+from tsp.response import GenericResponse, ModelType, ResponseStatus
 from tsp.configuration_source_set import ConfigurationSourceSet
 from tsp.configuration_source import ConfigurationSource
 from tsp.configuration import Configuration
@@ -39,6 +44,17 @@ from tsp.experiment import Experiment
 from tsp.output_descriptor import OutputDescriptor
 from tsp.health import Health
 from tsp.identifier import Identifier
+from tsp import json_codec
+from tsp.backoff import Backoff
+from tsp.bulk_delete import delete_all, select
+from tsp.deadline import bind_context, poll
+from tsp.response_cache import cache_key
+from tsp.response_stream import ResponseStream, DEFAULT_CHUNK_SIZE
+from tsp.single_flight import SingleFlight
+from tsp.timed_session import TimedSession, DEFAULT_TIMEOUT, DEFAULT_ENDPOINT_TIMEOUTS, \
+    endpoint_timeout
+from tsp.xy_tiling import split_parameters, stitch_xy_responses
+from tsp.virtual_table_pager import VirtualTablePager, PageSizer
 
 APPLICATION_JSON = 'application/json'
 
@@ -50,9 +66,10 @@ GET_TREE_FAILED = "failed to get tree: {0}"
 GET_STATES_FAILED = "failed to get states: {0}"
 GET_ARROWS_FAILED = "failed to get arrows: {0}"
 GET_CONFIG_SOURCE_TYPES = "failed to get config source type(s): {} {}"
+STILL_RUNNING = "still running after {0} seconds: {1}"
 
 
-# pylint: disable=consider-using-f-string,missing-timeout
+# pylint: disable=consider-using-f-string
 
 
 class TspClient:
@@ -75,12 +92,143 @@ class TspClient:
     REQUESTED_TABLE_LINE_SEACH_DIRECTION_KEY = 'table_search_direction'
     REQUESTED_TABLE_LINE_SEARCH_EXPRESSION_KEY = 'table_search_expressions'
 
-    def __init__(self, base_url):
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_XY_TILE_POINTS = 20000
+
+    # Default timeout of the requests, and its overrides by last segment of the endpoint path
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+    DEFAULT_ENDPOINT_TIMEOUTS = DEFAULT_ENDPOINT_TIMEOUTS
+
+    def __init__(self, base_url, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, cache=None, coalesce=False,
+                 columnar=False, retain_body=True, timeout=DEFAULT_TIMEOUT, timeouts=None):
         '''
         Constructor
+        :param base_url: Base URL of the trace server TSP API
+        :param pool_connections: Number of host connection pools to cache
+        :param pool_maxsize: Maximum number of connections kept alive per host
+        :param cache: Optional :class:`ResponseCache` of completed data provider responses
+        :param coalesce: Share one request between concurrent identical data provider queries
+        :param columnar: Build XY series and time graph states as NumPy columns
+        :param retain_body: Keep the raw body of successful responses as their status_text
+        :param timeout: Default timeout of the requests, in seconds, as for requests: a
+                        (connect, read) tuple, a single number for both, or None to wait forever
+        :param timeouts: Timeouts overriding the default one and DEFAULT_ENDPOINT_TIMEOUTS, by
+                         last segment of the endpoint path, e.g. 'health' or 'states'
         '''
         self.base_url = base_url if base_url.endswith('/') else base_url + '/'
 
+        # Cache of completed data provider responses, or None
+        self.cache = cache
+
+        # Whether XY series and time graph states are NumPy columns rather than objects
+        self.columnar = columnar
+
+        # Whether successful responses keep their raw body, otherwise only errors do
+        self.retain_body = retain_body
+
+        # Coalescing of identical data provider queries in flight, or None
+        self._single_flight = SingleFlight() if coalesce else None
+
+        # Timeout of the requests, and its overrides by last segment of the endpoint path
+        self.timeout = timeout
+        self.timeouts = dict(self.DEFAULT_ENDPOINT_TIMEOUTS, **(timeouts or {}))
+
+        # Keep-alive session shared by all endpoint methods
+        self._session = TimedSession(
+            lambda url: endpoint_timeout(url, self.timeouts, self.timeout))
+        self._pool_maxsize = pool_maxsize
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def close(self):
+        '''
+        Close the pooled connections held by this client
+        '''
+        self._session.close()
+
+    @property
+    def coalesced_calls(self):
+        '''
+        Number of data provider queries answered by an identical query in flight
+        '''
+        return 0 if self._single_flight is None else self._single_flight.coalesced
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _status_text(self, response):
+        # Raw body of a successful response, only decoded if its status_text is read
+        return response.content if self.retain_body else ''
+
+    def _fetch_generic(self, api_url, params, model_type, exp_uuid, output_id, error_message):
+        if self.cache is None and self._single_flight is None:
+            return self._post_generic(api_url, params, model_type, None, error_message)
+
+        key = cache_key(model_type, exp_uuid, output_id, params, self.columnar)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self._single_flight is None:
+            return self._post_generic(api_url, params, model_type, key, error_message)
+        return self._single_flight.do(
+            key, lambda: self._post_generic(api_url, params, model_type, key, error_message))
+
+    def _post_generic(self, api_url, params, model_type, key, error_message):
+        response = self._session.post(api_url, data=json_codec.dumps(params), headers=headers)
+
+        if response.status_code == 200:
+            tsp_response = TspClientResponse(GenericResponse(json_codec.loads(response.content),
+                                                             model_type, self.columnar),
+                                             response.status_code, self._status_text(response))
+            if self.cache is not None:
+                self.cache.put(key, tsp_response, response.content)
+            return tsp_response
+        else:  # pragma: no cover
+            print(error_message.format(response.status_code))
+            return TspClientResponse(None, response.status_code, response.text)
+
+    def _stream_generic(self, api_url, params, model_type, callback, chunk_size, error_message):
+        response = self._session.post(api_url, data=json_codec.dumps(params), headers=headers,
+                                      stream=True)
+
+        if response.status_code == 200:
+            stream = ResponseStream(response, model_type, chunk_size)
+            if callback is not None:
+                for element in stream:
+                    callback(element)
+            return TspClientResponse(stream, response.status_code, '')
+        else:  # pragma: no cover
+            print(error_message.format(response.status_code))
+            return TspClientResponse(None, response.status_code, response.text)
+
+    def await_completion(self, fetch, *args, timeout=None, backoff=None, progress=None, **kwargs):
+        '''
+        Call an endpoint returning a GenericResponse until its status is no longer RUNNING
+        :param fetch: Endpoint method of this client, e.g. fetch_xy or fetch_timegraph_tree
+        :param args: Positional arguments of the endpoint
+        :param timeout: Overall deadline in seconds, or None to wait forever
+        :param backoff: :class:`Backoff` policy between calls, or None for the default one
+        :param progress: Callable receiving each RUNNING TspClientResponse
+        :param kwargs: Keyword arguments of the endpoint
+        :returns: :class:  `TspClientResponse <GenericResponse>` first response not RUNNING
+        :rtype: TspClientResponse
+        :raises TimeoutError: If the response is still RUNNING when the timeout expires
+        '''
+        return poll(lambda: fetch(*args, **kwargs),
+                    lambda response: response.model is not None
+                    and response.model.status == ResponseStatus.RUNNING,
+                    (backoff or Backoff()).delays(timeout),
+                    STILL_RUNNING.format(timeout, fetch.__name__), progress)
+
     def fetch_traces(self):
         '''
         Fetch all available traces on the server
@@ -88,10 +236,10 @@ class TspClient:
         :rtype: TspClientResponse
         '''
         api_url = '{0}traces'.format(self.base_url)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(TraceSet(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(TraceSet(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("get traces failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -104,10 +252,10 @@ class TspClient:
         :rtype: TspClientResponse
         '''
         api_url = '{0}traces/{1}'.format(self.base_url, uuid)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(Trace(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Trace(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:
             print("get trace failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -124,10 +272,59 @@ class TspClient:
         my_parameters = {'name': name, 'uri': path}
         parameters = {'parameters': my_parameters}
 
-        response = requests.post(api_url, json=parameters, headers=headers)
+        response = self._session.post(api_url, data=json_codec.dumps(parameters), headers=headers)
         response.raise_for_status()
-        return TspClientResponse(Trace(json.loads(response.content.decode('utf-8'))),
-                                 response.status_code, response.text)
+        return TspClientResponse(Trace(json_codec.loads(response.content)),
+                                 response.status_code, self._status_text(response))
+
+    def open_traces(self, names, paths, max_workers=None):
+        '''
+        Open traces on the server, concurrently
+        :param names: Names of the traces
+        :param paths: Paths of the traces, in the order of names
+        :param max_workers: Maximum number of traces opened at once, or None for the pool size
+        :returns: List of :class:`TspClientResponse <Trace>`, in the order of paths
+        :raises requests.HTTPError: If a trace failed to open, once the others are opened
+        '''
+        with ThreadPoolExecutor(max_workers=max_workers or self._pool_maxsize) as executor:
+            return list(executor.map(bind_context(self.open_trace), names, paths))
+
+    def await_indexing(self, uuids, timeout=None, backoff=None, progress=None, max_workers=None):
+        '''
+        Poll traces, concurrently, until none of them is still indexing
+        :param uuids: UUIDs of the traces
+        :param timeout: Overall deadline in seconds, or None to wait forever
+        :param backoff: :class:`Backoff` policy between the polls of a trace, or None for
+                        the default one
+        :param progress: Callable receiving the number of traces done indexing and
+                         the number of traces, each time a trace is done
+        :param max_workers: Maximum number of traces polled at once, or None for the pool size
+        :returns: List of the last :class:`TspClientResponse <Trace>` of each trace, in the
+                  order of uuids
+        :raises TimeoutError: If a trace is still indexing when the timeout expires
+        '''
+        uuids = list(uuids)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        lock = threading.Lock()
+        done = 0
+
+        def wait(uuid):
+            nonlocal done
+            # Traces queued behind others share the same deadline
+            delays = (backoff or Backoff()).delays(
+                None if deadline is None else deadline - time.monotonic())
+            response = poll(lambda: self.fetch_trace(uuid),
+                            lambda response: response.model is not None
+                            and response.model.indexing_status == IndexingStatus.RUNNING,
+                            delays, STILL_RUNNING.format(timeout, uuid))
+            if progress is not None:
+                with lock:
+                    done += 1
+                    progress(done, len(uuids))
+            return response
+
+        with ThreadPoolExecutor(max_workers=max_workers or self._pool_maxsize) as executor:
+            return list(executor.map(bind_context(wait), uuids))
 
     def delete_trace(self, uuid, delete_trace, remove_cache=False):
         '''
@@ -138,6 +335,12 @@ class TspClient:
         :return: :class:`TspClientResponse <Trace>` object
         :rtype: TspClientResponse
         '''
+        response = self._delete_trace(uuid, delete_trace, remove_cache)
+        if response.status_code != 200:  # pragma: no cover
+            print("delete trace failed: {0}".format(response.status_code))
+        return response
+
+    def _delete_trace(self, uuid, delete_trace, remove_cache=False):
         api_url = '{0}traces/{1}'.format(self.base_url, uuid)
         parameters = {}
         if delete_trace:  # pragma: no cover
@@ -146,13 +349,38 @@ class TspClient:
         if remove_cache:
             parameters['removeCache'] = "true"
 
-        response = requests.delete(api_url, json=parameters, headers=headers)
+        response = self._session.delete(api_url, data=json_codec.dumps(parameters), headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(Trace(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print("delete trace failed: {0}".format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+            if self.cache is not None:
+                # Cached responses are only keyed by experiment, and any of them may use the trace
+                self.cache.clear()
+            return TspClientResponse(Trace(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
+        return TspClientResponse(None, response.status_code, response.text)
+
+    def delete_traces(self, uuids=None, delete_trace=False, remove_cache=False, name=None,
+                      ended_before=None, indexing_status=None, max_workers=None):
+        '''
+        Delete traces on the server, concurrently
+        :param uuids: UUIDs of the traces to delete, or None for all the traces matching
+                      the filters
+        :param delete_trace: Also delete the traces from disk
+        :param remove_cache: Remove all cache for these traces
+        :param name: Only delete the traces whose name matches this glob pattern
+        :param ended_before: Only delete the traces whose last event is before this
+                             timestamp, in nanoseconds since the epoch
+        :param indexing_status: Only delete the traces with this :class:`IndexingStatus`
+        :param max_workers: Maximum number of deletions at once, or None for the pool size
+        :returns: :class:`BulkDeleteResult` of the deletions, or None if the traces
+                  could not be listed
+        :raises ValueError: If neither UUIDs nor filters are given
+        '''
+        uuids = select(uuids, self.fetch_traces, 'traces', name, ended_before, indexing_status)
+        if uuids is None:
+            return None
+        return delete_all(uuids,
+                          lambda uuid: self._delete_trace(uuid, delete_trace, remove_cache),
+                          max_workers or self._pool_maxsize)
 
     def fetch_experiments(self):
         '''
@@ -161,10 +389,10 @@ class TspClient:
         :rtype: TspClientResponse
         '''
         api_url = '{0}experiments'.format(self.base_url)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(ExperimentSet(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(ExperimentSet(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("get experiments failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -177,10 +405,10 @@ class TspClient:
         :rtype: TspClientResponse
         '''
         api_url = '{0}experiments/{1}'.format(self.base_url, uuid)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(Experiment(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Experiment(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:
             print("get trace failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -192,14 +420,41 @@ class TspClient:
         :return: :class:`TspClientResponse <Trace>` object
         :rtype: TspClientResponse
         '''
+        response = self._delete_experiment(uuid)
+        if response.status_code != 200:  # pragma: no cover
+            print("delete experiment failed: {0}".format(response.status_code))
+        return response
+
+    def _delete_experiment(self, uuid):
         api_url = '{0}experiments/{1}'.format(self.base_url, uuid)
-        response = requests.delete(api_url, headers=headers)
+        response = self._session.delete(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(Experiment(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print("delete experiment failed: {0}".format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+            if self.cache is not None:
+                self.cache.invalidate(uuid)
+            return TspClientResponse(Experiment(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
+        return TspClientResponse(None, response.status_code, response.text)
+
+    def delete_experiments(self, uuids=None, name=None, ended_before=None, indexing_status=None,
+                           max_workers=None):
+        '''
+        Delete experiments on the server, concurrently; their traces remain open
+        :param uuids: UUIDs of the experiments to delete, or None for all the experiments
+                      matching the filters
+        :param name: Only delete the experiments whose name matches this glob pattern
+        :param ended_before: Only delete the experiments whose last event is before this
+                             timestamp, in nanoseconds since the epoch
+        :param indexing_status: Only delete the experiments with this :class:`IndexingStatus`
+        :param max_workers: Maximum number of deletions at once, or None for the pool size
+        :returns: :class:`BulkDeleteResult` of the deletions, or None if the experiments
+                  could not be listed
+        :raises ValueError: If neither UUIDs nor filters are given
+        '''
+        uuids = select(uuids, self.fetch_experiments, 'experiments', name, ended_before,
+                       indexing_status)
+        if uuids is None:
+            return None
+        return delete_all(uuids, self._delete_experiment, max_workers or self._pool_maxsize)
 
     def open_experiment(self, name, traces):
         '''
@@ -212,11 +467,11 @@ class TspClient:
         my_parameters = {'name': name, 'traces': traces}
         parameters = {'parameters': my_parameters}
 
-        response = requests.post(api_url, json=parameters, headers=headers)
+        response = self._session.post(api_url, data=json_codec.dumps(parameters), headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(Experiment(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Experiment(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("post experiment failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -230,12 +485,11 @@ class TspClient:
         '''
         api_url = '{0}experiments/{1}/outputs'.format(self.base_url, exp_uuid)
 
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(OutputDescriptorSet(json.loads(
-                response.content.decode('utf-8'))),
-                response.status_code, response.text)
+            return TspClientResponse(OutputDescriptorSet(json_codec.loads(response.content)),
+                response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("get output descriptors failed: {0}".format(
                 response.status_code))
@@ -253,11 +507,11 @@ class TspClient:
         api_url = '{0}experiments/{1}/outputs/{2}'.format(
             self.base_url, exp_uuid, output_id)
 
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(OutputDescriptor(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(OutputDescriptor(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print(GET_TREE_FAILED.format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -278,15 +532,8 @@ class TspClient:
         if parameters is None:
             params = {}
 
-        response = requests.post(api_url, json=params, headers=headers)
-
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.DATA_TREE),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print(GET_TREE_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+        return self._fetch_generic(api_url, params, ModelType.DATA_TREE,
+                                   exp_uuid, output_id, GET_TREE_FAILED)
 
     def fetch_virtual_table_columns(self, exp_uuid, output_id):
         '''
@@ -299,15 +546,8 @@ class TspClient:
         api_url = '{0}experiments/{1}/outputs/table/{2}/columns'.format(
             self.base_url, exp_uuid, output_id)
 
-        response = requests.post(api_url, json={}, headers=headers)
-
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.VIRTUAL_TABLE_HEADER),
-                                     response.status_code, response.text)
-        else:
-            print(GET_TREE_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+        return self._fetch_generic(api_url, {}, ModelType.VIRTUAL_TABLE_HEADER,
+                                   exp_uuid, output_id, GET_TREE_FAILED)
 
     def fetch_virtual_table_lines(self, exp_uuid, output_id, parameters=None):
         '''
@@ -327,15 +567,56 @@ class TspClient:
                 TspClient.PARAMETERS_KEY: {}
             }
 
-        response = requests.post(api_url, json=params, headers=headers)
+        return self._fetch_generic(api_url, params, ModelType.VIRTUAL_TABLE,
+                                   exp_uuid, output_id, GET_TREE_FAILED)
 
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.VIRTUAL_TABLE),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print(GET_TREE_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+    def iter_virtual_table_lines(self, exp_uuid, output_id, parameters=None, page_size=1000,
+                                 max_page_size=50000, target_page_seconds=0.5, prefetch=True):
+        '''
+        Iterate lazily over Virtual Table lines, fetching them page by page
+        :param exp_uuid: Experiment UUID
+        :param output_id: Output ID
+        :param parameters: Query object of the first page, e.g. its starting index or
+                           time, columns or search; its line count is ignored
+        :param page_size: Number of lines of the first page
+        :param max_page_size: Upper bound of the page size, bounding memory use
+        :param target_page_seconds: Time targeted per page when adapting the page size
+                                    to the measured throughput, or None for fixed pages
+        :param prefetch: Fetch the next page while the current one is consumed
+        :returns: :class:`VirtualTablePager` iterable of VirtualTableLine; its size
+                  attribute holds the table size once the first page is received
+        :raises requests.HTTPError: If a page cannot be fetched, or is empty before the table end
+        '''
+        page_sizer = PageSizer(page_size, min(page_size, 100), max_page_size, target_page_seconds)
+        return VirtualTablePager(self, exp_uuid, output_id, parameters, page_sizer, prefetch)
+
+    def stream_virtual_table_lines(self, exp_uuid, output_id, parameters=None, callback=None,
+                                   chunk_size=DEFAULT_CHUNK_SIZE):
+        '''
+        Fetch Virtual Table lines, building each line while the response is read
+        so that memory use is bounded by one line rather than the whole response.
+        Responses are neither cached nor coalesced.
+        :param exp_uuid: Experiment UUID
+        :param output_id: Output ID
+        :param parameters: Query object
+        :param callback: Optional function called with each VirtualTableLine, in
+                         which case the response is read before returning
+        :param chunk_size: Number of bytes read from the response at once
+        :returns: :class:  `TspClientResponse <ResponseStream>` object whose model
+                  iterates over the lines once, then holds the status and table size
+        :rtype: TspClientResponse
+        '''
+        api_url = '{0}experiments/{1}/outputs/table/{2}/lines'.format(
+            self.base_url, exp_uuid, output_id)
+
+        params = parameters
+        if parameters is None:
+            params = {
+                TspClient.PARAMETERS_KEY: {}
+            }
+
+        return self._stream_generic(api_url, params, ModelType.VIRTUAL_TABLE, callback,
+                                    chunk_size, GET_TREE_FAILED)
 
     def fetch_timegraph_tree(self, exp_uuid, output_id, parameters=None) -> TspClientResponse:
         '''
@@ -354,16 +635,8 @@ class TspClient:
                 "parameters": { }
             }
 
-        response = requests.post(api_url, json=params, headers=headers)
-
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.TIME_GRAPH_TREE),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print(GET_TREE_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
-
+        return self._fetch_generic(api_url, params, ModelType.TIME_GRAPH_TREE,
+                                   exp_uuid, output_id, GET_TREE_FAILED)
 
     def fetch_timegraph_states(self, exp_uuid, output_id, parameters=None):
         '''
@@ -382,16 +655,35 @@ class TspClient:
                 "parameters": { }
             }
 
-        response = requests.post(api_url, json=params, headers=headers)
+        return self._fetch_generic(api_url, params, ModelType.TIME_GRAPH_STATE,
+                                   exp_uuid, output_id, GET_STATES_FAILED)
 
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.TIME_GRAPH_STATE),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print(GET_STATES_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+    def stream_timegraph_states(self, exp_uuid, output_id, parameters=None, callback=None,
+                                chunk_size=DEFAULT_CHUNK_SIZE):
+        '''
+        Fetch Time Graph States, building each row while the response is read
+        so that memory use is bounded by one row rather than the whole response.
+        Responses are neither cached nor coalesced.
+        :param exp_uuid: Experiment UUID
+        :param output_id: Output ID
+        :param parameters: Query object
+        :param callback: Optional function called with each TimeGraphRow, in
+                         which case the response is read before returning
+        :param chunk_size: Number of bytes read from the response at once
+        :returns: :class:  `TspClientResponse <ResponseStream>` object whose model
+                  iterates over the rows once, then holds the status
+        :rtype: TspClientResponse
+        '''
+        api_url = f'{self.base_url}experiments/{exp_uuid}/outputs/timeGraph/{output_id}/states'
 
+        params = parameters
+        if parameters is None:
+            params = {
+                "parameters": { }
+            }
+
+        return self._stream_generic(api_url, params, ModelType.TIME_GRAPH_STATE, callback,
+                                    chunk_size, GET_STATES_FAILED)
 
     def fetch_timegraph_arrows(self, exp_uuid, output_id, parameters=None):
         '''
@@ -410,15 +702,8 @@ class TspClient:
                 "parameters": { }
             }
 
-        response = requests.post(api_url, json=params, headers=headers)
-
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.TIME_GRAPH_ARROW),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print(GET_ARROWS_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+        return self._fetch_generic(api_url, params, ModelType.TIME_GRAPH_ARROW,
+                                   exp_uuid, output_id, GET_ARROWS_FAILED)
 
     def fetch_xy_tree(self, exp_uuid, output_id, parameters=None):
         '''
@@ -438,15 +723,8 @@ class TspClient:
                 "parameters": { }
             }
 
-        response = requests.post(api_url, json=params, headers=headers)
-
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.XY_TREE),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print(GET_TREE_FAILED.format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+        return self._fetch_generic(api_url, params, ModelType.XY_TREE,
+                                   exp_uuid, output_id, GET_TREE_FAILED)
 
     def fetch_xy(self, exp_uuid, output_id, parameters):
         '''
@@ -465,16 +743,38 @@ class TspClient:
             params = {
                 "parameters": { }
             }
-        response = requests.post(api_url, json=params, headers=headers)
+        return self._fetch_generic(api_url, params, ModelType.XY,
+                                   exp_uuid, output_id, "failed to get xy: {0}")
 
-        if response.status_code == 200:
-            return TspClientResponse(GenericResponse(json.loads(response.content.decode('utf-8')),
-                                                     ModelType.XY),
-                                     response.status_code, response.text)
-        else:  # pragma: no cover
-            print("failed to get xy: {0}".format(response.status_code))
-            return TspClientResponse(None, response.status_code, response.text)
+    def fetch_xy_tiled(self, exp_uuid, output_id, parameters, tiles=None,
+                       target_points=DEFAULT_XY_TILE_POINTS, max_workers=None):
+        '''
+        Fetch XY xy, XYModel, by splitting the requested time range into tiles
+        fetched concurrently, then stitching the series values back together
+        :param exp_uuid: Experiment UUID
+        :param output_id: Output ID
+        :param parameters: Query object with a requested time range
+        :param tiles: Number of tiles, or None to choose it from target_points
+        :param target_points: Target number of values (times x items) per tile response
+        :param max_workers: Maximum number of tiles in flight, or None for the pool size
+        :returns: :class:  `TspClientResponse <GenericResponse>` object XY series response
+        :rtype: TspClientResponse
+        '''
+        tile_parameters = split_parameters(parameters, tiles, target_points)
+        if len(tile_parameters) <= 1:
+            return self.fetch_xy(exp_uuid, output_id, parameters)
+
+        fetch_tile = bind_context(lambda tile: self.fetch_xy(exp_uuid, output_id, tile))
+        with ThreadPoolExecutor(max_workers=max_workers or self._pool_maxsize) as executor:
+            responses = list(executor.map(fetch_tile, tile_parameters))
 
+        for response in responses:
+            if response.model is None:  # pragma: no cover
+                return response
+        # No single body matches the stitched model, so none is kept as its status_text
+        return TspClientResponse(
+            stitch_xy_responses([response.model for response in responses]),
+            responses[0].status_code, '')
 
     def fetch_output_configuration_sources(self, exp_uuid, output_id):
         '''
@@ -486,10 +786,10 @@ class TspClient:
         '''
         api_url = '{0}experiments/{1}/outputs/{2}/configTypes'.format(
             self.base_url, exp_uuid, output_id)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(ConfigurationSourceSet(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(ConfigurationSourceSet(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print(GET_CONFIG_SOURCE_TYPES.format(response.status_code, response.text))
             return TspClientResponse(None, response.status_code, response.text)
@@ -505,10 +805,10 @@ class TspClient:
         '''
         api_url = '{0}experiments/{1}/outputs/{2}/configTypes/{3}'.format(
             self.base_url, exp_uuid, output_id, type_id)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(ConfigurationSource(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(ConfigurationSource(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print(GET_CONFIG_SOURCE_TYPES.format(response.status_code, response.text))
             return TspClientResponse(None, response.status_code, response.text)
@@ -525,11 +825,11 @@ class TspClient:
         api_url = '{0}experiments/{1}/outputs/{2}'.format(
             self.base_url, exp_uuid, output_id)
 
-        response = requests.post(api_url, json=params, headers=headers)
+        response = self._session.post(api_url, data=json_codec.dumps(params), headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(OutputDescriptor(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(OutputDescriptor(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("failed to create derived output: {} {}".format(response.status_code, response.text))
             return TspClientResponse(None, response.status_code, response.text)
@@ -546,11 +846,11 @@ class TspClient:
         api_url = '{0}experiments/{1}/outputs/{2}/{3}'.format(
             self.base_url, exp_uuid, output_id, derived_output_id)
 
-        response = requests.delete(api_url, headers=headers_form)
+        response = self._session.delete(api_url, headers=headers_form)
 
         if response.status_code == 200:
-            return TspClientResponse(OutputDescriptor(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(OutputDescriptor(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("delete derived output failed: {} {}".format(response.status_code, response.text))
             return TspClientResponse(None, response.status_code, response.text)
@@ -561,11 +861,11 @@ class TspClient:
         '''
         api_url = '{0}config/types/'.format(self.base_url)
 
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(ConfigurationSourceSet(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(ConfigurationSourceSet(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("failed to get configuration sources: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -576,11 +876,11 @@ class TspClient:
         '''
         api_url = '{0}config/types/{1}'.format(self.base_url, type_id)
 
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(ConfigurationSource(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(ConfigurationSource(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("failed to get a configuration source: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -592,11 +892,11 @@ class TspClient:
         '''
         api_url = '{0}config/types/{1}/configs'.format(self.base_url, type_id)
 
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(ConfigurationSet(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(ConfigurationSet(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("failed to get configurations: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -608,11 +908,11 @@ class TspClient:
         '''
         api_url = '{0}config/types/{1}/configs/{2}'.format(self.base_url, type_id, config_id)
 
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(Configuration(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Configuration(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("failed to get configuration: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -625,11 +925,11 @@ class TspClient:
 
         parameters = {'parameters': params}
 
-        response = requests.post(api_url, json=parameters, headers=headers)
+        response = self._session.post(api_url, data=json_codec.dumps(parameters), headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(Configuration(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Configuration(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("post extension failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -642,11 +942,11 @@ class TspClient:
 
         parameters = {'parameters': params}
 
-        response = requests.put(api_url, json=parameters, headers=headers)
+        response = self._session.put(api_url, data=json_codec.dumps(parameters), headers=headers)
 
         if response.status_code == 200:
-            return TspClientResponse(Configuration(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Configuration(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("put extension failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -657,11 +957,11 @@ class TspClient:
         '''
         api_url = '{0}config/types/{1}/configs/{2}'.format(self.base_url, type_id, config_id)
 
-        response = requests.delete(api_url, headers=headers_form)
+        response = self._session.delete(api_url, headers=headers_form)
 
         if response.status_code == 200:
-            return TspClientResponse(Configuration(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Configuration(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("post extension failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -673,10 +973,10 @@ class TspClient:
         :rtype: TspClientResponse
         '''
         api_url = '{0}health'.format(self.base_url)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(Health(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Health(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("get health failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
@@ -690,10 +990,10 @@ class TspClient:
         :rtype: TspClientResponse
         '''
         api_url = '{0}identifier'.format(self.base_url)
-        response = requests.get(api_url, headers=headers)
+        response = self._session.get(api_url, headers=headers)
         if response.status_code == 200:
-            return TspClientResponse(Identifier(json.loads(response.content.decode('utf-8'))),
-                                     response.status_code, response.text)
+            return TspClientResponse(Identifier(json_codec.loads(response.content)),
+                                     response.status_code, self._status_text(response))
         else:  # pragma: no cover
             print("get identifiers failed: {0}".format(response.status_code))
             return TspClientResponse(None, response.status_code, response.text)
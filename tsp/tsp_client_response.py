@@ -44,6 +44,10 @@ class TspClientResponse:
     def __init__(self, model, status, status_text):
         '''
         Constructor
+        :param model: The model of TSP call or None
+        :param status: The HTTP status code
+        :param status_text: The status message, or the raw UTF-8 body as bytes
+                            to decode only if status_text is read
         '''
 
         # The model of TSP call or None
@@ -52,8 +56,21 @@ class TspClientResponse:
         # The HTTP status code
         self.status_code = status
 
-        # The status message
-        self.status_text = status_text
+        # The status message, or the raw body until first read
+        self._status_text = status_text
+
+    @property
+    def status_text(self):
+        '''
+        The status message
+        '''
+        if isinstance(self._status_text, bytes):
+            self._status_text = self._status_text.decode('utf-8', errors='replace')
+        return self._status_text
+
+    @status_text.setter
+    def status_text(self, status_text):
+        self._status_text = status_text
 
     def is_ok(self):
         return self.status_code >= 200 and self.status_code < 400
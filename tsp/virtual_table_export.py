@@ -0,0 +1,315 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Virtual table export classes file."""
+
+import csv
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import requests
+
+from tsp import json_codec
+from tsp.deadline import bind_context
+from tsp.virtual_table_pager import GET_LINES_FAILED, MISSING_LINES
+
+INDEX_COLUMN = "index"
+CELLS_KEY = "cells"
+TAGS_KEY = "tags"
+
+
+class CsvSink:
+    '''
+    Write exported lines as CSV rows: the line index, then the cell contents
+    '''
+
+    def __init__(self, file):
+        '''
+        Constructor
+        :param file: Text file object, opened with newline=''
+        '''
+        self._writer = csv.writer(file)
+
+    def begin(self, column_names):
+        '''
+        Write the header row
+        '''
+        self._writer.writerow([INDEX_COLUMN] + column_names)
+
+    def write(self, lines):
+        '''
+        Write lines, in index order
+        '''
+        self._writer.writerows([line.index] + [cell.content for cell in line.cells]
+                               for line in lines)
+
+    def close(self):
+        '''
+        Complete the export
+        '''
+
+
+class NdjsonSink:
+    '''
+    Write exported lines as newline-delimited JSON objects
+    '''
+
+    def __init__(self, file):
+        '''
+        Constructor
+        :param file: Text file object
+        '''
+        self._file = file
+
+    def begin(self, column_names):
+        '''
+        Nothing to write before the lines
+        '''
+
+    def write(self, lines):
+        '''
+        Write lines, in index order
+        '''
+        self._file.write(''.join(
+            json_codec.dumps({INDEX_COLUMN: line.index,
+                              CELLS_KEY: [cell.content for cell in line.cells],
+                              TAGS_KEY: line.tags.value}).decode('utf-8') + '\n'
+            for line in lines))
+
+    def close(self):
+        '''
+        Complete the export
+        '''
+
+
+class ParquetSink:
+    '''
+    Write exported lines as a Parquet file of string columns; needs pyarrow
+    '''
+
+    def __init__(self, path):
+        '''
+        Constructor
+        :param path: Path of the Parquet file to write
+        '''
+        try:
+            # pylint: disable=import-outside-toplevel
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as ex:  # pragma: no cover
+            raise ImportError("pyarrow is needed to export virtual tables as Parquet") from ex
+        self._pyarrow = pyarrow
+        self._path = path
+        self._schema = None
+        self._writer = None
+
+    def begin(self, column_names):
+        '''
+        Open the Parquet file with one column per table column
+        '''
+        pyarrow = self._pyarrow
+        self._schema = pyarrow.schema([(INDEX_COLUMN, pyarrow.int64())] +
+                                      [(name, pyarrow.string()) for name in column_names])
+        self._writer = pyarrow.parquet.ParquetWriter(self._path, self._schema)
+
+    def write(self, lines):
+        '''
+        Write lines, in index order, as one row group
+        '''
+        columns = [[line.index for line in lines]]
+        for position in range(len(self._schema) - 1):
+            columns.append([line.cells[position].content if position < len(line.cells) else None
+                            for line in lines])
+        self._writer.write_table(self._pyarrow.Table.from_arrays(columns, schema=self._schema))
+
+    def close(self):
+        '''
+        Complete the export, or close the file of a failed one
+        '''
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class WorkerStats:
+    '''
+    Throughput of one export worker
+    '''
+
+    def __init__(self, name):
+        '''
+        Constructor
+        :param name: Name of the worker thread
+        '''
+        self.name = name
+        self.ranges = 0
+        self.requests = 0
+        self.lines = 0
+        self.seconds = 0.0
+
+    @property
+    def lines_per_second(self):
+        '''
+        Lines fetched per second spent fetching
+        '''
+        return self.lines / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self):
+        return (f'WorkerStats({self.name}: ranges={self.ranges}, requests={self.requests}, '
+                f'lines={self.lines}, seconds={self.seconds:.3f}, '
+                f'lines/s={self.lines_per_second:.1f})')
+
+
+class VirtualTableExporter:
+    '''
+    Export a whole virtual table by fetching disjoint index ranges with a pool
+    of workers, writing the lines to a sink in index order as ranges complete
+    '''
+
+    # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, tsp_client, exp_uuid, output_id, parameters=None,
+                 workers=4, range_size=10000, page_size=2000):
+        '''
+        Constructor
+        :param tsp_client: TspClient to fetch the lines with
+        :param exp_uuid: Experiment UUID
+        :param output_id: Output ID
+        :param parameters: Query object applied to every range, e.g. its column ids;
+                           its line index and count are ignored
+        :param workers: Number of ranges fetched concurrently
+        :param range_size: Number of lines per range
+        :param page_size: Number of lines per request within a range
+        '''
+        self._client = tsp_client
+        self._exp_uuid = exp_uuid
+        self._output_id = output_id
+        self._query = dict((parameters or {}).get(tsp_client.PARAMETERS_KEY, {}))
+        self._query.pop(tsp_client.REQUESTED_TIME_KEY, None)
+        self.workers = workers
+        self.range_size = range_size
+        self.page_size = page_size
+
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, index, count):
+        client = self._client
+        query = dict(self._query)
+        query[client.REQUESTED_TABLE_LINE_INDEX_KEY] = index
+        query[client.REQUESTED_TABLE_LINE_COUNT_KEY] = count
+        response = client.await_completion(client.fetch_virtual_table_lines, self._exp_uuid,
+                                           self._output_id, {client.PARAMETERS_KEY: query})
+        if response.model is None or response.model.model is None:
+            raise requests.HTTPError(GET_LINES_FAILED.format(response.status_code))
+        return response.model.model
+
+    def _worker_stats(self):
+        name = threading.current_thread().name
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = WorkerStats(name)
+            return self._stats[name]
+
+    def _fetch_range(self, start, end):
+        stats = self._worker_stats()
+        lines = []
+        index = start
+        while index < end:
+            begin = time.monotonic()
+            model = self._fetch(index, min(self.page_size, end - index))
+            stats.seconds += time.monotonic() - begin
+            stats.requests += 1
+            page = [line for line in model.lines if index <= line.index < end]
+            if not page:
+                # The table shrank, or the server skipped lines: never export a partial table
+                raise requests.HTTPError(MISSING_LINES.format(index, end - 1))
+            lines.extend(page)
+            index = page[-1].index + 1
+        stats.ranges += 1
+        stats.lines += len(lines)
+        return lines
+
+    def _column_names(self):
+        response = self._client.await_completion(self._client.fetch_virtual_table_columns,
+                                                 self._exp_uuid, self._output_id)
+        if response.model is None or response.model.model is None:  # pragma: no cover
+            return []
+        columns = response.model.model.columns
+        column_ids = self._query.get(self._client.REQUESTED_TABLE_LINE_COLUMN_IDS_KEY)
+        if column_ids:
+            names = {column.id: column.name for column in columns}
+            return [names.get(column_id, str(column_id)) for column_id in column_ids]
+        return [column.name for column in columns]
+
+    def export(self, sink):
+        '''
+        Export the table
+        :param sink: CsvSink, NdjsonSink, ParquetSink or any object with the same methods
+        :returns: List of :class:`WorkerStats` of this export, one per worker
+        :raises requests.HTTPError: If some lines cannot be fetched, naming the missing ones
+        '''
+        self._stats = {}
+        try:
+            size = self._fetch(0, 1).size
+            sink.begin(self._column_names())
+            self._export_ranges(sink, size)
+        finally:
+            sink.close()
+        return sorted(self._stats.values(), key=lambda stats: stats.name)
+
+    def _export_ranges(self, sink, size):
+        starts = iter(range(0, size, self.range_size))
+        done = {}
+        next_start = 0
+        fetch_range = bind_context(self._fetch_range)
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix='tsp-export') as executor:
+            pending = {}
+
+            def submit():
+                # Bound the ranges held in memory while waiting for an earlier one
+                while len(pending) + len(done) < 2 * self.workers:
+                    start = next(starts, None)
+                    if start is None:
+                        return
+                    future = executor.submit(fetch_range, start,
+                                             min(start + self.range_size, size))
+                    pending[future] = start
+
+            try:
+                submit()
+                while pending:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        done[pending.pop(future)] = future.result()
+                    while next_start in done:
+                        sink.write(done.pop(next_start))
+                        next_start += self.range_size
+                    submit()
+            finally:
+                # On failure, do not fetch the ranges not started yet
+                for future in pending:
+                    future.cancel()
@@ -56,28 +56,16 @@ class VirtualTableHeaderColumnModel:
 
     def __init__(self, params):
         # Column ID
-        self.id = None
-        if COLUMN_ID_KEY in params:
-            self.id = params.get(COLUMN_ID_KEY)
-            del params[COLUMN_ID_KEY]
+        self.id = params.get(COLUMN_ID_KEY)
 
         # Column name
-        self.name = None
-        if COLUMN_NAME_KEY in params:
-            self.name = params.get(COLUMN_NAME_KEY)
-            del params[COLUMN_NAME_KEY]
+        self.name = params.get(COLUMN_NAME_KEY)
 
         # Column description
-        self.description = None
-        if COLUMN_DESCRIPTION_KEY in params:
-            self.description = params.get(COLUMN_DESCRIPTION_KEY)
-            del params[COLUMN_DESCRIPTION_KEY]
+        self.description = params.get(COLUMN_DESCRIPTION_KEY)
 
         # Column type
-        self.type = None
-        if COLUMN_TYPE_KEY in params:
-            self.type = params.get(COLUMN_TYPE_KEY)
-            del params[COLUMN_TYPE_KEY]
+        self.type = params.get(COLUMN_TYPE_KEY)
 
     def print(self):
         '''
@@ -34,6 +34,10 @@ TABLE_LINE_INDEX_KEY = "index"
 TABLE_LINE_CELLS_KEY = "cells"
 TABLE_LINE_CELL_CONTENT_KEY = "content"
 
+# Tags of each value of the 4 bits used by the server: 1 and 2 are reserved,
+# 4 is used for border and 8 for highlight
+DECODED_TAGS = tuple(VirtualTableTag(tags) for tags in range(16))
+
 
 # pylint: disable=too-few-public-methods
 class VirtualTableModel:
@@ -43,33 +47,18 @@ class VirtualTableModel:
 
     def __init__(self, params):
         # Size of the virtual table
-        self.size = 0
-        if SIZE_KEY in params:
-            if params.get(SIZE_KEY) is not None and type(params.get(SIZE_KEY)) is int:
-                self.size = int(params.get(SIZE_KEY))
-            del params[SIZE_KEY]
+        size = params.get(SIZE_KEY)
+        self.size = size if type(size) is int else 0
 
         # Index of the first line in the virtual table
-        self.low_index = 0
-        if LOW_INDEX_KEY in params:
-            if params.get(LOW_INDEX_KEY) is not None and type(params.get(LOW_INDEX_KEY)) is int:
-                self.low_index = int(params.get(LOW_INDEX_KEY))
-            del params[LOW_INDEX_KEY]
+        low_index = params.get(LOW_INDEX_KEY)
+        self.low_index = low_index if type(low_index) is int else 0
 
         # Array of column IDs in the virtual table
-        self.column_ids = []
-        if COLUMN_IDS_KEY in params:
-            if params.get(COLUMN_IDS_KEY) is not None:
-                for column_id in params.get(COLUMN_IDS_KEY):
-                    self.column_ids.append(column_id)
-            del params[COLUMN_IDS_KEY]
+        self.column_ids = list(params.get(COLUMN_IDS_KEY) or [])
 
         # Array of lines in the virtual table
-        self.lines = []
-        if LINES_KEY in params:
-            for line in params.get(LINES_KEY):
-                self.lines.append(VirtualTableLine(line))
-            del params[LINES_KEY]
+        self.lines = [VirtualTableLine(line) for line in params.get(LINES_KEY) or []]
 
     def print(self):
         print("VirtualTableModel:")
@@ -85,39 +74,18 @@ class VirtualTableLine:
     '''
     Virtual table line that will be returned by the server
     '''
+    __slots__ = ('index', 'cells', 'tags')
 
     def __init__(self, params):
         # Index of the line in the virtual table
-        self.index = -1
-        if TABLE_LINE_INDEX_KEY in params:
-            if params.get(TABLE_LINE_INDEX_KEY) is not None and type(params.get(TABLE_LINE_INDEX_KEY)) is int:
-                self.index = int(params.get(TABLE_LINE_INDEX_KEY))
-            del params[TABLE_LINE_INDEX_KEY]
+        index = params.get(TABLE_LINE_INDEX_KEY)
+        self.index = index if type(index) is int else -1
 
         # Array of cells in the line
-        self.cells = []
-        if TABLE_LINE_CELLS_KEY in params:
-            if params.get(TABLE_LINE_CELLS_KEY) is not None:
-                for cell in params.get(TABLE_LINE_CELLS_KEY):
-                    self.cells.append(VirtualTableLineCell(cell))
-            del params[TABLE_LINE_CELLS_KEY]
-
-        self.tags = VirtualTableTag.NO_TAGS
-        if TAGS_KEY in params:
-            if params.get(TAGS_KEY) is not None and isinstance(params.get(TAGS_KEY), int):
-                tags = int(params.get(TAGS_KEY))
-                
-                self.tags = VirtualTableTag.NO_TAGS # Tag 0 is used for no tags
-                if tags & 0x1: # Tags 1 and 2 are reserved
-                    self.tags |= VirtualTableTag.RESERVED_1
-                if tags & 0x2: # Tags 1 and 2 are reserved
-                    self.tags |= VirtualTableTag.RESERVED_2
-                if tags & 0x4: # Tag 4 is used for border
-                    self.tags |= VirtualTableTag.BORDER
-                if tags & 0x8: # Tag 8 is used for highlight
-                    self.tags |= VirtualTableTag.HIGHLIGHT
-                
-            del params[TAGS_KEY]
+        self.cells = [VirtualTableLineCell(cell) for cell in params.get(TABLE_LINE_CELLS_KEY) or []]
+
+        tags = params.get(TAGS_KEY)
+        self.tags = DECODED_TAGS[tags & 0xF] if isinstance(tags, int) else VirtualTableTag.NO_TAGS
 
     def has_tag(self, tag):
         return bool(self.tags & tag)
@@ -142,31 +110,14 @@ class VirtualTableLineCell:
     '''
     Virtual table line cell that will be returned by the server
     '''
+    __slots__ = ('content', 'tags')
 
     def __init__(self, params):
         # Content of the cell
-        self.content = None
-        if TABLE_LINE_CELL_CONTENT_KEY in params:
-            if params.get(TABLE_LINE_CELL_CONTENT_KEY) is not None:
-                self.content = params.get(TABLE_LINE_CELL_CONTENT_KEY)
-            del params[TABLE_LINE_CELL_CONTENT_KEY]
-
-        self.tags = VirtualTableTag.NO_TAGS
-        if TAGS_KEY in params:
-            if params.get(TAGS_KEY) is not None and isinstance(params.get(TAGS_KEY), int):
-                tags = int(params.get(TAGS_KEY))
-                
-                self.tags = VirtualTableTag.NO_TAGS # Tag 0 is used for no tags
-                if tags & 0x1: # Tags 1 and 2 are reserved
-                    self.tags |= VirtualTableTag.RESERVED_1
-                if tags & 0x2: # Tags 1 and 2 are reserved
-                    self.tags |= VirtualTableTag.RESERVED_2
-                if tags & 0x4: # Tag 4 is used for border
-                    self.tags |= VirtualTableTag.BORDER
-                if tags & 0x8: # Tag 8 is used for highlight
-                    self.tags |= VirtualTableTag.HIGHLIGHT
-
-            del params[TAGS_KEY]
+        self.content = params.get(TABLE_LINE_CELL_CONTENT_KEY)
+
+        tags = params.get(TAGS_KEY)
+        self.tags = DECODED_TAGS[tags & 0xF] if isinstance(tags, int) else VirtualTableTag.NO_TAGS
 
     def has_tag(self, tag):
         return bool(self.tags & tag)
@@ -0,0 +1,150 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""VirtualTablePager class file."""
+
+import copy
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tsp.deadline import bind_context
+
+GET_LINES_FAILED = "failed to get virtual table lines: {0}"
+MISSING_LINES = "missing virtual table lines: {0} to {1}"
+
+
+# pylint: disable=too-few-public-methods
+class PageSizer:
+    '''
+    Adapt the number of lines per page to the measured throughput, so that
+    each page takes about the same time to fetch
+    '''
+
+    def __init__(self, initial=1000, minimum=100, maximum=50000, target_seconds=0.5):
+        '''
+        Constructor
+        :param initial: Number of lines of the first page
+        :param minimum: Lower bound of the page size
+        :param maximum: Upper bound of the page size, bounding memory use
+        :param target_seconds: Targeted time to fetch one page, or None for fixed pages
+        '''
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+
+    def update(self, lines, seconds):
+        '''
+        Account for a fetched page and compute the size of the next one
+        :param lines: Number of lines fetched
+        :param seconds: Time taken to fetch them
+        '''
+        if self.target_seconds is None or lines <= 0 or seconds <= 0:
+            return
+        wanted = int(lines / seconds * self.target_seconds)
+        # Change gradually, as a single page timing is noisy
+        wanted = max(self.size // 2, min(self.size * 2, wanted))
+        self.size = max(self.minimum, min(self.maximum, wanted))
+
+
+class VirtualTablePager:
+    '''
+    Iterate lazily over the lines of a virtual table, page after page, while
+    the next page is prefetched in the background
+    '''
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, tsp_client, exp_uuid, output_id, parameters=None,
+                 page_sizer=None, prefetch=True):
+        '''
+        Constructor
+        :param tsp_client: TspClient to fetch the pages with
+        :param exp_uuid: Experiment UUID
+        :param output_id: Output ID
+        :param parameters: Query object of the first page; its line count is ignored
+        :param page_sizer: :class:`PageSizer` choosing the page sizes, or None for the default one
+        :param prefetch: Fetch the next page while the current one is consumed
+        '''
+        self._client = tsp_client
+        self._exp_uuid = exp_uuid
+        self._output_id = output_id
+        self._parameters = parameters if parameters is not None else {tsp_client.PARAMETERS_KEY: {}}
+        self._page_sizer = page_sizer if page_sizer is not None else PageSizer()
+        self._prefetch = prefetch
+
+        # Total number of lines of the table, known after the first page
+        self.size = None
+
+    def _fetch(self, parameters):
+        start = time.monotonic()
+        response = self._client.await_completion(self._client.fetch_virtual_table_lines,
+                                                 self._exp_uuid, self._output_id, parameters)
+        if response.model is None or response.model.model is None:
+            raise requests.HTTPError(GET_LINES_FAILED.format(response.status_code))
+        return response.model.model, time.monotonic() - start
+
+    def _page(self, query, count):
+        parameters = copy.copy(self._parameters)
+        parameters[self._client.PARAMETERS_KEY] = dict(query)
+        parameters[self._client.PARAMETERS_KEY][self._client.REQUESTED_TABLE_LINE_COUNT_KEY] = count
+        return parameters
+
+    def __iter__(self):
+        client = self._client
+        query = dict(self._parameters.get(client.PARAMETERS_KEY, {}))
+        query.setdefault(client.REQUESTED_TABLE_LINE_INDEX_KEY, 0)
+
+        executor = ThreadPoolExecutor(max_workers=1) if self._prefetch else None
+        try:
+            parameters = self._page(query, self._page_sizer.size)
+            pending = executor.submit(bind_context(self._fetch), parameters) if executor else None
+            while parameters is not None:
+                if executor:
+                    model, seconds = pending.result()
+                else:
+                    model, seconds = self._fetch(parameters)
+                self.size = model.size
+                lines = model.lines
+                del model
+                self._page_sizer.update(len(lines), seconds)
+
+                parameters = None
+                if not lines:
+                    index = query[client.REQUESTED_TABLE_LINE_INDEX_KEY]
+                    if client.REQUESTED_TIME_KEY not in query and index < self.size:
+                        # The table shrank, or the server skipped lines: never end it early
+                        raise requests.HTTPError(MISSING_LINES.format(index, self.size - 1))
+                elif lines[-1].index + 1 < self.size:
+                    # Following pages are requested by index, after the last line received
+                    query.pop(client.REQUESTED_TIME_KEY, None)
+                    query[client.REQUESTED_TABLE_LINE_INDEX_KEY] = lines[-1].index + 1
+                    parameters = self._page(query, self._page_sizer.size)
+                    if executor:
+                        pending = executor.submit(bind_context(self._fetch), parameters)
+                yield from lines
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
@@ -22,6 +22,7 @@
 
 """XY classes file."""
 
+import bisect
 import json
 
 
@@ -46,65 +47,74 @@ class XYModel:
     Model of a XY chart, contains at least one XY series
     '''
 
-    def __init__(self, params):
+    def __init__(self, params, columnar=False):
         '''
         Title of the model
         '''
         if TITLE_KEY in params:
             self.title = params.get(TITLE_KEY)
-            del params[TITLE_KEY]
 
         # Array of XY series
-        self.series = []
-        if SERIES_KEY in params:
-            for series in params.get(SERIES_KEY):
-                self.series.append(XYSeries(series))
-            del params[SERIES_KEY]
+        self.series = [XYSeries(series, columnar) for series in params.get(SERIES_KEY, [])]
 
     def __repr__(self):
         return f'XYModel(title={self.title}, series={self.series})'
 
 class XYSeries:
     '''
-    Represent a XY series and its values
+    Represent a XY series and its values. In columnar mode, the X values are an
+    int64 NumPy array and the Y values a float64 NumPy array.
     '''
 
-    def __init__(self, params):
+    def __init__(self, params, columnar=False):
         '''
         Name of the series
         '''
         if SERIES_NAME_KEY in params:
             self.series_name = params.get(SERIES_NAME_KEY)
-            del params[SERIES_NAME_KEY]
 
         # Ìd of the series
         if SERIES_ID_KEY in params:
             self.series_id = params.get(SERIES_ID_KEY)
-            del params[SERIES_ID_KEY]
 
         # Description of the X axis
         if X_AXIS_KEY in params:
             self.x_axis = XYAxis(params.get(X_AXIS_KEY))
-            del params[X_AXIS_KEY]
 
         # Description of the Y axis
         if Y_AXIS_KEY in params:
             self.y_axis = XYAxis(params.get(Y_AXIS_KEY))
-            del params[Y_AXIS_KEY]
-
-        # Series' X values
-        self.x_values = []
-        if X_VALUES_KEY in params:
-            for x_value in params.get(X_VALUES_KEY):
-                self.x_values.append(x_value)
-            del params[X_VALUES_KEY]
-
-        # Series' Y values
-        self.y_values = []
-        if Y_VALUES_KEY in params:
-            for y_value in params.get(Y_VALUES_KEY):
-                self.y_values.append(y_value)
-            del params[Y_VALUES_KEY]
+
+        # Series' X and Y values
+        x_values = params.get(X_VALUES_KEY, [])
+        y_values = params.get(Y_VALUES_KEY, [])
+        if columnar:
+            # pylint: disable=import-outside-toplevel
+            import numpy as np
+            self.x_values = np.array(x_values, dtype=np.int64)
+            self.y_values = np.array(y_values, dtype=np.float64)
+        else:
+            self.x_values = list(x_values)
+            self.y_values = list(y_values)
+
+        # Tags of the series
+        self.tags = params.get(TAGS_KEY)
+
+    def slice_time(self, start, end):
+        '''
+        Get the values of the series within a time range
+        :param start: Start time, included
+        :param end: End time, included
+        :returns: Tuple of the X values and Y values within the range, as lists
+                  or, in columnar mode, as NumPy array views
+        '''
+        if isinstance(self.x_values, list):
+            low = bisect.bisect_left(self.x_values, start)
+            high = bisect.bisect_right(self.x_values, end)
+        else:
+            low = self.x_values.searchsorted(start, side='left')
+            high = self.x_values.searchsorted(end, side='right')
+        return self.x_values[low:high], self.y_values[low:high]
 
     def __repr__(self):
         return 'XYSeries(name={}, id={}{}{}{}{})'.format(self.series_name, self.series_id,
@@ -117,24 +127,19 @@ class XYAxis:
     '''
     Description of an axis for XY chart
     '''
+    __slots__ = ('label', 'unit', 'data_type')
 
     def __init__(self, params):
         '''
         Label of the axis
         '''
-        if LABEL_KEY in params:
-            self.label = params.get(LABEL_KEY)
-            del params[LABEL_KEY]
+        self.label = params.get(LABEL_KEY)
 
         # The units used for the axis, to be appended to the numbers
-        if UNIT_KEY in params:
-            self.unit = params.get(UNIT_KEY)
-            del params[UNIT_KEY]
+        self.unit = params.get(UNIT_KEY)
 
         # Type of data for this axis, to give hint on number formatting
-        if DATA_TYPE_KEY in params:
-            self.data_type = params.get(DATA_TYPE_KEY)
-            del params[DATA_TYPE_KEY]
+        self.data_type = params.get(DATA_TYPE_KEY)
 
     def __repr__(self):
         return f'XYAxis(label={self.label}, unit={self.unit}, data_type={self.data_type})'
@@ -157,8 +162,10 @@ class XYSeriesEncoder(json.JSONEncoder):
                 'series_id': obj.series_id,
                 'x_axis': XYAxisEncoder().default(obj.x_axis) if hasattr(obj, 'x_axis') else None,
                 'y_axis': XYAxisEncoder().default(obj.y_axis) if hasattr(obj, 'y_axis') else None,
-                'x_values': obj.x_values,
-                'y_values': obj.y_values,
+                'x_values': obj.x_values if isinstance(obj.x_values, list)
+                            else obj.x_values.tolist(),
+                'y_values': obj.y_values if isinstance(obj.y_values, list)
+                            else obj.y_values.tolist(),
                 'tags': obj.tags
             }
         return super().default(obj)
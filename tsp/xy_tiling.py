@@ -0,0 +1,152 @@
+# The MIT License (MIT)
+#
+# Copyright (C) 2026 - Ericsson
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""XY time range tiling functions file."""
+
+import copy
+
+from tsp.model_type import ModelType
+from tsp.response import GenericResponse, ResponseStatus, RESPONSE_STATUS_KEY, STATUS_MESSAGE_KEY
+from tsp.xy_model import XYModel, XYSeries, TITLE_KEY, SERIES_NAME_KEY, SERIES_ID_KEY
+
+# Keys of the XY query object, as in TspClient
+PARAMETERS_KEY = 'parameters'
+REQUESTED_ITEM_KEY = 'requested_items'
+REQUESTED_TIME_RANGE_KEY = 'requested_timerange'
+
+# Keys of the start, end and number of times of a requested time range
+TIME_RANGE_KEYS = ('start', 'end', 'nbTimes')
+
+# Worst status first, as reported for a stitched response
+STATUS_PRIORITY = [ResponseStatus.FAILED, ResponseStatus.CANCELLED,
+                   ResponseStatus.RUNNING, ResponseStatus.COMPLETED]
+
+
+def tile_count(nb_times, nb_items, target_points):
+    '''
+    Choose the number of tiles so that each tile response holds about
+    target_points values
+    :param nb_times: Number of times requested over the whole range
+    :param nb_items: Number of requested series
+    :param target_points: Target number of values per tile response
+    '''
+    points_per_tile = max(1, target_points // max(1, nb_items))
+    return max(1, min(nb_times, -(-nb_times // points_per_tile)))
+
+
+def split_time_range(start, end, nb_times, tiles):
+    '''
+    Split a sampled time range into contiguous tiles
+    :param start: Start of the time range
+    :param end: End of the time range
+    :param nb_times: Number of samples over the whole range
+    :param tiles: Number of tiles
+    :returns: List of (start, end, nb_times) tuples, one per non-empty tile, starting
+              and ending at samples of the whole range and not overlapping
+    '''
+    def sample(index):
+        if nb_times <= 1:
+            return start
+        return start + (end - start) * index // (nb_times - 1)
+
+    ranges = []
+    for tile in range(tiles):
+        first = tile * nb_times // tiles
+        last = (tile + 1) * nb_times // tiles
+        if last > first:
+            ranges.append((sample(first), sample(last - 1), last - first))
+    return ranges
+
+
+def split_parameters(parameters, tiles, target_points):
+    '''
+    Split an XY query into queries of contiguous tiles of its time range
+    :param parameters: Query object with a requested time range
+    :param tiles: Number of tiles, or None to choose it from target_points
+    :param target_points: Target number of values per tile response
+    :returns: List of the query objects of the non-empty tiles
+    '''
+    query = parameters[PARAMETERS_KEY]
+    time_range = query[REQUESTED_TIME_RANGE_KEY]
+    start, end, nb_times = (time_range[key] for key in TIME_RANGE_KEYS)
+    if tiles is None:
+        tiles = tile_count(nb_times, len(query.get(REQUESTED_ITEM_KEY, [])), target_points)
+
+    tile_parameters = []
+    for tile_range in split_time_range(start, end, nb_times, tiles):
+        tile = copy.deepcopy(parameters)
+        tile[PARAMETERS_KEY][REQUESTED_TIME_RANGE_KEY] = dict(zip(TIME_RANGE_KEYS, tile_range))
+        tile_parameters.append(tile)
+    return tile_parameters
+
+
+def stitch_xy_responses(responses):
+    '''
+    Stitch the XY responses of consecutive tiles into one response
+    :param responses: GenericResponse of ModelType.XY, in time order
+    :returns: New GenericResponse whose series concatenate the tile values, and
+              whose status is the worst of the tiles
+    '''
+    status = min((response.status for response in responses), key=STATUS_PRIORITY.index)
+    first = next(response for response in responses if response.status == status)
+    stitched = GenericResponse({RESPONSE_STATUS_KEY: status.value,
+                                STATUS_MESSAGE_KEY: first.status_text}, ModelType.XY)
+    stitched.output = first.output
+
+    models = [response.model for response in responses if response.model is not None]
+    if not models:
+        return stitched
+
+    series_by_id = {}
+    parts = {}
+    stitched.model = XYModel({TITLE_KEY: getattr(models[0], 'title', None)})
+    for model in models:
+        for series in model.series:
+            target = series_by_id.get(series.series_id)
+            if target is None:
+                target = XYSeries({SERIES_NAME_KEY: series.series_name,
+                                   SERIES_ID_KEY: series.series_id})
+                if hasattr(series, 'x_axis'):
+                    target.x_axis = series.x_axis
+                if hasattr(series, 'y_axis'):
+                    target.y_axis = series.y_axis
+                series_by_id[series.series_id] = target
+                parts[series.series_id] = ([], [])
+                stitched.model.series.append(target)
+            parts[series.series_id][0].append(series.x_values)
+            parts[series.series_id][1].append(series.y_values)
+
+    for series_id, (x_parts, y_parts) in parts.items():
+        target = series_by_id[series_id]
+        target.x_values = _concatenate(x_parts)
+        target.y_values = _concatenate(y_parts)
+    return stitched
+
+
+def _concatenate(parts):
+    if all(isinstance(part, list) for part in parts):
+        return [value for part in parts for value in part]
+    # Columnar series, only reached when NumPy is already in use
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    return np.concatenate(parts)